@@ -1,17 +1,38 @@
+from django.conf import settings
 from django.contrib import admin
 
 from .models import Challenge, ChallengeMember, ChallengeWinner,\
-                    ChallengeAnswer, ChallengeBalance
+                    ChallengeAnswer, ChallengeBalance, CoinTransaction,\
+                    VideoBlob
+from .services.challenge_balance_services import ChallengeBalanceService
+from .services.settlement_services import SettlementService
 
 @admin.register(Challenge)
 class ChallengeAdmin(admin.ModelAdmin):
     """Setting for challenge admin page."""
 
-    list_display = ('name', 'creator', 'finish_datetime', 'bet')
-    readonly_fields = ('start_datetime', 'id')
+    list_display = ('name', 'creator', 'finish_datetime', 'bet',
+                    'are_winners_finalized', 'is_settled')
+    readonly_fields = ('start_datetime', 'id', 'members_amount',
+                       'are_winners_finalized', 'is_settled')
     prepopulated_fields = {'slug': ('name',)}
-    list_filter = ('creator', 'bet',)
+    list_filter = ('creator', 'bet', 'are_winners_finalized', 'is_settled',)
     search_fields = ('name', 'creator__username',)
+    actions = ('finalize_winners', 'settle_challenges',)
+
+    @admin.action(description='Mark that all winners of selected challenges '
+                              'are chosen')
+    def finalize_winners(self, request, queryset):
+        finalized_amount = SettlementService.finalize_winners(
+            queryset.values_list('id', flat=True))
+        self.message_user(
+            request, f'Winners of {finalized_amount} challenges were finalized.')
+
+    @admin.action(description='Pay balances of selected challenges to winners')
+    def settle_challenges(self, request, queryset):
+        settled_amount = SettlementService.settle_challenges(
+            queryset.values_list('id', flat=True))
+        self.message_user(request, f'{settled_amount} challenges were settled.')
 
 
 @admin.register(ChallengeMember)
@@ -34,4 +55,38 @@ class ChallengeAnserAdmin(admin.ModelAdmin):
 
 @admin.register(ChallengeBalance)
 class ChallengeBalanceAdmin(admin.ModelAdmin):
-    list_display = ('challenge', 'coins_amount',)
+    list_display = ('challenge', 'coins_amount', 'shards_amount',)
+    readonly_fields = ('shards_amount',)
+    actions = ('shard_balance',)
+
+    @admin.action(description='Shard balance of selected challenges')
+    def shard_balance(self, request, queryset):
+        for balance in queryset.select_related('challenge'):
+            ChallengeBalanceService.shard_balance(
+                balance.challenge, settings.CHALLENGE_BALANCE_SHARDS_AMOUNT)
+
+
+@admin.register(CoinTransaction)
+class CoinTransactionAdmin(admin.ModelAdmin):
+    """Setting for coin transaction admin page. Ledger is read only."""
+    list_display = ('id', 'kind', 'user', 'challenge', 'user_delta',
+                    'challenge_delta', 'created_at',)
+    list_filter = ('kind',)
+    list_select_related = ('user', 'challenge',)
+    search_fields = ('user__username', 'challenge__name',)
+
+    def has_add_permission(self, request) -> bool:
+        return False
+
+    def has_change_permission(self, request, obj=None) -> bool:
+        return False
+
+    def has_delete_permission(self, request, obj=None) -> bool:
+        return False
+
+
+@admin.register(VideoBlob)
+class VideoBlobAdmin(admin.ModelAdmin):
+    """Setting for video blob admin page."""
+    list_display = ('sha256', 'size', 'references_amount', 'updated_at',)
+    readonly_fields = ('sha256', 'size', 'references_amount', 'updated_at',)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from challenges.services.coin_ledger_services import CoinLedgerService
+
+
+class Command(BaseCommand):
+    """Compares balances of users and challenges with coin ledger."""
+
+    help = 'Prints balances which differ from coins amount in ledger.'
+
+    def handle(self, *args, **options) -> None:
+        for balance in CoinLedgerService.get_users_balances_mismatches():
+            self.stdout.write(
+                f'User {balance.user_id}: balance {balance.coins_amount}, '
+                f'ledger {balance.ledger_coins_amount}.')
+        for balance in CoinLedgerService.get_challenges_balances_mismatches():
+            self.stdout.write(
+                f'Challenge {balance.challenge_id}: balance '
+                f'{balance.total_coins_amount}, '
+                f'ledger {balance.ledger_coins_amount}.')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from challenges.services.challenge_member_services import ChallengeMemberService
+
+
+class Command(BaseCommand):
+    """Repairs stored amount of members of challenges."""
+
+    help = 'Recounts members of challenges and repairs stored members amount.'
+
+    def handle(self, *args, **options) -> None:
+        repaired_amount = ChallengeMemberService.recount_challenges_members()
+        self.stdout.write(
+            f'Members amount was repaired for {repaired_amount} challenges.')
@@ -0,0 +1,17 @@
+# Generated by Django 4.0 on 2026-10-18 07:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0013_alter_challengeanswer_video_answer'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(fields=['finish_datetime', 'id'], name='challenge_finish_id_idx'),
+        ),
+    ]
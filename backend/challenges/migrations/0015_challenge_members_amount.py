@@ -0,0 +1,33 @@
+# Generated by Django 4.0 on 2026-10-18 07:34
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_challenges_members(apps, schema_editor):
+    """Fills members amount of existing challenges."""
+    Challenge = apps.get_model('challenges', 'Challenge')
+    ChallengeMember = apps.get_model('challenges', 'ChallengeMember')
+    members_amount = ChallengeMember.objects.filter(
+        challenge=OuterRef('pk')).values('challenge').annotate(
+        amount=Count('id')).values('amount')
+    Challenge.objects.update(
+        members_amount=Coalesce(Subquery(members_amount), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0014_challenge_finish_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='members_amount',
+            field=models.PositiveIntegerField(default=0, verbose_name='amount of challenge members'),
+        ),
+        migrations.RunPython(count_challenges_members,
+                             migrations.RunPython.noop),
+    ]
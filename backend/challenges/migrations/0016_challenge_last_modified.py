@@ -0,0 +1,18 @@
+# Generated by Django 4.0 on 2026-10-18 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0015_challenge_members_amount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='last_modified',
+            field=models.DateTimeField(auto_now=True, verbose_name='date when challenge, its members, answers or balance changed'),
+        ),
+    ]
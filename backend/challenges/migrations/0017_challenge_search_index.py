@@ -0,0 +1,72 @@
+from django.db import migrations
+
+
+POSTGRESQL_FORWARD_SQL = [
+    """
+    ALTER TABLE challenges_challenge ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', name), 'A') ||
+        setweight(to_tsvector('simple', goal), 'B') ||
+        setweight(to_tsvector('simple', description), 'C') ||
+        setweight(to_tsvector('simple', requirements), 'D')
+    ) STORED
+    """,
+    """
+    CREATE INDEX challenge_search_vector_idx
+    ON challenges_challenge USING GIN (search_vector)
+    """,
+]
+
+POSTGRESQL_BACKWARD_SQL = [
+    'DROP INDEX challenge_search_vector_idx',
+    'ALTER TABLE challenges_challenge DROP COLUMN search_vector',
+]
+
+SQLITE_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE challenges_challenge_fts
+    USING fts5(name, goal, description, requirements)
+    """,
+    """
+    INSERT INTO challenges_challenge_fts(rowid, name, goal, description,
+                                         requirements)
+    SELECT id, name, goal, description, requirements FROM challenges_challenge
+    """,
+]
+
+SQLITE_BACKWARD_SQL = [
+    'DROP TABLE challenges_challenge_fts',
+]
+
+
+def execute_sql_for_vendor(postgresql_sql: list, sqlite_sql: list):
+    """Returns function that executes sql of current database vendor."""
+    def execute_sql(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            statements = postgresql_sql
+        elif vendor == 'sqlite':
+            statements = sqlite_sql
+        else:
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return execute_sql
+
+
+class Migration(migrations.Migration):
+    """
+    Creates full-text search index of challenges: generated tsvector
+    column with GIN index for postgresql and FTS5 table for sqlite.
+    """
+
+    dependencies = [
+        ('challenges', '0016_challenge_last_modified'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            execute_sql_for_vendor(POSTGRESQL_FORWARD_SQL, SQLITE_FORWARD_SQL),
+            execute_sql_for_vendor(POSTGRESQL_BACKWARD_SQL, SQLITE_BACKWARD_SQL),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.0 on 2026-10-18 07:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0017_challenge_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['bet', 'id'], name='challenge_active_bet_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['members_amount', 'id'], name='challenge_active_members_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['creator', 'finish_datetime', 'id'], name='challenge_active_creator_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challengebalance',
+            index=models.Index(fields=['coins_amount', 'challenge'], name='challenge_balance_coins_idx'),
+        ),
+    ]
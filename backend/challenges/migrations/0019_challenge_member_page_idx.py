@@ -0,0 +1,17 @@
+# Generated by Django 4.0 on 2026-10-18 07:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0018_challenges_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='challengemember',
+            index=models.Index(fields=['challenge', 'id'], name='challenge_member_page_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.0 on 2026-10-18 07:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0019_challenge_member_page_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='challengeanswer',
+            index=models.Index(fields=['challenge', 'id'], name='challenge_answer_page_idx'),
+        ),
+    ]
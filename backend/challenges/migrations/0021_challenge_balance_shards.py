@@ -0,0 +1,32 @@
+# Generated by Django 4.0 on 2026-10-18 07:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0020_challenge_answer_page_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challengebalance',
+            name='shards_amount',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='amount of balance shards (0 if not sharded)'),
+        ),
+        migrations.CreateModel(
+            name='ChallengeBalanceShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard_number', models.PositiveSmallIntegerField(verbose_name='shard number')),
+                ('coins_amount', models.PositiveIntegerField(default=0, verbose_name='coins amount')),
+                ('challenge', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_shards', to='challenges.challenge')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='challengebalanceshard',
+            constraint=models.UniqueConstraint(fields=('challenge', 'shard_number'), name='challenge_balance_shard_unique'),
+        ),
+    ]
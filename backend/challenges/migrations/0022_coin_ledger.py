@@ -0,0 +1,58 @@
+# Generated by Django 4.0 on 2026-10-18 07:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_userbalance_user'),
+        ('challenges', '0021_challenge_balance_shards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoinTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('create', 'create'), ('accept', 'accept'), ('payout', 'payout'), ('fee', 'fee')], max_length=10, verbose_name='kind of transaction')),
+                ('user_delta', models.IntegerField(default=0, verbose_name='change of user balance')),
+                ('challenge_delta', models.IntegerField(default=0, verbose_name='change of challenge balance')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='date of transaction')),
+                ('challenge', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='challenges.challenge')),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='users.user')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CoinBalanceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('coins_amount', models.IntegerField(verbose_name='coins amount')),
+                ('last_transaction_id', models.BigIntegerField(verbose_name='id of last counted transaction')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='date of snapshot')),
+                ('challenge', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='challenges.challenge')),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='users.user')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='cointransaction',
+            index=models.Index(fields=['user', 'id'], name='coin_transaction_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cointransaction',
+            index=models.Index(fields=['challenge', 'id'], name='coin_transaction_challenge_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cointransaction',
+            index=models.Index(fields=['kind', 'created_at'], name='coin_transaction_kind_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coinbalancesnapshot',
+            index=models.Index(fields=['user', '-last_transaction_id'], name='coin_snapshot_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coinbalancesnapshot',
+            index=models.Index(fields=['challenge', '-last_transaction_id'], name='coin_snapshot_challenge_idx'),
+        ),
+    ]
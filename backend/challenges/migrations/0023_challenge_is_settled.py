@@ -0,0 +1,33 @@
+# Generated by Django 4.0 on 2026-10-18 07:52
+
+from django.db import migrations, models
+
+
+def mark_finished_challenges_settled(apps, schema_editor):
+    """
+    Finished challenges were settled by hand before,
+    so they mustn't be paid to winners again.
+    """
+    Challenge = apps.get_model('challenges', 'Challenge')
+    Challenge.objects.filter(is_active=False).update(is_settled=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0022_coin_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='is_settled',
+            field=models.BooleanField(default=False, verbose_name='were coins of challenge paid to winners'),
+        ),
+        migrations.RunPython(mark_finished_challenges_settled,
+                             migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(condition=models.Q(('is_active', False), ('is_settled', False)), fields=['id'], name='challenge_unsettled_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.0 on 2026-10-18 07:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0023_challenge_is_settled'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='challenge',
+            name='challenge_finish_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['finish_datetime', 'id'], name='challenge_active_finish_idx'),
+        ),
+    ]
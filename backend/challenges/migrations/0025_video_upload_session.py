@@ -0,0 +1,29 @@
+# Generated by Django 4.0 on 2026-10-18 07:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_userbalance_user'),
+        ('challenges', '0024_challenge_active_finish_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoUploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('target', models.CharField(choices=[('video_example', 'video_example'), ('video_answer', 'video_answer')], max_length=20, verbose_name='field which video is uploaded to')),
+                ('size', models.PositiveBigIntegerField(verbose_name='size of video')),
+                ('offset', models.PositiveBigIntegerField(default=0, verbose_name='amount of received bytes')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='date of upload start')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='date when last chunk was received')),
+                ('challenge', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='challenges.challenge', verbose_name='challenge')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.user', verbose_name='uploading user')),
+            ],
+        ),
+    ]
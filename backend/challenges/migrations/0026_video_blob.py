@@ -0,0 +1,27 @@
+# Generated by Django 4.0 on 2026-10-18 08:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0025_video_upload_session'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='sha256 of video')),
+                ('size', models.PositiveBigIntegerField(verbose_name='size of video')),
+                ('references_amount', models.PositiveIntegerField(default=0, verbose_name='amount of challenges and answers with video')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='date when references amount changed')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='videoblob',
+            index=models.Index(condition=models.Q(('references_amount', 0)), fields=['updated_at'], name='video_blob_unreferenced_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.0 on 2026-10-18 08:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0026_video_blob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(fields=['video_example'], name='challenge_video_example_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challengeanswer',
+            index=models.Index(fields=['video_answer'], name='challenge_answer_video_idx'),
+        ),
+    ]
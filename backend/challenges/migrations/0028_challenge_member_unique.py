@@ -0,0 +1,46 @@
+# Generated by Django 4.0 on 2026-10-18 08:29
+
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def delete_duplicate_members(apps, schema_editor):
+    """
+    Deletes repeated acceptances of the same challenge by the same user
+    (the first one is kept) and recounts members of these challenges.
+    """
+    Challenge = apps.get_model('challenges', 'Challenge')
+    ChallengeMember = apps.get_model('challenges', 'ChallengeMember')
+    duplicates = ChallengeMember.objects.values('user', 'challenge')\
+        .annotate(first_id=Min('id'), amount=Count('id'))\
+        .filter(amount__gt=1)
+    challenges_ids = set()
+    for duplicate in duplicates:
+        ChallengeMember.objects.filter(
+            user=duplicate['user'], challenge=duplicate['challenge'],
+            id__gt=duplicate['first_id']).delete()
+        challenges_ids.add(duplicate['challenge'])
+    if not challenges_ids:
+        return
+    members_amount = ChallengeMember.objects.filter(
+        challenge=OuterRef('pk')).values('challenge').annotate(
+        amount=Count('id')).values('amount')
+    Challenge.objects.filter(id__in=challenges_ids).update(
+        members_amount=Coalesce(Subquery(members_amount), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0027_media_files_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_members,
+                             migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='challengemember',
+            constraint=models.UniqueConstraint(fields=('user', 'challenge'), name='challenge_member_unique'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.0 on 2026-10-18 08:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0028_challenge_member_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challengebalanceshard',
+            name='members_amount',
+            field=models.PositiveIntegerField(default=0, verbose_name='amount of members'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.0 on 2026-10-18 08:35
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def record_opening_balances(apps, schema_editor):
+    """
+    Records opening transactions for coins which got into balances
+    beside ledger, so balances and ledger are equal after migration.
+    """
+    CoinTransaction = apps.get_model('challenges', 'CoinTransaction')
+    ChallengeBalance = apps.get_model('challenges', 'ChallengeBalance')
+    ChallengeBalanceShard = apps.get_model('challenges',
+                                           'ChallengeBalanceShard')
+    UserBalance = apps.get_model('users', 'UserBalance')
+
+    def get_deltas(account_id_field, delta_field):
+        return dict(CoinTransaction.objects.filter(
+            **{f'{account_id_field}__isnull': False})
+            .values(account_id_field).annotate(delta=Sum(delta_field))
+            .values_list(account_id_field, 'delta'))
+
+    transactions = []
+    users_deltas = get_deltas('user_id', 'user_delta')
+    for user_id, coins_amount in UserBalance.objects.values_list(
+            'user_id', 'coins_amount'):
+        delta = coins_amount - users_deltas.get(user_id, 0)
+        if delta:
+            transactions.append(CoinTransaction(
+                kind='opening', user_id=user_id, user_delta=delta))
+
+    challenges_deltas = get_deltas('challenge_id', 'challenge_delta')
+    shards_coins_amounts = dict(ChallengeBalanceShard.objects
+                                .values('challenge_id')
+                                .annotate(coins_amount=Sum('coins_amount'))
+                                .values_list('challenge_id', 'coins_amount'))
+    for challenge_id, coins_amount in ChallengeBalance.objects.values_list(
+            'challenge_id', 'coins_amount'):
+        delta = (coins_amount + shards_coins_amounts.get(challenge_id, 0) -
+                 challenges_deltas.get(challenge_id, 0))
+        if delta:
+            transactions.append(CoinTransaction(
+                kind='opening', challenge_id=challenge_id,
+                challenge_delta=delta))
+    CoinTransaction.objects.bulk_create(transactions, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_userbalance_user'),
+        ('challenges', '0029_challenge_balance_shard_members_amount'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cointransaction',
+            name='kind',
+            field=models.CharField(choices=[('create', 'create'), ('accept', 'accept'), ('payout', 'payout'), ('fee', 'fee'), ('grant', 'grant'), ('opening', 'opening')], max_length=10, verbose_name='kind of transaction'),
+        ),
+        migrations.RunPython(record_opening_balances,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.0 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+def mark_settled_challenges_finalized(apps, schema_editor):
+    """
+    Winners of settled challenges can't be changed anymore. Winners
+    of other challenges must be finalized by admin.
+    """
+    Challenge = apps.get_model('challenges', 'Challenge')
+    Challenge.objects.filter(is_settled=True).update(
+        are_winners_finalized=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0030_coin_ledger_opening'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='are_winners_finalized',
+            field=models.BooleanField(default=False, verbose_name='were all winners of challenge chosen'),
+        ),
+        migrations.RunPython(mark_settled_challenges_finalized,
+                             migrations.RunPython.noop),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.conf import settings
 from django.db import models
 from django.core.validators import FileExtensionValidator
@@ -5,6 +7,21 @@ from django.core.validators import FileExtensionValidator
 from users.models import User
 
 
+VIDEO_UPLOAD_TARGETS = (
+    ('video_example', 'video_example'),
+    ('video_answer', 'video_answer'),
+)
+
+COIN_TRANSACTION_KINDS = (
+    ('create', 'create'),
+    ('accept', 'accept'),
+    ('payout', 'payout'),
+    ('fee', 'fee'),
+    ('grant', 'grant'),
+    ('opening', 'opening'),
+)
+
+
 class Challenge(models.Model):
     """Challenge model"""
 
@@ -41,6 +58,38 @@ class Challenge(models.Model):
     is_active = models.BooleanField(verbose_name='is challenge active',
                                     default=True)
 
+    members_amount = models.PositiveIntegerField(
+        default=0, verbose_name='amount of challenge members')
+
+    last_modified = models.DateTimeField(
+        auto_now=True,
+        verbose_name='date when challenge, its members, answers or balance changed')
+
+    is_settled = models.BooleanField(
+        default=False, verbose_name='were coins of challenge paid to winners')
+
+    are_winners_finalized = models.BooleanField(
+        default=False, verbose_name='were all winners of challenge chosen')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['finish_datetime', 'id'],
+                         name='challenge_active_finish_idx',
+                         condition=models.Q(is_active=True)),
+            models.Index(fields=['bet', 'id'], name='challenge_active_bet_idx',
+                         condition=models.Q(is_active=True)),
+            models.Index(fields=['members_amount', 'id'],
+                         name='challenge_active_members_idx',
+                         condition=models.Q(is_active=True)),
+            models.Index(fields=['creator', 'finish_datetime', 'id'],
+                         name='challenge_active_creator_idx',
+                         condition=models.Q(is_active=True)),
+            models.Index(fields=['id'], name='challenge_unsettled_idx',
+                         condition=models.Q(is_active=False, is_settled=False)),
+            models.Index(fields=['video_example'],
+                         name='challenge_video_example_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -53,6 +102,16 @@ class ChallengeMember(models.Model):
     challenge = models.ForeignKey(Challenge, on_delete=models.CASCADE,
                                   verbose_name='challenge')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['challenge', 'id'],
+                         name='challenge_member_page_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'challenge'],
+                                    name='challenge_member_unique'),
+        ]
+
     def __str__(self):
         return self.user.username
 
@@ -85,6 +144,14 @@ class ChallengeAnswer(models.Model):
     video_answer = models.FileField(upload_to=settings.CHALLENGE_ANSWERS_DIR,
                                     verbose_name='video answer on challenge',)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['challenge', 'id'],
+                         name='challenge_answer_page_idx'),
+            models.Index(fields=['video_answer'],
+                         name='challenge_answer_video_idx'),
+        ]
+
     def __str__(self):
         return (f'answer from "{self.challenge_member.user.username}" ' +
             f'for challenge "{self.challenge.name}"')
@@ -96,12 +163,139 @@ class ChallengeBalance(models.Model):
     challenge = models.OneToOneField(Challenge, on_delete=models.CASCADE,
                                      related_name='balance')
     coins_amount = models.PositiveIntegerField(verbose_name='coins amount')
+    shards_amount = models.PositiveSmallIntegerField(
+        default=0, verbose_name='amount of balance shards (0 if not sharded)')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['coins_amount', 'challenge'],
+                         name='challenge_balance_coins_idx'),
+        ]
 
 
+class ChallengeBalanceShard(models.Model):
+    """
+    Part of challenge balance. Bets and members of sharded challenge
+    are added to random shard and are folded into ChallengeBalance
+    and Challenge periodically.
+    """
 
-
-
-
-
-
+    challenge = models.ForeignKey(Challenge, on_delete=models.CASCADE,
+                                  related_name='balance_shards')
+    shard_number = models.PositiveSmallIntegerField(
+        verbose_name='shard number')
+    coins_amount = models.PositiveIntegerField(verbose_name='coins amount',
+                                               default=0)
+    members_amount = models.PositiveIntegerField(
+        verbose_name='amount of members', default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['challenge', 'shard_number'],
+                                    name='challenge_balance_shard_unique'),
+        ]
+
+
+class CoinTransaction(models.Model):
+    """
+    Append-only record of coins moved between user and challenge
+    balances. Records are kept when user or challenge is deleted.
+    """
+
+    kind = models.CharField(max_length=10, choices=COIN_TRANSACTION_KINDS,
+                            verbose_name='kind of transaction')
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING,
+                             db_constraint=False, null=True, blank=True,
+                             related_name='+')
+    challenge = models.ForeignKey(Challenge, on_delete=models.DO_NOTHING,
+                                  db_constraint=False, null=True, blank=True,
+                                  related_name='+')
+    user_delta = models.IntegerField(
+        default=0, verbose_name='change of user balance')
+    challenge_delta = models.IntegerField(
+        default=0, verbose_name='change of challenge balance')
+    created_at = models.DateTimeField(auto_now_add=True,
+                                      verbose_name='date of transaction')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'id'],
+                         name='coin_transaction_user_idx'),
+            models.Index(fields=['challenge', 'id'],
+                         name='coin_transaction_challenge_idx'),
+            models.Index(fields=['kind', 'created_at'],
+                         name='coin_transaction_kind_idx'),
+        ]
+
+
+class CoinBalanceSnapshot(models.Model):
+    """
+    Balance of user or challenge summed from coin transactions
+    up to last_transaction_id. Current balance is the latest
+    snapshot plus transactions after it.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING,
+                             db_constraint=False, null=True, blank=True,
+                             related_name='+')
+    challenge = models.ForeignKey(Challenge, on_delete=models.DO_NOTHING,
+                                  db_constraint=False, null=True, blank=True,
+                                  related_name='+')
+    coins_amount = models.IntegerField(verbose_name='coins amount')
+    last_transaction_id = models.BigIntegerField(
+        verbose_name='id of last counted transaction')
+    created_at = models.DateTimeField(auto_now_add=True,
+                                      verbose_name='date of snapshot')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-last_transaction_id'],
+                         name='coin_snapshot_user_idx'),
+            models.Index(fields=['challenge', '-last_transaction_id'],
+                         name='coin_snapshot_challenge_idx'),
+        ]
+
+
+class VideoUploadSession(models.Model):
+    """
+    Resumable upload of video by chunks. Chunks are written to staging
+    file, finished upload is attached to challenge or challenge answer.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4,
+                          editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE,
+                             verbose_name='uploading user')
+    challenge = models.ForeignKey(Challenge, on_delete=models.CASCADE,
+                                  verbose_name='challenge')
+    target = models.CharField(max_length=20, choices=VIDEO_UPLOAD_TARGETS,
+                              verbose_name='field which video is uploaded to')
+    size = models.PositiveBigIntegerField(verbose_name='size of video')
+    offset = models.PositiveBigIntegerField(
+        default=0, verbose_name='amount of received bytes')
+    created_at = models.DateTimeField(auto_now_add=True,
+                                      verbose_name='date of upload start')
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name='date when last chunk was received')
+
+
+class VideoBlob(models.Model):
+    """
+    Video file which is stored once for all challenges and answers
+    with the same content. File name is made from sha256 of content.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True,
+                              verbose_name='sha256 of video')
+    size = models.PositiveBigIntegerField(verbose_name='size of video')
+    references_amount = models.PositiveIntegerField(
+        default=0, verbose_name='amount of challenges and answers with video')
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name='date when references amount changed')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'],
+                         name='video_blob_unreferenced_idx',
+                         condition=models.Q(references_amount=0)),
+        ]
@@ -0,0 +1,41 @@
+from config.pagination import KeysetPagination
+
+
+class ChallengesFeedPagination(KeysetPagination):
+    """
+    Pagination for active challenges list. Ending soonest go first,
+    other orderings can be chosen by set_ordering.
+    """
+
+    ordering = ('finish_datetime', 'id')
+    orderings = {
+        'finish_datetime': ('finish_datetime', 'id'),
+        'bet': ('bet', 'id'),
+        '-bet': ('-bet', '-id'),
+        'bets_sum': ('bets_sum', 'id'),
+        '-bets_sum': ('-bets_sum', '-id'),
+        'members_amount': ('members_amount', 'id'),
+        '-members_amount': ('-members_amount', '-id'),
+    }
+
+    def set_ordering(self, ordering_name: str) -> None:
+        """Sets ordering by its name."""
+        self.ordering = self.orderings[ordering_name]
+
+
+class ChallengesSearchPagination(KeysetPagination):
+    """Pagination for challenges search results. Best matches go first."""
+
+    ordering = ('-rank', 'id')
+
+
+class ChallengeMembersPagination(KeysetPagination):
+    """Pagination for challenge members. Members are ordered by accepting."""
+
+    ordering = ('id',)
+
+
+class ChallengeAnswersPagination(KeysetPagination):
+    """Pagination for challenge answers. Answers are ordered by adding."""
+
+    ordering = ('id',)
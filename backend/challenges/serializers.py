@@ -6,7 +6,8 @@ from django.conf import settings
 
 from rest_framework import serializers
 
-from .models import ChallengeMember
+from .models import VIDEO_UPLOAD_TARGETS
+from .services.challenge_balance_services import ChallengeBalanceService
 
 
 class CreateChallengeSerializer(serializers.Serializer):
@@ -26,6 +27,39 @@ class CreateChallengeSerializer(serializers.Serializer):
         raise serializers.ValidationError('This is past datetime.')
 
 
+class GetChallengesListFilterSerializer(serializers.Serializer):
+    """Serializer for filters and ordering of active challenges list."""
+
+    ORDERINGS = ('finish_datetime', 'bet', '-bet', 'bets_sum', '-bets_sum',
+                 'members_amount', '-members_amount')
+
+    min_bet = serializers.IntegerField(min_value=0, required=False)
+    max_bet = serializers.IntegerField(min_value=0, required=False)
+    is_free = serializers.BooleanField(required=False)
+    creator = serializers.CharField(max_length=30, required=False)
+    finish_after = serializers.DateTimeField(required=False)
+    finish_before = serializers.DateTimeField(required=False)
+    ordering = serializers.ChoiceField(choices=ORDERINGS, required=False,
+                                       default='finish_datetime')
+
+    def validate(self, data: dict) -> dict:
+        """Checks that ranges of bet and finish datetime aren't empty."""
+        if 'min_bet' in data and 'max_bet' in data and \
+                data['min_bet'] > data['max_bet']:
+            raise serializers.ValidationError('min_bet is bigger than max_bet')
+        if 'finish_after' in data and 'finish_before' in data and \
+                data['finish_after'] > data['finish_before']:
+            raise serializers.ValidationError(
+                'finish_after is later than finish_before')
+        return data
+
+
+class SearchChallengesSerializer(serializers.Serializer):
+    """Serializer for query of challenges search."""
+
+    q = serializers.CharField(max_length=200)
+
+
 class BaseChallengeSerializer(serializers.Serializer):
     """Base serializer that contain main info about challenge."""
     name = serializers.CharField(max_length=200)
@@ -37,20 +71,28 @@ class BaseChallengeSerializer(serializers.Serializer):
         """Adds extra field"""
         representation = super().to_representation(instance)
         user = instance.creator
-        members_amount = ChallengeMember.objects.all()\
-            .filter(challenge=instance).count()
-        bets_sum = instance.balance.coins_amount
+        bets_sum = ChallengeBalanceService.get_coins_amount(instance)
 
         representation['challenge_id'] = instance.id
         representation['creator'] = user.username
-        representation['members_amount'] = members_amount
+        representation['members_amount'] = instance.members_amount
         representation['bets_sum'] = bets_sum
         return representation
 
 
-class GetChallengesListSerializer(BaseChallengeSerializer):
-    """Serializer for getting active challenges list."""
-    pass
+class GetChallengesListSerializer(serializers.Serializer):
+    """
+    Serializer for getting active challenges list. Reads only
+    annotations of ChallengeService.get_active_challenges queryset.
+    """
+    name = serializers.CharField(max_length=200)
+    goal = serializers.CharField(max_length=200)
+    bet = serializers.IntegerField(min_value=0)
+    finish_datetime = serializers.DateTimeField(format='%Y-%m-%d %H:%M:%S')
+    challenge_id = serializers.IntegerField(source='id')
+    creator = serializers.CharField(source='creator_username')
+    members_amount = serializers.IntegerField()
+    bets_sum = serializers.IntegerField()
 
 
 class GetDitailChallengeInfoSerializer(BaseChallengeSerializer):
@@ -70,24 +112,40 @@ class GetDitailChallengeInfoSerializer(BaseChallengeSerializer):
         return representation
 
 
+class GetChallengeMembersParamsSerializer(serializers.Serializer):
+    """Serializer for query params of getting challenge members."""
+
+    with_count = serializers.BooleanField(required=False, default=False)
+    export = serializers.BooleanField(required=False, default=False)
+
+
+class GetChallengeAnswersParamsSerializer(serializers.Serializer):
+    """Serializer for query params of getting challenge answers."""
+
+    export = serializers.BooleanField(required=False, default=False)
+
+
 class GetChallengeMembersSerializer(serializers.Serializer):
-    """Serializer for getting challenge members."""
+    """
+    Serializer for getting challenge members. Reads rows
+    of ChallengeMemberService.get_challenge_members.
+    """
 
-    def to_representation(self, instance) -> OrderedDict:
-        representation = super().to_representation(instance)
-        representation['user_id'] = instance.user.id
-        representation['username'] = instance.user.username
-        return representation
+    user_id = serializers.IntegerField()
+    username = serializers.CharField()
 
 
 class GetChallengeAnswersSerializer(serializers.Serializer):
-    """Serializer for getting challenge answers."""
+    """
+    Serializer for getting challenge answers. Reads rows
+    of ChallengeAnswerService.get_challenge_answers.
+    """
+
+    challenge_member = serializers.CharField(source='username')
 
     def to_representation(self, instance) -> OrderedDict:
         representation = super().to_representation(instance)
-        representation['challenge_member'] = instance.challenge_member.user.username
-
-        file_name = instance.video_answer.name
+        file_name = instance.video_answer
         if file_name:
             video_answer_path = settings.MEDIA_URL + file_name
         else:
@@ -96,8 +154,9 @@ class GetChallengeAnswersSerializer(serializers.Serializer):
         return representation
 
 
+class CreateVideoUploadSerializer(serializers.Serializer):
+    """Serializer for starting upload of video by chunks."""
 
-
-
-
-
+    target = serializers.ChoiceField(choices=VIDEO_UPLOAD_TARGETS)
+    size = serializers.IntegerField(min_value=1,
+                                    max_value=settings.VIDEO_UPLOAD_MAX_SIZE)
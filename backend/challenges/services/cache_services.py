@@ -0,0 +1,51 @@
+import time
+
+from typing import Optional
+
+from django.core.cache import cache
+from django.utils.http import urlencode
+
+
+class ChallengesListCacheService:
+    """
+    Stores rendered pages of active challenges list. Pages are stored
+    under current version of list, so bumping version drops all of them.
+    """
+
+    version_key = 'challenges_list_version'
+    page_key_prefix = 'challenges_list_page'
+    page_timeout = 60 * 5
+
+    @classmethod
+    def get_version(cls) -> int:
+        """Returns current version of challenges list."""
+        version = cache.get(cls.version_key)
+        if version is None:
+            cache.add(cls.version_key, int(time.time()), timeout=None)
+            version = cache.get(cls.version_key)
+        return version
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """Makes all stored pages of challenges list outdated."""
+        try:
+            cache.incr(cls.version_key)
+        except ValueError:
+            cache.add(cls.version_key, int(time.time()), timeout=None)
+
+    @classmethod
+    def get_page_key(cls, request) -> str:
+        """Returns key of page that was requested."""
+        query_string = urlencode(sorted(request.GET.lists()), doseq=True)
+        return (f'{cls.page_key_prefix}:{cls.get_version()}:' +
+                f'{request.get_host()}:{query_string}')
+
+    @classmethod
+    def get_page(cls, page_key: str) -> Optional[bytes]:
+        """Returns rendered page or None if it wasn't stored."""
+        return cache.get(page_key)
+
+    @classmethod
+    def set_page(cls, page_key: str, content: bytes) -> None:
+        """Stores rendered page."""
+        cache.set(page_key, content, timeout=cls.page_timeout)
@@ -1,13 +1,13 @@
-import os
-
 from typing import Optional
 
-from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.db.models.query import QuerySet
 
 from challenges.models import Challenge, ChallengeMember, ChallengeAnswer
 
-from .services import delete_existing_file
+from .video_storage_services import VideoStorageService
+from .challenge_services import ChallengeService
 
 
 class ChallengeAnswerService:
@@ -20,24 +20,34 @@ class ChallengeAnswerService:
         return ChallengeAnswer.objects.get_or_create(
             challenge_member=challenge_member, challenge=challenge)[0]
 
+    @classmethod
+    def get_challenge_answers(cls, challenge: Challenge,
+                              challenge_member: Optional[ChallengeMember] = None
+                              ) -> QuerySet:
+        """
+        Returns rows with id, username of member and video answer
+        of challenge answers selected by one join. If member
+        is given returns only answers of this member.
+        """
+        queryset = ChallengeAnswer.objects.filter(challenge=challenge)
+        if challenge_member is not None:
+            queryset = queryset.filter(challenge_member=challenge_member)
+        return queryset.annotate(
+            username=F('challenge_member__user__username'))\
+            .values_list('id', 'username', 'video_answer', named=True)
+
     @classmethod
     def update_video_answer(cls, member: ChallengeMember,
                             challenge_answer: ChallengeAnswer,
                             video_answer_file: '') -> None:
-        """Updates video answer for challenge."""
-        directory = settings.CHALLENGE_ANSWERS_DIR
-        file_name = f'{member.user.id}_{challenge_answer.challenge.id}.mp4'
-        if challenge_answer.video_answer:
-            file_path = os.path.join(settings.MEDIA_ROOT,
-                                     f'{directory}/{file_name}')
-            delete_existing_file(file_path)
-
-        challenge_answer.video_answer = video_answer_file
-        challenge_answer.video_answer.name = file_name
-        challenge_answer.save()
-
-
-
-
-
-
+        """
+        Updates video answer for challenge. Video is stored once
+        by its content, previous video answer is released.
+        """
+        previous_file_name = challenge_answer.video_answer.name
+        with transaction.atomic():
+            challenge_answer.video_answer = VideoStorageService.store_video(
+                video_answer_file)
+            challenge_answer.save(update_fields=['video_answer'])
+            VideoStorageService.release_video(previous_file_name)
+        ChallengeService.mark_challenge_changed(challenge_answer.challenge)
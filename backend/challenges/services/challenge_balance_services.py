@@ -0,0 +1,133 @@
+import random
+
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from challenges.models import Challenge, ChallengeBalance,\
+                              ChallengeBalanceShard
+
+
+class ChallengeBalanceService:
+    """
+    Class which contain logic of challenge balance. Balance of
+    challenge with many members can be sharded: bets are added to
+    random shard, so concurrent accepts don't wait for lock of one row.
+    Members of such challenge are counted in shards too, so accepting
+    doesn't update challenge row; members amount and last_modified of
+    challenge are updated when shards are folded (every minute).
+    """
+
+    @staticmethod
+    def shard_balance(challenge: Challenge, shards_amount: int) -> None:
+        """Splits balance of challenge into given amount of shards."""
+        with transaction.atomic():
+            # removed shards are locked before folding, so bets
+            # can't be added to them until they are deleted.
+            list(ChallengeBalanceShard.objects.select_for_update().filter(
+                challenge=challenge, shard_number__gte=shards_amount)
+                .values_list('id', flat=True))
+            ChallengeBalanceService.fold_shards(challenge.id)
+            ChallengeBalanceShard.objects.filter(
+                challenge=challenge, shard_number__gte=shards_amount).delete()
+            shards = [
+                ChallengeBalanceShard(challenge=challenge, shard_number=number)
+                for number in range(shards_amount)
+            ]
+            ChallengeBalanceShard.objects.bulk_create(shards,
+                                                      ignore_conflicts=True)
+            ChallengeBalance.objects.filter(challenge=challenge).update(
+                shards_amount=shards_amount)
+
+    @staticmethod
+    def add_to_shard(challenge: Challenge, coins_amount: int = 0,
+                     members_amount: int = 0) -> bool:
+        """
+        Adds coins and members to random shard of challenge balance.
+        Returns False if balance isn't sharded or shard was deleted
+        by resharding, then they must be added to challenge itself.
+        """
+        shards_amount = ChallengeBalance.objects.filter(
+            challenge=challenge).values_list('shards_amount', flat=True)\
+            .first()
+        if not shards_amount:
+            return False
+        updated_rows = ChallengeBalanceShard.objects.filter(
+            challenge=challenge,
+            shard_number=random.randrange(shards_amount)).update(
+            coins_amount=F('coins_amount') + coins_amount,
+            members_amount=F('members_amount') + members_amount)
+        return updated_rows == 1
+
+    @staticmethod
+    def add_coins(challenge: Challenge, coins_amount: int) -> bool:
+        """
+        Adds coins to balance of challenge, or to random shard of
+        balance if balance is sharded. Returns True if coins were
+        added to shard and will be folded into balance later.
+        """
+        updated_rows = ChallengeBalance.objects.filter(
+            challenge=challenge, shards_amount=0).update(
+            coins_amount=F('coins_amount') + coins_amount)
+        if updated_rows:
+            return False
+        if ChallengeBalanceService.add_to_shard(challenge, coins_amount):
+            return True
+
+        ChallengeBalance.objects.filter(challenge=challenge).update(
+            coins_amount=F('coins_amount') + coins_amount)
+        return False
+
+    @staticmethod
+    def get_coins_amount(challenge: Challenge) -> int:
+        """Returns exact coins amount of challenge balance with its shards."""
+        balance = challenge.balance
+        if not balance.shards_amount:
+            return balance.coins_amount
+        shards_coins_amount = ChallengeBalanceShard.objects.filter(
+            challenge=challenge).aggregate(
+            coins_amount=Sum('coins_amount'))['coins_amount']
+        return balance.coins_amount + (shards_coins_amount or 0)
+
+    @staticmethod
+    def fold_shards(challenge_id: int) -> bool:
+        """
+        Moves coins and members from shards to balance and challenge,
+        challenge is marked as changed. Returns False if shards were empty.
+        """
+        with transaction.atomic():
+            shards = list(ChallengeBalanceShard.objects.select_for_update()
+                          .filter(challenge_id=challenge_id)
+                          .filter(Q(coins_amount__gt=0) |
+                                  Q(members_amount__gt=0))
+                          .values_list('id', 'coins_amount',
+                                       'members_amount'))
+            if not shards:
+                return False
+
+            coins_amount = sum(shard[1] for shard in shards)
+            members_amount = sum(shard[2] for shard in shards)
+            ChallengeBalanceShard.objects.filter(
+                id__in=[shard[0] for shard in shards]).update(
+                coins_amount=0, members_amount=0)
+            ChallengeBalance.objects.filter(challenge_id=challenge_id).update(
+                coins_amount=F('coins_amount') + coins_amount)
+            Challenge.objects.filter(id=challenge_id).update(
+                members_amount=F('members_amount') + members_amount,
+                last_modified=timezone.now())
+        return True
+
+    @staticmethod
+    def fold_all_shards() -> int:
+        """
+        Folds shards of all sharded challenges.
+        Returns amount of challenges which were changed.
+        """
+        challenges_ids = ChallengeBalanceShard.objects.filter(
+            Q(coins_amount__gt=0) | Q(members_amount__gt=0))\
+            .values_list('challenge_id', flat=True).distinct()
+        folded_challenges_amount = 0
+        for challenge_id in list(challenges_ids):
+            if ChallengeBalanceService.fold_shards(challenge_id):
+                folded_challenges_amount += 1
+        return folded_challenges_amount
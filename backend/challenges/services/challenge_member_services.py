@@ -1,11 +1,46 @@
 from typing import Optional
 
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
 from users.models import User
 from challenges.models import Challenge, ChallengeMember
+from challenges.services.challenge_balance_services import \
+    ChallengeBalanceService
 
 
 class ChallengeMemberService:
 
+    @staticmethod
+    def add_challenge_member(user: User, challenge: Challenge
+                             ) -> ChallengeMember:
+        """
+        Makes user a member of challenge and counts him. Member of
+        challenge with sharded balance is counted in shard of balance.
+        """
+        with transaction.atomic():
+            challenge_member = ChallengeMember(user=user, challenge=challenge)
+            challenge_member.save()
+            if not ChallengeBalanceService.add_to_shard(challenge,
+                                                        members_amount=1):
+                Challenge.objects.filter(id=challenge.id).update(
+                    members_amount=F('members_amount') + 1,
+                    last_modified=timezone.now())
+        challenge.refresh_from_db(fields=['members_amount', 'last_modified'])
+        return challenge_member
+
+    @staticmethod
+    def get_challenge_members(challenge: Challenge) -> QuerySet:
+        """
+        Returns rows with id, user_id and username of
+        challenge members selected by one join.
+        """
+        return ChallengeMember.objects.filter(challenge=challenge)\
+            .annotate(username=F('user__username'))\
+            .values_list('id', 'user_id', 'username', named=True)
+
     @staticmethod
     def get_challenge_member(user: User, challenge: Challenge
                              ) -> Optional[ChallengeMember]:
@@ -22,3 +57,20 @@ class ChallengeMemberService:
         challenge_member = ChallengeMember.objects.all().filter(
             user=user, challenge=challenge)
         return True if challenge_member else False
+
+    @staticmethod
+    def recount_challenges_members() -> int:
+        """
+        Recounts members of challenges whose stored members
+        amount drifted. Returns amount of repaired challenges.
+        Members counted in shards of balances are folded before.
+        """
+        ChallengeBalanceService.fold_all_shards()
+        drifted_challenges = Challenge.objects.annotate(
+            actual_members_amount=Count('challengemember')).exclude(
+            members_amount=F('actual_members_amount')).values_list(
+            'id', 'actual_members_amount')
+        for challenge_id, actual_members_amount in drifted_challenges:
+            Challenge.objects.filter(id=challenge_id).update(
+                members_amount=actual_members_amount)
+        return len(drifted_challenges)
@@ -1,13 +1,20 @@
-import os
+import datetime
 
 from typing import Optional
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.db.models.query import QuerySet
+from django.utils import timezone
 
-from challenges.models import Challenge
+from challenges.models import Challenge, ChallengeBalance
 from users.models import User
 
-from .services import delete_existing_file
+from .video_storage_services import VideoStorageService
+from .search_services import ChallengeSearchService
+from .challenge_balance_services import ChallengeBalanceService
 
 
 class ChallengeService:
@@ -28,36 +35,66 @@ class ChallengeService:
             bet=data['bet'],
         )
         challenge.save()
+        ChallengeSearchService.index_challenge(challenge)
         return challenge
 
     @classmethod
     def update_video_example(cls, user: User, challenge: Challenge,
                              video_example_file: '') -> None:
-        """Updates video example for challenge."""
-        directory = 'video_examples'
-        file_name = f'{user.id}_{challenge.id}.mp4'
-        if challenge.video_example:
-            file_path = os.path.join(settings.MEDIA_ROOT,
-                                     f'{directory}/{file_name}')
-            delete_existing_file(file_path)
-
-        challenge.video_example = video_example_file
-        challenge.video_example.name = file_name
-        challenge.save()
+        """
+        Updates video example for challenge. Video is stored once
+        by its content, previous video example is released.
+        """
+        previous_file_name = challenge.video_example.name
+        with transaction.atomic():
+            challenge.video_example = VideoStorageService.store_video(
+                video_example_file)
+            challenge.save(update_fields=['video_example', 'last_modified'])
+            VideoStorageService.release_video(previous_file_name)
 
     @staticmethod
     def add_coins_for_challenge(challenge: Challenge, coins_amount: int
                                 ) -> None:
-        """Add coins to challenge balance"""
-        challenge.balance.coins_amount += coins_amount
-        challenge.balance.save()
+        """
+        Add coins to challenge balance. Challenge with sharded
+        balance is marked as changed when shards are folded.
+        """
+        if not ChallengeBalanceService.add_coins(challenge, coins_amount):
+            ChallengeService.mark_challenge_changed(challenge)
 
     @staticmethod
     def withdraw_coins_from_challenge(challenge: Challenge, coins_amount: int
-                                      ) -> None:
-        """Withdraw coins from challenge balance."""
-        challenge.balance.coins_amount -= coins_amount
-        challenge.balance.save()
+                                      ) -> bool:
+        """
+        Withdraws coins from challenge balance by one conditional update,
+        shards of balance are folded before. Returns False if challenge
+        hasn't enough coins.
+        """
+        with transaction.atomic():
+            ChallengeBalanceService.fold_shards(challenge.id)
+            updated_rows = ChallengeBalance.objects.filter(
+                challenge=challenge, coins_amount__gte=coins_amount).update(
+                coins_amount=F('coins_amount') - coins_amount)
+        if updated_rows:
+            ChallengeService.mark_challenge_changed(challenge)
+        return updated_rows == 1
+
+    @staticmethod
+    def mark_challenge_changed(challenge: Challenge) -> None:
+        """
+        Updates last_modified of challenge. Must be called when
+        members, answers or balance of challenge are changed.
+        """
+        challenge.last_modified = timezone.now()
+        Challenge.objects.filter(id=challenge.id).update(
+            last_modified=challenge.last_modified)
+
+    @staticmethod
+    def get_challenge_last_modified(challenge_id: int
+                                    ) -> Optional[datetime.datetime]:
+        """Returns last_modified of challenge without loading challenge."""
+        return Challenge.objects.filter(id=challenge_id)\
+            .values_list('last_modified', flat=True).first()
 
     @staticmethod
     def is_challenge_free(challenge: Challenge) -> bool:
@@ -73,14 +110,59 @@ class ChallengeService:
             return None
 
     @staticmethod
-    def make_challenges_not_active(challenge: Challenge) -> None:
-        """Makes challenge not active."""
-        challenge.is_active = False
-        challenge.save()
-
-
-
-
-
+    def get_active_challenges() -> QuerySet:
+        """
+        Returns active challenges annotated with everything
+        that is needed for challenges list in one query.
+        """
+        return Challenge.objects.filter(is_active=True).annotate(
+            creator_username=F('creator__username'),
+            # challenge without balance row has null after left join,
+            # null can't be compared in cursor of the next page.
+            bets_sum=Coalesce(F('balance__coins_amount'), 0),
+        )
 
+    @staticmethod
+    def filter_challenges(queryset: QuerySet, filters: dict) -> QuerySet:
+        """Filters challenges by bet, creator and finish datetime."""
+        if 'min_bet' in filters:
+            queryset = queryset.filter(bet__gte=filters['min_bet'])
+        if 'max_bet' in filters:
+            queryset = queryset.filter(bet__lte=filters['max_bet'])
+        if 'is_free' in filters:
+            # the same rule as ChallengeService.is_challenge_free has.
+            if filters['is_free']:
+                queryset = queryset.filter(bet=0)
+            else:
+                queryset = queryset.filter(bet__gt=0)
+        if 'creator' in filters:
+            queryset = queryset.filter(creator__username=filters['creator'])
+        if 'finish_after' in filters:
+            queryset = queryset.filter(
+                finish_datetime__gte=filters['finish_after'])
+        if 'finish_before' in filters:
+            queryset = queryset.filter(
+                finish_datetime__lte=filters['finish_before'])
+        return queryset
 
+    @staticmethod
+    def make_finished_challenges_not_active(batch_size: int = 1000) -> list:
+        """
+        Makes active challenges which finish datetime has come not active
+        by bulk updates of bounded batches. Returns ids of these challenges.
+        """
+        datetime_now = datetime.datetime.now()
+        finished_challenges = Challenge.objects.filter(
+            is_active=True, finish_datetime__lte=datetime_now)\
+            .order_by('finish_datetime', 'id')
+        challenges_ids = []
+        while True:
+            with transaction.atomic():
+                batch = list(finished_challenges.select_for_update(
+                    skip_locked=True).values_list('id', flat=True)[:batch_size])
+                if not batch:
+                    break
+                Challenge.objects.filter(id__in=batch).update(
+                    is_active=False, last_modified=timezone.now())
+            challenges_ids += batch
+        return challenges_ids
@@ -0,0 +1,165 @@
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import F, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.query import QuerySet
+
+from challenges.models import Challenge, ChallengeBalance, \
+                              ChallengeBalanceShard, CoinTransaction, \
+                              CoinBalanceSnapshot
+from users.models import User, UserBalance
+
+
+class CoinLedgerService:
+    """
+    Class which contain logic of coin transactions ledger. Ledger is
+    append-only, balances are restored from it by the latest snapshot
+    plus transactions which were made after snapshot.
+    """
+
+    batch_size = 1000
+    # ids are given at insert, not at commit, so transaction with lower
+    # id can be committed after higher one. Snapshots are made only up
+    # to id seen by previous run, so transactions below it are committed.
+    observed_transaction_id_key = 'coin_ledger_observed_transaction_id'
+
+    @staticmethod
+    def get_transaction(kind: str, user: Optional[User] = None,
+                        challenge: Optional[Challenge] = None,
+                        user_delta: int = 0, challenge_delta: int = 0
+                        ) -> CoinTransaction:
+        """Returns not saved transaction for record_transactions."""
+        return CoinTransaction(kind=kind, user=user, challenge=challenge,
+                               user_delta=user_delta,
+                               challenge_delta=challenge_delta)
+
+    @classmethod
+    def record_transactions(cls, transactions: list) -> None:
+        """Inserts transactions into ledger by bulk inserts."""
+        CoinTransaction.objects.bulk_create(transactions,
+                                            batch_size=cls.batch_size)
+
+    @classmethod
+    def record_transaction(cls, kind: str, user: Optional[User] = None,
+                           challenge: Optional[Challenge] = None,
+                           user_delta: int = 0, challenge_delta: int = 0
+                           ) -> None:
+        """Inserts one transaction into ledger."""
+        coin_transaction = cls.get_transaction(kind, user, challenge,
+                                               user_delta, challenge_delta)
+        cls.record_transactions([coin_transaction])
+
+    @classmethod
+    def make_snapshots(cls) -> int:
+        """
+        Makes snapshots of balances changed since previous snapshots.
+        Returns amount of created snapshots.
+        """
+        from_transaction_id = CoinBalanceSnapshot.objects.aggregate(
+            id=Max('last_transaction_id'))['id'] or 0
+        to_transaction_id = cache.get(cls.observed_transaction_id_key)
+        observed_transaction_id = CoinTransaction.objects.aggregate(
+            id=Max('id'))['id']
+        cache.set(cls.observed_transaction_id_key, observed_transaction_id,
+                  timeout=None)
+        if not to_transaction_id or to_transaction_id <= from_transaction_id:
+            return 0
+
+        snapshots = []
+        for account_field, delta_field in (('user', 'user_delta'),
+                                           ('challenge', 'challenge_delta')):
+            snapshots += cls._get_snapshots(account_field, delta_field,
+                                            from_transaction_id,
+                                            to_transaction_id)
+        CoinBalanceSnapshot.objects.bulk_create(snapshots,
+                                                batch_size=cls.batch_size)
+        return len(snapshots)
+
+    @staticmethod
+    def _get_snapshots(account_field: str, delta_field: str,
+                       from_transaction_id: int, to_transaction_id: int
+                       ) -> list:
+        """Returns new snapshots of accounts which have new transactions."""
+        account_id_field = f'{account_field}_id'
+        previous_coins_amount = CoinBalanceSnapshot.objects.filter(
+            **{account_id_field: OuterRef(account_id_field)})\
+            .order_by('-last_transaction_id').values('coins_amount')[:1]
+        deltas = CoinTransaction.objects.filter(
+            id__gt=from_transaction_id, id__lte=to_transaction_id,
+            **{f'{account_id_field}__isnull': False})\
+            .values(account_id_field)\
+            .annotate(delta=Sum(delta_field),
+                      previous_coins_amount=Coalesce(
+                          Subquery(previous_coins_amount), 0))\
+            .values_list(account_id_field, 'delta', 'previous_coins_amount')
+        return [
+            CoinBalanceSnapshot(**{account_id_field: account_id},
+                                coins_amount=previous_coins_amount + delta,
+                                last_transaction_id=to_transaction_id)
+            for account_id, delta, previous_coins_amount in deltas
+        ]
+
+    @staticmethod
+    def _annotate_ledger_coins(queryset: QuerySet, account_field: str,
+                               delta_field: str) -> QuerySet:
+        """Annotates balances queryset with coins amount from ledger."""
+        account_id_field = f'{account_field}_id'
+        latest_snapshot = CoinBalanceSnapshot.objects.filter(
+            **{account_id_field: OuterRef(account_id_field)})\
+            .order_by('-last_transaction_id')
+        recent_transactions = CoinTransaction.objects.filter(
+            **{account_id_field: OuterRef(account_id_field)},
+            id__gt=OuterRef('snapshot_transaction_id'))\
+            .values(account_id_field).annotate(delta=Sum(delta_field))\
+            .values('delta')
+        return queryset.annotate(
+            snapshot_coins_amount=Coalesce(
+                Subquery(latest_snapshot.values('coins_amount')[:1]), 0),
+            snapshot_transaction_id=Coalesce(
+                Subquery(latest_snapshot.values('last_transaction_id')[:1]), 0),
+        ).annotate(
+            ledger_coins_amount=F('snapshot_coins_amount') + Coalesce(
+                Subquery(recent_transactions), 0))
+
+    @classmethod
+    def get_user_ledger_coins_amount(cls, user: User) -> int:
+        """Returns coins amount of user balance restored from ledger."""
+        queryset = cls._annotate_ledger_coins(
+            UserBalance.objects.filter(user=user), 'user', 'user_delta')
+        return queryset.values_list('ledger_coins_amount', flat=True).get()
+
+    @classmethod
+    def get_challenge_ledger_coins_amount(cls, challenge: Challenge) -> int:
+        """Returns coins amount of challenge balance restored from ledger."""
+        queryset = cls._annotate_ledger_coins(
+            ChallengeBalance.objects.filter(challenge=challenge),
+            'challenge', 'challenge_delta')
+        return queryset.values_list('ledger_coins_amount', flat=True).get()
+
+    @classmethod
+    def get_users_balances_mismatches(cls) -> QuerySet:
+        """Returns user balances which differ from ledger."""
+        queryset = cls._annotate_ledger_coins(UserBalance.objects.all(),
+                                              'user', 'user_delta')
+        return queryset.exclude(coins_amount=F('ledger_coins_amount'))\
+            .values_list('user_id', 'coins_amount', 'ledger_coins_amount',
+                         named=True)
+
+    @classmethod
+    def get_challenges_balances_mismatches(cls) -> QuerySet:
+        """
+        Returns challenge balances which differ from ledger.
+        Coins of balance shards are counted.
+        """
+        shards_coins_amount = ChallengeBalanceShard.objects.filter(
+            challenge_id=OuterRef('challenge_id')).values('challenge_id')\
+            .annotate(coins_amount=Sum('coins_amount')).values('coins_amount')
+        queryset = ChallengeBalance.objects.annotate(
+            total_coins_amount=F('coins_amount') + Coalesce(
+                Subquery(shards_coins_amount), 0))
+        queryset = cls._annotate_ledger_coins(queryset, 'challenge',
+                                              'challenge_delta')
+        return queryset.exclude(total_coins_amount=F('ledger_coins_amount'))\
+            .values_list('challenge_id', 'total_coins_amount',
+                         'ledger_coins_amount', named=True)
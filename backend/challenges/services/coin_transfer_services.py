@@ -0,0 +1,34 @@
+from django.db import transaction
+
+from challenges.models import Challenge
+from users.models import User
+from users.services.user_services import UserService
+
+from .challenge_services import ChallengeService
+from .coin_ledger_services import CoinLedgerService
+
+
+class CoinTransferService:
+    """
+    Class which contain logic of moving coins between balances.
+    Balances are changed only by conditional updates in database,
+    so concurrent transfers don't need any locks.
+    """
+
+    @staticmethod
+    def transfer_from_user_to_challenge(user: User, challenge: Challenge,
+                                        coins_amount: int,
+                                        kind: str = 'accept') -> bool:
+        """
+        Moves coins from user balance to challenge balance in one
+        transaction and records it into ledger with given kind.
+        Returns False and changes nothing if user hasn't enough coins.
+        """
+        with transaction.atomic():
+            if not UserService.withdraw_coins_from_user(user, coins_amount):
+                return False
+            ChallengeService.add_coins_for_challenge(challenge, coins_amount)
+            CoinLedgerService.record_transaction(
+                kind, user=user, challenge=challenge,
+                user_delta=-coins_amount, challenge_delta=coins_amount)
+        return True
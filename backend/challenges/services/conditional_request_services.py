@@ -0,0 +1,112 @@
+import datetime
+
+from typing import Optional
+
+from django.db.models import Exists, OuterRef
+
+from challenges.models import Challenge, ChallengeMember
+from challenges.serializers import GetChallengeMembersParamsSerializer, \
+                                   GetChallengeAnswersParamsSerializer
+
+from .challenge_services import ChallengeService
+
+
+class ChallengeConditionalRequestService:
+    """
+    Contains validators (ETag, Last-Modified) for conditional requests
+    to challenge endpoints. Validators are formed from last_modified of
+    challenge, so request with actual validator is answered with
+    status 304 without loading and serializing members or answers.
+    Requests which would be rejected get no validators, so they are
+    answered with error instead of 304.
+    """
+
+    @staticmethod
+    def get_last_modified(request, challenge_id: int
+                          ) -> Optional[datetime.datetime]:
+        """Returns last_modified of challenge. It is loaded once per request."""
+        if not hasattr(request, 'challenge_last_modified'):
+            request.challenge_last_modified = \
+                ChallengeService.get_challenge_last_modified(challenge_id)
+        return request.challenge_last_modified
+
+    @classmethod
+    def get_etag(cls, request, challenge_id: int) -> Optional[str]:
+        """Returns ETag of challenge."""
+        last_modified = cls.get_last_modified(request, challenge_id)
+        if last_modified is None:
+            return None
+        return f'"{challenge_id}-{last_modified.strftime("%Y%m%d%H%M%S%f")}"'
+
+    @classmethod
+    def get_user_etag(cls, request, challenge_id: int) -> Optional[str]:
+        """Returns ETag of challenge content that differs from user to user."""
+        etag = cls.get_etag(request, challenge_id)
+        if etag is None:
+            return None
+        return f'"{request.user.id}-{etag[1:]}'
+
+    @staticmethod
+    def can_get_members(request) -> bool:
+        """Returns False if params are invalid or not staff exports."""
+        params_serializer = GetChallengeMembersParamsSerializer(
+            data=request.query_params.dict())
+        if not params_serializer.is_valid():
+            return False
+        return (not params_serializer.validated_data['export'] or
+                request.user.is_staff)
+
+    @staticmethod
+    def can_get_answers(request, challenge_id: int) -> bool:
+        """
+        Returns False if params are invalid, not staff exports or user
+        isn't member of challenge. It is checked once per request by the
+        same query which loads last_modified of challenge.
+        """
+        if not hasattr(request, 'can_get_challenge_answers'):
+            params_serializer = GetChallengeAnswersParamsSerializer(
+                data=request.query_params.dict())
+            if not params_serializer.is_valid():
+                can_get_answers = False
+            elif params_serializer.validated_data['export']:
+                can_get_answers = request.user.is_staff
+            else:
+                is_member = ChallengeMember.objects.filter(
+                    user=request.user, challenge_id=OuterRef('id'))
+                request.challenge_last_modified, can_get_answers = \
+                    Challenge.objects.filter(id=challenge_id)\
+                    .annotate(is_member=Exists(is_member))\
+                    .values_list('last_modified', 'is_member')\
+                    .first() or (None, False)
+            request.can_get_challenge_answers = can_get_answers
+        return request.can_get_challenge_answers
+
+    @classmethod
+    def get_members_etag(cls, request, challenge_id: int) -> Optional[str]:
+        """Returns ETag of challenge members if user can get them."""
+        if not cls.can_get_members(request):
+            return None
+        return cls.get_etag(request, challenge_id)
+
+    @classmethod
+    def get_members_last_modified(cls, request, challenge_id: int
+                                  ) -> Optional[datetime.datetime]:
+        """Returns last_modified of challenge members if user can get them."""
+        if not cls.can_get_members(request):
+            return None
+        return cls.get_last_modified(request, challenge_id)
+
+    @classmethod
+    def get_answers_etag(cls, request, challenge_id: int) -> Optional[str]:
+        """Returns user ETag of challenge answers if user can get them."""
+        if not cls.can_get_answers(request, challenge_id):
+            return None
+        return cls.get_user_etag(request, challenge_id)
+
+    @classmethod
+    def get_answers_last_modified(cls, request, challenge_id: int
+                                  ) -> Optional[datetime.datetime]:
+        """Returns last_modified of challenge answers if user can get them."""
+        if not cls.can_get_answers(request, challenge_id):
+            return None
+        return cls.get_last_modified(request, challenge_id)
@@ -0,0 +1,71 @@
+import uuid
+import datetime
+
+from typing import Optional
+
+from django.core.cache import cache
+
+from challenges.models import Challenge
+from config.celery import app
+
+
+class ChallengeExpiryService:
+    """
+    Schedules making challenges not active exactly at their finish
+    datetime. Active challenges ordered by finish datetime (partial
+    index) are the queue, only the nearest deadline is scheduled.
+    """
+
+    wakeup_key = 'challenges_expiry_wakeup'
+    task_name = 'challenges.tasks.make_challenges_not_active'
+    # long countdowns are split, so task isn't redelivered by broker.
+    max_countdown = 60 * 50
+
+    @staticmethod
+    def get_next_finish_datetime() -> Optional[datetime.datetime]:
+        """Returns the nearest finish datetime of active challenges."""
+        return Challenge.objects.filter(is_active=True)\
+            .order_by('finish_datetime', 'id')\
+            .values_list('finish_datetime', flat=True).first()
+
+    @classmethod
+    def schedule_expiry(cls, finish_datetime: datetime.datetime) -> bool:
+        """
+        Schedules task at finish datetime if there isn't task scheduled
+        before it. Returns True if task was scheduled.
+        """
+        datetime_now = datetime.datetime.now()
+        wakeup = cache.get(cls.wakeup_key)
+        if (wakeup is not None and
+                datetime_now <= wakeup[0] <= finish_datetime):
+            return False
+
+        countdown = (finish_datetime - datetime_now).total_seconds()
+        countdown = min(max(countdown, 0), cls.max_countdown)
+        wakeup_token = uuid.uuid4().hex
+        app.send_task(cls.task_name, kwargs={'wakeup_token': wakeup_token},
+                      countdown=countdown)
+        wakeup_datetime = datetime_now + datetime.timedelta(seconds=countdown)
+        cache.set(cls.wakeup_key, (wakeup_datetime, wakeup_token),
+                  timeout=int(countdown) + 60)
+        return True
+
+    @classmethod
+    def schedule_next_expiry(cls, wakeup_token: Optional[str] = None
+                             ) -> bool:
+        """
+        Schedules task at the nearest finish datetime. Scheduled task
+        passes its wakeup_token and is replaced by the next one only if
+        it is still the scheduled task. Task which was replaced by an
+        earlier one doesn't schedule anything, so tasks don't multiply.
+        """
+        if wakeup_token is not None:
+            wakeup = cache.get(cls.wakeup_key)
+            if wakeup is not None:
+                if wakeup[1] != wakeup_token:
+                    return False
+                cache.delete(cls.wakeup_key)
+        finish_datetime = cls.get_next_finish_datetime()
+        if finish_datetime is None:
+            return False
+        return cls.schedule_expiry(finish_datetime)
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from challenges.models import Challenge, ChallengeAnswer
+from users.models import User
+
+from .video_storage_services import VideoStorageService
+
+
+class MediaService:
+    """Class which contain logic of access to media files."""
+
+    @staticmethod
+    def can_user_get_file(user: User, name: str) -> bool:
+        """
+        Video examples are available for everybody. Video answers are
+        available for everybody after challenge was finished and for
+        their authors before. Other files aren't available. Videos are
+        stored by content, so hidden answer with the same content as
+        public video is available as that video (it isn't a secret then).
+        """
+        if Challenge.objects.filter(video_example=name).exists():
+            return True
+        answers = ChallengeAnswer.objects.filter(video_answer=name)
+        if answers.filter(challenge__is_active=False).exists():
+            return True
+        return (user.is_authenticated and
+                answers.filter(challenge_member__user=user).exists())
+
+    @staticmethod
+    def get_etag(name: str) -> Optional[str]:
+        """Returns hash of video as etag if video is stored by hash."""
+        return VideoStorageService.get_sha256_from_name(name)
@@ -0,0 +1,90 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from django.db.models.query import QuerySet
+
+from challenges.models import Challenge
+
+
+class ChallengeSearchService:
+    """
+    Full-text search over name, goal, description and requirements of
+    challenges. Postgresql uses generated tsvector column with GIN index
+    (it is kept in sync by database), sqlite uses FTS5 table which is
+    filled when challenge is created.
+    """
+
+    fts_table = 'challenges_challenge_fts'
+
+    @classmethod
+    def index_challenge(cls, challenge: Challenge) -> None:
+        """Adds challenge to search index (only sqlite needs it)."""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {cls.fts_table} WHERE rowid = %s',
+                           [challenge.id])
+            cursor.execute(
+                f'INSERT INTO {cls.fts_table}' +
+                '(rowid, name, goal, description, requirements) ' +
+                'VALUES (%s, %s, %s, %s, %s)',
+                [challenge.id, challenge.name, challenge.goal,
+                 challenge.description, challenge.requirements])
+
+    @classmethod
+    def remove_challenge_from_index(cls, challenge_id: int) -> None:
+        """Removes challenge from search index (only sqlite needs it)."""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {cls.fts_table} WHERE rowid = %s',
+                           [challenge_id])
+
+    @classmethod
+    def search(cls, queryset: QuerySet, query: str) -> QuerySet:
+        """
+        Returns challenges of queryset that match query. Challenges
+        are annotated with rank, the bigger rank the better match.
+        """
+        if connection.vendor == 'postgresql':
+            return cls.__search_in_postgresql(queryset, query)
+        return cls.__search_in_sqlite(queryset, query)
+
+    @staticmethod
+    def __search_in_postgresql(queryset: QuerySet, query: str) -> QuerySet:
+        """Searches by tsvector column."""
+        tsquery = "websearch_to_tsquery('simple', %s)"
+        matches = RawSQL(f'challenges_challenge.search_vector @@ {tsquery}',
+                         (query,), output_field=BooleanField())
+        rank = RawSQL(
+            f'ts_rank(challenges_challenge.search_vector, {tsquery})::float8',
+            (query,), output_field=FloatField())
+        return queryset.filter(matches).annotate(rank=rank)
+
+    @classmethod
+    def __search_in_sqlite(cls, queryset: QuerySet, query: str) -> QuerySet:
+        """Searches by FTS5 table."""
+        match_expression = cls.get_fts_match_expression(query)
+        if not match_expression:
+            return queryset.none()
+        matched_ids = RawSQL(
+            f'SELECT rowid FROM {cls.fts_table} ' +
+            f'WHERE {cls.fts_table} MATCH %s', (match_expression,))
+        # bm25 is smaller for better match, so it is negated.
+        rank = RawSQL(
+            f'SELECT -bm25({cls.fts_table}, 4.0, 3.0, 2.0, 1.0) ' +
+            f'FROM {cls.fts_table} WHERE {cls.fts_table} MATCH %s ' +
+            f'AND rowid = challenges_challenge.id',
+            (match_expression,), output_field=FloatField())
+        return queryset.filter(id__in=matched_ids).annotate(rank=rank)
+
+    @staticmethod
+    def get_fts_match_expression(query: str) -> str:
+        """
+        Forms FTS5 expression that matches all words of query.
+        Every word is quoted, so query can't contain FTS5 syntax.
+        """
+        words = re.findall(r'\w+', query)
+        return ' '.join(f'"{word}"' for word in words)
@@ -1,4 +1,21 @@
 import os
+import errno
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+
+
+class StagedFile(File):
+    """
+    File which is already stored on disk. It is moved
+    to media directory instead of copying.
+    """
+
+    def temporary_file_path(self) -> str:
+        """Returns path of file like django TemporaryUploadedFile does."""
+        return self.name
 
 
 def delete_existing_file(file_path: str) -> None:
@@ -7,3 +24,51 @@ def delete_existing_file(file_path: str) -> None:
         os.remove(file_path)
     except FileNotFoundError:
         pass
+
+
+def set_file_permissions(file_path: str) -> None:
+    """
+    Sets permissions of file which is moved to media directory like
+    django storage does, temporary files are created with mode 0600.
+    """
+    os.chmod(file_path, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+
+
+def replace_file(source_path: str, target_path: str) -> None:
+    """
+    Moves file to target path, existing target file is replaced
+    atomically. File is renamed without copying if both paths are
+    on the same filesystem, else it is copied to temporary file
+    near target path which is renamed then.
+    """
+    set_file_permissions(source_path)
+    try:
+        os.replace(source_path, target_path)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+        with open(source_path, 'rb') as source_file:
+            write_and_replace_file(source_file, target_path)
+        delete_existing_file(source_path)
+
+
+def write_and_replace_file(file, target_path: str) -> None:
+    """
+    Writes file to temporary file near target path and
+    renames it to target path, so target is replaced atomically.
+    """
+    target_directory = os.path.dirname(target_path)
+    temporary_file = tempfile.NamedTemporaryFile(dir=target_directory,
+                                                 suffix='.tmp', delete=False)
+    try:
+        with temporary_file:
+            if hasattr(file, 'chunks'):
+                for chunk in file.chunks():
+                    temporary_file.write(chunk)
+            else:
+                shutil.copyfileobj(file, temporary_file)
+        set_file_permissions(temporary_file.name)
+        os.replace(temporary_file.name, target_path)
+    except BaseException:
+        delete_existing_file(temporary_file.name)
+        raise
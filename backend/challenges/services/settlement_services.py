@@ -0,0 +1,136 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from challenges.models import Challenge, ChallengeBalance, ChallengeWinner,\
+                              CoinTransaction
+from users.models import UserBalance
+
+from .challenge_balance_services import ChallengeBalanceService
+from .coin_ledger_services import CoinLedgerService
+
+
+class SettlementService:
+    """
+    Class which contain logic of paying coins of finished challenges
+    to their winners. Challenges are settled by batches, every batch
+    is settled by a few set-based statements.
+    """
+
+    batch_size = 500
+
+    @staticmethod
+    def get_unsettled_challenges_ids(challenges_ids: Optional[Iterable] = None
+                                     ) -> list:
+        """
+        Returns ids of finished not settled challenges which winners
+        are finalized. If ids are given only these challenges are checked.
+        """
+        queryset = Challenge.objects.filter(is_active=False, is_settled=False,
+                                            are_winners_finalized=True)
+        if challenges_ids is not None:
+            queryset = queryset.filter(id__in=list(challenges_ids))
+        queryset = queryset.filter(
+            id__in=ChallengeWinner.objects.values('challenge_id'))
+        return list(queryset.order_by('id').values_list('id', flat=True))
+
+    @staticmethod
+    def finalize_winners(challenges_ids: Iterable) -> int:
+        """
+        Marks that all winners of finished challenges are chosen,
+        so challenges can be settled. Returns amount of finalized challenges.
+        """
+        return Challenge.objects.filter(
+            id__in=list(challenges_ids), is_active=False,
+            are_winners_finalized=False)\
+            .filter(id__in=ChallengeWinner.objects.values('challenge_id'))\
+            .update(are_winners_finalized=True)
+
+    @staticmethod
+    def split_balance(coins_amount: int, winners_amount: int) -> tuple:
+        """
+        Returns share of every winner and fee. Remainder
+        of division between winners is added to fee.
+        """
+        fee = coins_amount * settings.CHALLENGE_FEE_PERCENT // 100
+        share = (coins_amount - fee) // winners_amount
+        return share, coins_amount - share * winners_amount
+
+    @classmethod
+    def settle_challenges(cls, challenges_ids: Optional[Iterable] = None
+                          ) -> int:
+        """
+        Pays balances of finished challenges to winners.
+        Returns amount of settled challenges.
+        """
+        unsettled_challenges_ids = cls.get_unsettled_challenges_ids(
+            challenges_ids)
+        settled_challenges_amount = 0
+        for start in range(0, len(unsettled_challenges_ids), cls.batch_size):
+            batch = unsettled_challenges_ids[start:start + cls.batch_size]
+            settled_challenges_amount += cls._settle_batch(batch)
+        return settled_challenges_amount
+
+    @classmethod
+    def _settle_batch(cls, challenges_ids: list) -> int:
+        """Settles batch of challenges in one transaction."""
+        with transaction.atomic():
+            challenges_ids = list(
+                Challenge.objects.select_for_update()
+                .filter(id__in=challenges_ids, is_active=False,
+                        is_settled=False, are_winners_finalized=True)
+                .filter(id__in=ChallengeWinner.objects.values('challenge_id'))
+                .values_list('id', flat=True))
+            if not challenges_ids:
+                return 0
+
+            sharded_challenges_ids = ChallengeBalance.objects.filter(
+                challenge_id__in=challenges_ids, shards_amount__gt=0)\
+                .values_list('challenge_id', flat=True)
+            for challenge_id in sharded_challenges_ids:
+                ChallengeBalanceService.fold_shards(challenge_id)
+
+            balances = dict(ChallengeBalance.objects.filter(
+                challenge_id__in=challenges_ids)
+                .values_list('challenge_id', 'coins_amount'))
+            winners = defaultdict(set)
+            for challenge_id, user_id in ChallengeWinner.objects.filter(
+                    challenge_id__in=challenges_ids).values_list(
+                    'challenge_id', 'challenge_member__user_id'):
+                winners[challenge_id].add(user_id)
+
+            credits = defaultdict(int)
+            transactions = []
+            for challenge_id in challenges_ids:
+                coins_amount = balances.get(challenge_id, 0)
+                if not coins_amount:
+                    continue
+                share, fee = cls.split_balance(coins_amount,
+                                               len(winners[challenge_id]))
+                for user_id in winners[challenge_id]:
+                    credits[user_id] += share
+                    transactions.append(CoinTransaction(
+                        kind='payout', user_id=user_id,
+                        challenge_id=challenge_id, user_delta=share,
+                        challenge_delta=-share))
+                if fee:
+                    transactions.append(CoinTransaction(
+                        kind='fee', challenge_id=challenge_id,
+                        challenge_delta=-fee))
+
+            if credits:
+                UserBalance.objects.filter(user_id__in=credits.keys()).update(
+                    coins_amount=F('coins_amount') + Case(
+                        *[When(user_id=user_id, then=Value(coins_amount))
+                          for user_id, coins_amount in credits.items()],
+                        default=Value(0), output_field=IntegerField()))
+            ChallengeBalance.objects.filter(
+                challenge_id__in=challenges_ids).update(coins_amount=0)
+            Challenge.objects.filter(id__in=challenges_ids).update(
+                is_settled=True, last_modified=timezone.now())
+            CoinLedgerService.record_transactions(transactions)
+        return len(challenges_ids)
@@ -0,0 +1,174 @@
+import os
+import hashlib
+import datetime
+import tempfile
+
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from challenges.models import VideoBlob
+
+from .services import delete_existing_file, replace_file
+
+
+class VideoStorageService:
+    """
+    Class which contain logic of content-addressed storage of videos.
+    Every video is stored once under sha256 of its content and is
+    deleted when no challenge or answer refers to it.
+    """
+
+    chunk_size = 1024 * 1024
+    # unreferenced blobs are kept for a while, so links
+    # which were given to clients recently still work.
+    unreferenced_blob_lifetime = datetime.timedelta(hours=1)
+
+    @staticmethod
+    def get_blob_name(sha256: str) -> str:
+        """Returns name of blob file in directory sharded by hash."""
+        return (f'{settings.VIDEO_BLOBS_DIR}{sha256[:2]}/{sha256[2:4]}/' +
+                f'{sha256}.mp4')
+
+    @staticmethod
+    def get_sha256_from_name(name: str) -> Optional[str]:
+        """Returns hash of blob or None if file isn't blob."""
+        if not name.startswith(settings.VIDEO_BLOBS_DIR):
+            return None
+        return os.path.splitext(os.path.basename(name))[0]
+
+    @classmethod
+    def _stage_file(cls, file) -> tuple:
+        """
+        Returns path of file on disk, its sha256, size and True if
+        file is temporary file made here. Files which are already on
+        disk are only read, other files are hashed while written.
+        """
+        sha256 = hashlib.sha256()
+        size = 0
+        if hasattr(file, 'temporary_file_path'):
+            file_path = file.temporary_file_path()
+            with open(file_path, 'rb') as staged_file:
+                for chunk in iter(lambda: staged_file.read(cls.chunk_size),
+                                  b''):
+                    sha256.update(chunk)
+                    size += len(chunk)
+            return file_path, sha256.hexdigest(), size, False
+
+        blobs_directory = os.path.join(settings.MEDIA_ROOT,
+                                       settings.VIDEO_BLOBS_DIR)
+        os.makedirs(blobs_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=blobs_directory, suffix='.tmp',
+                                         delete=False) as temporary_file:
+            try:
+                for chunk in file.chunks(cls.chunk_size):
+                    sha256.update(chunk)
+                    size += len(chunk)
+                    temporary_file.write(chunk)
+            except BaseException:
+                delete_existing_file(temporary_file.name)
+                raise
+        return temporary_file.name, sha256.hexdigest(), size, True
+
+    @classmethod
+    def store_video(cls, file) -> str:
+        """
+        Stores video if there isn't video with the same content
+        and counts reference to it. Returns name of stored file.
+        """
+        file_path, sha256, size, is_temporary = cls._stage_file(file)
+        name = cls.get_blob_name(sha256)
+        blob_path = os.path.join(settings.MEDIA_ROOT, name)
+        try:
+            with transaction.atomic():
+                blob, is_created = VideoBlob.objects.select_for_update()\
+                    .get_or_create(sha256=sha256, defaults={'size': size})
+                if not os.path.exists(blob_path):
+                    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                    replace_file(file_path, blob_path)
+                if is_created:
+                    # file without blob isn't deleted as orphaned
+                    # until transaction of new blob is committed.
+                    os.utime(blob_path)
+                VideoBlob.objects.filter(id=blob.id).update(
+                    references_amount=F('references_amount') + 1,
+                    updated_at=datetime.datetime.now())
+        finally:
+            if is_temporary:
+                delete_existing_file(file_path)
+        return name
+
+    @classmethod
+    def release_video(cls, name: Optional[str]) -> None:
+        """
+        Uncounts reference to stored video. Files which were stored
+        before content-addressed storage are deleted at once.
+        """
+        if not name:
+            return
+        sha256 = cls.get_sha256_from_name(name)
+        if sha256 is None:
+            delete_existing_file(os.path.join(settings.MEDIA_ROOT, name))
+            return
+        VideoBlob.objects.filter(sha256=sha256, references_amount__gt=0)\
+            .update(references_amount=F('references_amount') - 1,
+                    updated_at=datetime.datetime.now())
+
+    @classmethod
+    def delete_unreferenced_blobs(cls) -> int:
+        """
+        Deletes blobs which nobody refers to during lifetime
+        of unreferenced blob. Returns amount of deleted blobs.
+        """
+        expiration_datetime = (datetime.datetime.now() -
+                               cls.unreferenced_blob_lifetime)
+        blobs_ids = list(VideoBlob.objects.filter(
+            references_amount=0, updated_at__lt=expiration_datetime)
+            .values_list('id', flat=True))
+        deleted_amount = 0
+        for blob_id in blobs_ids:
+            with transaction.atomic():
+                blob = VideoBlob.objects.select_for_update().filter(
+                    id=blob_id, references_amount=0).first()
+                if blob is None:
+                    continue
+                delete_existing_file(os.path.join(
+                    settings.MEDIA_ROOT, cls.get_blob_name(blob.sha256)))
+                blob.delete()
+            deleted_amount += 1
+        return deleted_amount
+
+    @classmethod
+    def delete_orphaned_files(cls) -> int:
+        """
+        Deletes files in blobs directory which have no blob: files moved
+        by rolled back transactions and temporary files of killed workers.
+        Only files older than lifetime of unreferenced blob are deleted,
+        so files which are being stored now are kept.
+        Returns amount of deleted files.
+        """
+        blobs_directory = os.path.join(settings.MEDIA_ROOT,
+                                       settings.VIDEO_BLOBS_DIR)
+        expiration_timestamp = (datetime.datetime.now() -
+                                cls.unreferenced_blob_lifetime).timestamp()
+        deleted_amount = 0
+        for directory, _, files_names in os.walk(blobs_directory):
+            files_paths = {}
+            for file_name in files_names:
+                file_path = os.path.join(directory, file_name)
+                try:
+                    modified_timestamp = os.stat(file_path).st_mtime
+                except FileNotFoundError:
+                    continue
+                if modified_timestamp < expiration_timestamp:
+                    files_paths[os.path.splitext(file_name)[0]] = file_path
+            stored_sha256 = VideoBlob.objects.filter(
+                sha256__in=list(files_paths)).values_list('sha256', flat=True)
+            for sha256 in stored_sha256:
+                del files_paths[sha256]
+            for file_path in files_paths.values():
+                delete_existing_file(file_path)
+                deleted_amount += 1
+        return deleted_amount
@@ -0,0 +1,171 @@
+import os
+import datetime
+
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from challenges.models import Challenge, VideoUploadSession
+from users.models import User
+
+from .services import delete_existing_file, StagedFile
+from .challenge_services import ChallengeService
+from .challenge_answer_services import ChallengeAnswerService
+from .challenge_member_services import ChallengeMemberService
+
+
+class VideoUploadService:
+    """
+    Class which contain logic of resumable uploads of videos. Chunks
+    are streamed straight to staging file at their offsets, so worker
+    never holds the whole video in memory.
+    """
+
+    chunk_size = 1024 * 64
+    lock_key_prefix = 'video_upload_lock'
+    lock_timeout = 60 * 10
+
+    @staticmethod
+    def get_target_error(user: User, challenge: Challenge, target: str
+                         ) -> Optional[str]:
+        """Returns message if user can't upload video to target."""
+        if target == 'video_example':
+            if not challenge.creator_id == user.id:
+                return 'You can\'t upload video. You aren\'t creator.'
+            return None
+
+        if not challenge.is_active:
+            return 'this challenge was finished.'
+        if not ChallengeMemberService.get_challenge_member(user, challenge):
+            return 'You are not member of this challenge'
+        return None
+
+    @staticmethod
+    def create_session(user: User, challenge: Challenge, target: str,
+                       size: int) -> VideoUploadSession:
+        """Creates upload session and its empty staging file."""
+        session = VideoUploadSession.objects.create(
+            user=user, challenge=challenge, target=target, size=size)
+        file_path = VideoUploadService.get_staging_file_path(session)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        open(file_path, 'wb').close()
+        return session
+
+    @staticmethod
+    def get_session(upload_id: str, user: User
+                    ) -> Optional[VideoUploadSession]:
+        """Returns upload session of user or None if it doesn't exist."""
+        return VideoUploadSession.objects.filter(
+            id=upload_id, user=user).select_related('challenge').first()
+
+    @staticmethod
+    def get_staging_file_path(session: VideoUploadSession) -> str:
+        """Returns path of file which chunks are written to."""
+        return os.path.join(settings.MEDIA_ROOT, settings.VIDEO_UPLOADS_DIR,
+                            f'{session.id}.part')
+
+    @classmethod
+    def write_chunk(cls, session: VideoUploadSession, offset: int,
+                    stream) -> Optional[int]:
+        """
+        Writes chunk from stream to staging file at offset. Returns new
+        offset or None if offset doesn't match received bytes amount,
+        chunk is bigger than rest of video or other chunk is written now.
+        """
+        lock_key = f'{cls.lock_key_prefix}:{session.id}'
+        if offset != session.offset or not cache.add(lock_key, 1,
+                                                     cls.lock_timeout):
+            return None
+        try:
+            position = cls._write_stream(session, offset, stream)
+            if position is None:
+                return None
+            updated_rows = VideoUploadSession.objects.filter(
+                id=session.id, offset=offset).update(
+                offset=position, updated_at=datetime.datetime.now())
+        finally:
+            cache.delete(lock_key)
+        if not updated_rows:
+            return None
+        session.offset = position
+        return position
+
+    @classmethod
+    def _write_stream(cls, session: VideoUploadSession, offset: int,
+                      stream) -> Optional[int]:
+        """Writes stream to staging file, returns position after chunk."""
+        position = offset
+        file_descriptor = os.open(cls.get_staging_file_path(session),
+                                  os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            while True:
+                rest_size = session.size - position
+                data = stream.read(min(cls.chunk_size, rest_size + 1))
+                if not data:
+                    break
+                if len(data) > rest_size:
+                    return None
+                view = memoryview(data)
+                while view:
+                    written_size = os.pwrite(file_descriptor, view, position)
+                    position += written_size
+                    view = view[written_size:]
+        finally:
+            os.close(file_descriptor)
+        return position
+
+    @classmethod
+    def finalize(cls, session: VideoUploadSession) -> bool:
+        """
+        Attaches uploaded video to its target by moving staging
+        file into media directory and deletes session. Session is
+        claimed by deleting it first, so only one of concurrent
+        requests attaches video. Returns False if it was finalized
+        by other request.
+        """
+        file_path = cls.get_staging_file_path(session)
+        with transaction.atomic():
+            deleted_amount, _ = VideoUploadSession.objects.filter(
+                id=session.id, offset=F('size')).delete()
+            if not deleted_amount:
+                return False
+
+            video_file = StagedFile(None, name=file_path)
+            challenge = session.challenge
+            if session.target == 'video_example':
+                ChallengeService.update_video_example(session.user,
+                                                      challenge, video_file)
+            else:
+                challenge_member = ChallengeMemberService.get_challenge_member(
+                    session.user, challenge)
+                challenge_answer = ChallengeAnswerService.get_challenge_answer(
+                    challenge_member=challenge_member, challenge=challenge)
+                ChallengeAnswerService.update_video_answer(
+                    challenge_member, challenge_answer, video_file)
+        delete_existing_file(file_path)
+        return True
+
+    @classmethod
+    def delete_session(cls, session: VideoUploadSession) -> None:
+        """Deletes session with its staging file."""
+        delete_existing_file(cls.get_staging_file_path(session))
+        session.delete()
+
+    @classmethod
+    def delete_expired_sessions(cls) -> int:
+        """
+        Deletes sessions which didn't get chunks during session
+        lifetime. Returns amount of deleted sessions.
+        """
+        expiration_datetime = datetime.datetime.now() - datetime.timedelta(
+            seconds=settings.VIDEO_UPLOAD_SESSION_LIFETIME)
+        sessions = VideoUploadSession.objects.filter(
+            updated_at__lt=expiration_datetime)
+        deleted_amount = 0
+        for session in sessions:
+            cls.delete_session(session)
+            deleted_amount += 1
+        return deleted_amount
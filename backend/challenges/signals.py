@@ -0,0 +1,51 @@
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from users.models import User, UserBalance
+from users.signals import coins_added
+
+from .models import Challenge, ChallengeMember, ChallengeAnswer
+from .services.challenge_balance_services import ChallengeBalanceService
+from .services.coin_ledger_services import CoinLedgerService
+from .services.search_services import ChallengeSearchService
+from .services.video_storage_services import VideoStorageService
+
+
+@receiver(post_delete, sender=ChallengeMember)
+def decrease_challenge_members_amount(sender, instance: ChallengeMember,
+                                      **kwargs) -> None:
+    """Uncounts deleted member (also deleted by cascade) of challenge."""
+    # member can be counted in shard of balance yet.
+    ChallengeBalanceService.fold_shards(instance.challenge_id)
+    Challenge.objects.filter(id=instance.challenge_id, members_amount__gt=0)\
+        .update(members_amount=F('members_amount') - 1,
+                last_modified=timezone.now())
+
+
+@receiver(post_delete, sender=Challenge)
+def remove_challenge_from_search_index(sender, instance: Challenge,
+                                       **kwargs) -> None:
+    """Removes deleted challenge from search index."""
+    ChallengeSearchService.remove_challenge_from_index(instance.id)
+
+
+@receiver(post_delete, sender=Challenge)
+def release_video_example(sender, instance: Challenge, **kwargs) -> None:
+    """Releases video example of deleted challenge."""
+    VideoStorageService.release_video(instance.video_example.name)
+
+
+@receiver(post_delete, sender=ChallengeAnswer)
+def release_video_answer(sender, instance: ChallengeAnswer, **kwargs) -> None:
+    """Releases video answer of deleted answer (also deleted by cascade)."""
+    VideoStorageService.release_video(instance.video_answer.name)
+
+
+@receiver(coins_added, sender=UserBalance)
+def record_granted_coins(sender, user: User, coins_amount: int,
+                         **kwargs) -> None:
+    """Records coins added to user balance (by admin) in coin ledger."""
+    CoinLedgerService.record_transaction('grant', user=user,
+                                         user_delta=coins_amount)
@@ -1,14 +1,48 @@
-import datetime
+from typing import Optional
 
 from config.celery import app
 
-from .models import Challenge
 from .services.challenge_services import ChallengeService
+from .services.cache_services import ChallengesListCacheService
+from .services.challenge_balance_services import ChallengeBalanceService
+from .services.coin_ledger_services import CoinLedgerService
+from .services.settlement_services import SettlementService
+from .services.expiry_services import ChallengeExpiryService
+from .services.video_upload_services import VideoUploadService
+from .services.video_storage_services import VideoStorageService
 
 
 @app.task
-def make_challenges_not_active():
-    datetime_now = datetime.datetime.now()
-    challenges = Challenge.objects.all().filter(finish_datetime__lte=datetime_now)
-    for challenge in challenges:
-        ChallengeService.make_challenges_not_active(challenge)
+def make_challenges_not_active(wakeup_token: Optional[str] = None) -> list:
+    challenges_ids = ChallengeService.make_finished_challenges_not_active()
+    if challenges_ids:
+        ChallengesListCacheService.bump_version()
+    ChallengeExpiryService.schedule_next_expiry(wakeup_token)
+    return challenges_ids
+
+
+@app.task
+def fold_challenge_balance_shards():
+    if ChallengeBalanceService.fold_all_shards():
+        ChallengesListCacheService.bump_version()
+
+
+@app.task
+def make_coin_balances_snapshots():
+    CoinLedgerService.make_snapshots()
+
+
+@app.task
+def settle_finished_challenges():
+    SettlementService.settle_challenges()
+
+
+@app.task
+def delete_expired_video_uploads():
+    VideoUploadService.delete_expired_sessions()
+
+
+@app.task
+def delete_unreferenced_video_blobs():
+    VideoStorageService.delete_unreferenced_blobs()
+    VideoStorageService.delete_orphaned_files()
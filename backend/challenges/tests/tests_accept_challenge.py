@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.urls import reverse
 
 from rest_framework.test import APITestCase
@@ -6,6 +8,10 @@ from rest_framework import status
 from services_for_tests.for_tests import registrate_and_activate_user,\
                                          get_auth_headers, set_auth_headers,\
                                          create_challenge
+
+from challenges.services.coin_transfer_services import CoinTransferService
+from challenges.services.challenge_member_services import \
+    ChallengeMemberService
 from services_for_tests.data_for_tests import signup_data, login_data, \
                                               signup_data2, login_data2, \
                                               data_for_challenge
@@ -120,6 +126,28 @@ class AcceptChallengeTests(APITestCase):
         self.assertEqual(user2.balance.coins_amount, 50)
         self.assertEqual(challenge.balance.coins_amount, 100)
 
+    def test_accept_challenge_concurrently(self):
+        """
+        Tests second accepting of challenge which passed check of
+        membership concurrently with the first one.
+        """
+        self.user2.balance.coins_amount = 100
+        self.user2.balance.save()
+
+        self.client.get(self.url)
+        with mock.patch.object(ChallengeMemberService,
+                               'has_user_already_accepted_this_challenge',
+                               return_value=False):
+            response = self.client.get(self.url)
+
+        challenge = Challenge.objects.get()
+        user2 = User.objects.get(id=self.user2.id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(challenge.members_amount, 2)
+        self.assertEqual(user2.balance.coins_amount, 50)
+        self.assertEqual(challenge.balance.coins_amount, 100)
+
     def test_accept_challenge_that_was_finished(self):
         """Tests accepting challenge that was finished."""
         challenge = Challenge.objects.get()
@@ -139,4 +167,29 @@ class AcceptChallengeTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class CoinTransferTests(APITestCase):
+    """Class for tests of moving coins from user to challenge."""
+
+    def setUp(self):
+        """Creates challenge and gives coins to second user."""
+        user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, user)
+
+        self.user2 = registrate_and_activate_user(signup_data2)
+        self.user2.balance.coins_amount = 70
+        self.user2.balance.save()
+
+    def test_transfer_coins_from_user_to_challenge(self):
+        """Tests that coins are moved by conditional updates."""
+        is_transferred = CoinTransferService.transfer_from_user_to_challenge(
+            self.user2, self.challenge, 50)
+        is_transferred2 = CoinTransferService.transfer_from_user_to_challenge(
+            self.user2, self.challenge, 50)
+
+        challenge = Challenge.objects.get()
+        user2 = User.objects.get(id=self.user2.id)
 
+        self.assertEqual(is_transferred, True)
+        self.assertEqual(is_transferred2, False)
+        self.assertEqual(user2.balance.coins_amount, 20)
+        self.assertEqual(challenge.balance.coins_amount, 100)
@@ -14,7 +14,8 @@ from challenges.models import Challenge, ChallengeMember, ChallengeAnswer
 from services_for_tests.for_tests import registrate_and_activate_user, \
                                          get_auth_headers, set_auth_headers,\
                                          create_challenge, clear_directory,\
-                                         accept_challenge
+                                         get_files_in_directory,\
+                                         accept_challenge, delete_stored_videos
 from services_for_tests.data_for_tests import signup_data, login_data, \
                                               signup_data2, login_data2, \
                                               data_for_challenge
@@ -33,7 +34,7 @@ class AddAnswerOnChallenge(APITestCase):
 
     def setUp(self):
         """"""
-        self.video_answer_dir = os.path.join(settings.MEDIA_ROOT, settings.CHALLENGE_ANSWERS_DIR)
+        self.video_answer_dir = os.path.join(settings.MEDIA_ROOT, settings.VIDEO_BLOBS_DIR)
         clear_directory(self.video_answer_dir)
 
         user = registrate_and_activate_user(signup_data)
@@ -54,6 +55,10 @@ class AddAnswerOnChallenge(APITestCase):
         kwargs = {'challenge_id': self.challenge.id}
         self.url = reverse('challenges:add_answer_on_challenge', kwargs=kwargs)
 
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
     def test_add_answer_on_challenge(self):
         """Tests adding answer on challenge."""
         accept_challenge(self.user2, self.challenge)
@@ -61,7 +66,7 @@ class AddAnswerOnChallenge(APITestCase):
 
         challenge_answer = self.__get_challenge_answer()
 
-        files_in_dir = os.listdir(self.video_answer_dir)
+        files_in_dir = get_files_in_directory(self.video_answer_dir)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(files_in_dir), 1)
         self.assertEqual(challenge_answer.challenge, self.challenge)
@@ -72,7 +77,7 @@ class AddAnswerOnChallenge(APITestCase):
         accept_challenge(self.user2, self.challenge)
         self.client.credentials()
         response = self.client.put(self.url, data=self.data, format='multipart')
-        files_in_dir = os.listdir(self.video_answer_dir)
+        files_in_dir = get_files_in_directory(self.video_answer_dir)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -89,7 +94,7 @@ class AddAnswerOnChallenge(APITestCase):
         response2 = self.client.put(self.url, data=data, format='multipart')
 
         challenge_answer = self.__get_challenge_answer()
-        files_in_dir = os.listdir(self.video_answer_dir)
+        files_in_dir = get_files_in_directory(self.video_answer_dir)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response2.status_code, status.HTTP_200_OK)
@@ -103,7 +108,7 @@ class AddAnswerOnChallenge(APITestCase):
         url = reverse('challenges:add_answer_on_challenge', kwargs=kwargs)
         response = self.client.put(url, data=self.data, format='multipart')
 
-        files_in_dir = os.listdir(self.video_answer_dir)
+        files_in_dir = get_files_in_directory(self.video_answer_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -113,7 +118,7 @@ class AddAnswerOnChallenge(APITestCase):
         user that isn't a member of this challenge.
         """
         response = self.client.put(self.url, data=self.data, format='multipart')
-        files_in_dir = os.listdir(self.video_answer_dir)
+        files_in_dir = get_files_in_directory(self.video_answer_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -123,7 +128,7 @@ class AddAnswerOnChallenge(APITestCase):
         challenge.is_active = False
         challenge.save()
         response = self.client.put(self.url, data=self.data, format='multipart')
-        files_in_dir = os.listdir(self.video_answer_dir)
+        files_in_dir = get_files_in_directory(self.video_answer_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -0,0 +1,115 @@
+from django.urls import reverse
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers,\
+                                         create_challenge, accept_challenge
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, data_for_challenge
+
+from challenges.models import Challenge, ChallengeBalance, \
+                              ChallengeBalanceShard
+from challenges.services.challenge_balance_services import \
+    ChallengeBalanceService
+from challenges.services.challenge_services import ChallengeService
+
+
+class ChallengeBalanceShardsTests(APITestCase):
+    """Tests for sharded balance of challenge."""
+
+    def setUp(self):
+        """Creates challenge with sharded balance and accepts it."""
+        self.user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, self.user)
+        ChallengeBalanceService.shard_balance(self.challenge, 4)
+
+        user2 = registrate_and_activate_user(signup_data2)
+        accept_challenge(user2, self.challenge)
+
+    def get_shards_coins_amount(self) -> list:
+        return list(ChallengeBalanceShard.objects.filter(
+            challenge=self.challenge).values_list('coins_amount', flat=True))
+
+    def test_accepting_adds_coins_to_shard(self):
+        """Tests that bet is added to shard instead of balance."""
+        balance = ChallengeBalance.objects.get(challenge=self.challenge)
+
+        self.assertEqual(balance.shards_amount, 4)
+        self.assertEqual(balance.coins_amount, 50)
+        self.assertEqual(sorted(self.get_shards_coins_amount()), [0, 0, 0, 50])
+
+    def test_accepting_counts_member_in_shard(self):
+        """
+        Tests that member of sharded challenge is counted
+        in shard and challenge row is updated by folding.
+        """
+        last_modified = self.challenge.last_modified
+        challenge = Challenge.objects.get()
+
+        self.assertEqual(challenge.members_amount, 1)
+        self.assertEqual(challenge.last_modified, last_modified)
+        self.assertEqual(sum(ChallengeBalanceShard.objects.values_list(
+            'members_amount', flat=True)), 1)
+
+        ChallengeBalanceService.fold_all_shards()
+        challenge = Challenge.objects.get()
+
+        self.assertEqual(challenge.members_amount, 2)
+        self.assertGreater(challenge.last_modified, last_modified)
+
+    def test_add_coins_to_deleted_shard(self):
+        """
+        Tests that coins are added to balance when balance
+        was resharded after its shards amount was read.
+        """
+        ChallengeBalanceShard.objects.all().delete()
+
+        is_deferred = ChallengeBalanceService.add_coins(self.challenge, 30)
+        balance = ChallengeBalance.objects.get(challenge=self.challenge)
+
+        self.assertEqual(is_deferred, False)
+        self.assertEqual(balance.coins_amount, 80)
+
+    def test_reshard_balance(self):
+        """Tests that resharding keeps coins and members of shards."""
+        ChallengeBalanceService.shard_balance(self.challenge, 2)
+        balance = ChallengeBalance.objects.get(challenge=self.challenge)
+
+        self.assertEqual(balance.shards_amount, 2)
+        self.assertEqual(balance.coins_amount, 100)
+        self.assertEqual(Challenge.objects.get().members_amount, 2)
+        self.assertEqual(self.get_shards_coins_amount(), [0, 0])
+
+    def test_detail_challenge_bets_sum_with_shards(self):
+        """Tests that detail info of challenge counts coins of shards."""
+        auth_headers = get_auth_headers(login_data)
+        set_auth_headers(self, auth_headers)
+        kwargs = {'challenge_id': self.challenge.id}
+        url = reverse('challenges:get_detail_challenge', kwargs=kwargs)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['bets_sum'], 100)
+
+    def test_fold_shards(self):
+        """Tests that folding moves coins of shards to balance."""
+        folded_challenges_amount = ChallengeBalanceService.fold_all_shards()
+        balance = ChallengeBalance.objects.get(challenge=self.challenge)
+
+        self.assertEqual(folded_challenges_amount, 1)
+        self.assertEqual(balance.coins_amount, 100)
+        self.assertEqual(self.get_shards_coins_amount(), [0, 0, 0, 0])
+        self.assertEqual(ChallengeBalanceService.fold_all_shards(), 0)
+
+    def test_withdraw_coins_from_sharded_challenge(self):
+        """Tests that coins of shards can be withdrawn."""
+        is_withdrawn = ChallengeService.withdraw_coins_from_challenge(
+            self.challenge, 80)
+        balance = ChallengeBalance.objects.get(challenge=self.challenge)
+
+        self.assertEqual(is_withdrawn, True)
+        self.assertEqual(balance.coins_amount, 20)
+        self.assertEqual(self.get_shards_coins_amount(), [0, 0, 0, 0])
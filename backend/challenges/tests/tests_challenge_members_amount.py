@@ -0,0 +1,44 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from rest_framework.test import APITestCase
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         create_challenge, accept_challenge
+from services_for_tests.data_for_tests import signup_data, signup_data2, \
+                                              data_for_challenge
+
+from challenges.models import Challenge, ChallengeMember
+
+
+class ChallengeMembersAmountTests(APITestCase):
+    """Tests for stored amount of challenge members."""
+
+    def setUp(self):
+        self.user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, self.user)
+
+        self.user2 = registrate_and_activate_user(signup_data2)
+        accept_challenge(self.user2, self.challenge)
+
+    def test_members_amount_after_accepting_challenge(self):
+        """Tests that every accepting of challenge is counted."""
+        challenge = Challenge.objects.get(id=self.challenge.id)
+        self.assertEqual(challenge.members_amount, 2)
+
+    def test_members_amount_after_deleting_member(self):
+        """Tests that member deleted by cascade is uncounted."""
+        self.user2.delete()
+        challenge = Challenge.objects.get(id=self.challenge.id)
+        self.assertEqual(challenge.members_amount, 1)
+
+    def test_recount_challenges_members_command(self):
+        """Tests that command repairs drifted members amount."""
+        Challenge.objects.filter(id=self.challenge.id).update(
+            members_amount=10)
+        output = StringIO()
+        call_command('recount_challenges_members', stdout=output)
+        challenge = Challenge.objects.get(id=self.challenge.id)
+        self.assertEqual(challenge.members_amount, 2)
+        self.assertIn('repaired for 1 challenges', output.getvalue())
@@ -0,0 +1,87 @@
+import datetime
+
+from unittest import mock
+
+from django.core.cache import cache
+
+from rest_framework.test import APITestCase
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         create_challenge
+from services_for_tests.data_for_tests import signup_data, data_for_challenge
+
+from challenges.models import Challenge
+from challenges.services.expiry_services import ChallengeExpiryService
+from config.celery import app
+
+
+@mock.patch.object(app, 'send_task')
+class ChallengeExpiryTests(APITestCase):
+    """Tests for scheduling of finishing challenges."""
+
+    def setUp(self):
+        """Creates challenge which finishes in one minute."""
+        cache.clear()
+        user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, user)
+        self.finish_datetime = (datetime.datetime.now() +
+                                datetime.timedelta(minutes=1))
+        Challenge.objects.update(finish_datetime=self.finish_datetime)
+
+    def test_schedule_next_expiry(self, send_task):
+        """Tests that task is scheduled at the nearest finish datetime."""
+        is_scheduled = ChallengeExpiryService.schedule_next_expiry()
+
+        self.assertEqual(is_scheduled, True)
+        send_task.assert_called_once()
+        self.assertEqual(list(send_task.call_args.kwargs['kwargs']),
+                         ['wakeup_token'])
+        self.assertAlmostEqual(send_task.call_args.kwargs['countdown'], 60,
+                               delta=5)
+
+    def test_later_expiry_is_not_scheduled_twice(self, send_task):
+        """Tests that task isn't scheduled if earlier task is scheduled."""
+        ChallengeExpiryService.schedule_next_expiry()
+        is_scheduled = ChallengeExpiryService.schedule_expiry(
+            self.finish_datetime + datetime.timedelta(minutes=1))
+
+        self.assertEqual(is_scheduled, False)
+        self.assertEqual(send_task.call_count, 1)
+
+    def test_earlier_expiry_is_scheduled(self, send_task):
+        """Tests that earlier finish datetime gets own task."""
+        ChallengeExpiryService.schedule_next_expiry()
+        is_scheduled = ChallengeExpiryService.schedule_expiry(
+            self.finish_datetime - datetime.timedelta(seconds=30))
+
+        self.assertEqual(is_scheduled, True)
+        self.assertEqual(send_task.call_count, 2)
+
+    def get_wakeup_token(self, send_task) -> str:
+        return send_task.call_args.kwargs['kwargs']['wakeup_token']
+
+    def test_wakeup_schedules_next_expiry(self, send_task):
+        """Tests that woken task replaces itself by the next one."""
+        ChallengeExpiryService.schedule_next_expiry()
+        is_scheduled = ChallengeExpiryService.schedule_next_expiry(
+            self.get_wakeup_token(send_task))
+
+        self.assertEqual(is_scheduled, True)
+        self.assertEqual(send_task.call_count, 2)
+
+    def test_replaced_wakeup_does_not_schedule(self, send_task):
+        """
+        Tests that task which was replaced by earlier task
+        doesn't schedule next one and doesn't delete earlier one.
+        """
+        ChallengeExpiryService.schedule_next_expiry()
+        replaced_wakeup_token = self.get_wakeup_token(send_task)
+        ChallengeExpiryService.schedule_expiry(
+            self.finish_datetime - datetime.timedelta(seconds=30))
+        is_scheduled = ChallengeExpiryService.schedule_next_expiry(
+            replaced_wakeup_token)
+
+        self.assertEqual(is_scheduled, False)
+        self.assertEqual(send_task.call_count, 2)
+        self.assertEqual(cache.get(ChallengeExpiryService.wakeup_key)[1],
+                         self.get_wakeup_token(send_task))
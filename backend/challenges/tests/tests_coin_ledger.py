@@ -0,0 +1,117 @@
+import datetime
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, login_data2, \
+                                              data_for_challenge
+
+from challenges.models import Challenge, ChallengeBalance, CoinTransaction, \
+                              CoinBalanceSnapshot
+from challenges.services.coin_ledger_services import CoinLedgerService
+from users.services.user_services import UserService
+
+
+class CoinLedgerTests(APITestCase):
+    """Tests for ledger of coins moved by creating and accepting challenge."""
+
+    def setUp(self):
+        """Creates challenge by first user and accepts it by second user."""
+        cache.delete(CoinLedgerService.observed_transaction_id_key)
+        self.user = registrate_and_activate_user(signup_data)
+        self.user2 = registrate_and_activate_user(signup_data2)
+        for user in (self.user, self.user2):
+            user.balance.coins_amount = 50
+            user.balance.save()
+
+        data = data_for_challenge.copy()
+        finish_datetime = datetime.datetime.now() + datetime.timedelta(days=1)
+        data['finish_datetime'] = finish_datetime.strftime('%Y-%m-%dT%H:%M:%S')
+        set_auth_headers(self, get_auth_headers(login_data))
+        self.client.post(reverse('challenges:create_challenge'), data)
+        self.challenge = Challenge.objects.get()
+
+        set_auth_headers(self, get_auth_headers(login_data2))
+        kwargs = {'challenge_id': self.challenge.id}
+        response = self.client.get(
+            reverse('challenges:accept_challenge', kwargs=kwargs))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_transactions_are_recorded(self):
+        """Tests that creating and accepting challenge are recorded."""
+        transactions = CoinTransaction.objects.order_by('id').values_list(
+            'kind', 'user_id', 'challenge_id', 'user_delta', 'challenge_delta')
+
+        expected_transactions = [
+            ('create', self.user.id, self.challenge.id, -50, 50),
+            ('accept', self.user2.id, self.challenge.id, -50, 50),
+        ]
+        self.assertEqual(list(transactions), expected_transactions)
+
+    def test_ledger_coins_amount_with_snapshots(self):
+        """Tests that snapshot plus recent transactions is balance."""
+        self.assertEqual(CoinLedgerService.make_snapshots(), 0)
+        CoinLedgerService.record_transaction(
+            'payout', user=self.user, challenge=self.challenge,
+            user_delta=90, challenge_delta=-90)
+        snapshots_amount = CoinLedgerService.make_snapshots()
+
+        self.assertEqual(snapshots_amount, 3)
+        self.assertEqual(CoinBalanceSnapshot.objects.get(
+            challenge=self.challenge).coins_amount, 100)
+        self.assertEqual(
+            CoinLedgerService.get_user_ledger_coins_amount(self.user), 40)
+        self.assertEqual(
+            CoinLedgerService.get_challenge_ledger_coins_amount(
+                self.challenge), 10)
+
+    def test_snapshots_include_late_committed_transactions(self):
+        """
+        Tests that transaction with lower id which is committed
+        after higher one is counted by snapshot.
+        """
+        last_transaction_id = CoinTransaction.objects.latest('id').id
+        CoinTransaction.objects.create(
+            id=last_transaction_id + 2, kind='payout', user=self.user,
+            challenge=self.challenge, user_delta=90, challenge_delta=-90)
+        CoinLedgerService.make_snapshots()
+        CoinTransaction.objects.create(
+            id=last_transaction_id + 1, kind='grant', user=self.user2,
+            user_delta=30)
+        snapshots_amount = CoinLedgerService.make_snapshots()
+
+        self.assertEqual(snapshots_amount, 3)
+        self.assertEqual(CoinLedgerService.make_snapshots(), 0)
+        self.assertEqual(CoinBalanceSnapshot.objects.get(
+            user=self.user2).coins_amount, -20)
+        self.assertEqual(CoinBalanceSnapshot.objects.get(
+            challenge=self.challenge).coins_amount, 10)
+
+    def test_challenges_balances_mismatches(self):
+        """Tests that audit finds challenge balance changed beside ledger."""
+        mismatches = CoinLedgerService.get_challenges_balances_mismatches()
+        self.assertEqual(list(mismatches), [])
+
+        ChallengeBalance.objects.update(coins_amount=70)
+        mismatches = CoinLedgerService.get_challenges_balances_mismatches()
+
+        self.assertEqual(len(mismatches), 1)
+        self.assertEqual(mismatches[0].challenge_id, self.challenge.id)
+        self.assertEqual(mismatches[0].total_coins_amount, 70)
+        self.assertEqual(mismatches[0].ledger_coins_amount, 100)
+
+    def test_add_coins_for_user_records_grant(self):
+        """Tests that coins granted to user are recorded in ledger."""
+        UserService.add_coins_for_user(self.user, 30)
+        coin_transaction = CoinTransaction.objects.latest('id')
+
+        self.assertEqual(coin_transaction.kind, 'grant')
+        self.assertEqual(coin_transaction.user_delta, 30)
+        self.assertEqual(
+            CoinLedgerService.get_user_ledger_coins_amount(self.user), -20)
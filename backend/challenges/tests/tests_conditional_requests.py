@@ -0,0 +1,93 @@
+from django.urls import reverse
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers,\
+                                         create_challenge, accept_challenge
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, login_data2, \
+                                              data_for_challenge
+
+
+class ConditionalRequestsTests(APITestCase):
+    """
+    Tests for conditional requests to endpoints
+    that clients poll for changes of challenge.
+    """
+
+    def setUp(self):
+        self.user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, self.user)
+
+        self.user2 = registrate_and_activate_user(signup_data2)
+        auth_headers = get_auth_headers(login_data)
+        set_auth_headers(self, auth_headers)
+
+        kwargs = {'challenge_id': self.challenge.id}
+        self.urls = [
+            reverse('challenges:get_detail_challenge', kwargs=kwargs),
+            reverse('challenges:get_challenge_members', kwargs=kwargs),
+            reverse('challenges:get_challenge_answers', kwargs=kwargs),
+        ]
+
+    def test_getting_not_changed_challenge(self):
+        """Tests that not changed challenge is answered with 304."""
+        for url in self.urls:
+            response = self.client.get(url)
+            response2 = self.client.get(
+                url, HTTP_IF_NONE_MATCH=response['ETag'])
+            response3 = self.client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response2.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response2.content, b'')
+            self.assertEqual(response3.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_getting_challenge_after_new_member(self):
+        """Tests that challenge is sent again when it gets new member."""
+        etags = [self.client.get(url)['ETag'] for url in self.urls]
+        accept_challenge(self.user2, self.challenge)
+        for url, etag in zip(self.urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response['ETag'], etag)
+
+    def test_answers_etag_differs_from_user_to_user(self):
+        """
+        Tests that answers of active challenge have own
+        ETag for every user, because they see different answers.
+        """
+        accept_challenge(self.user2, self.challenge)
+        response = self.client.get(self.urls[2])
+        set_auth_headers(self, get_auth_headers(login_data2))
+        response2 = self.client.get(self.urls[2],
+                                    HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response2['ETag'], response['ETag'])
+
+    def test_conditional_request_of_not_member(self):
+        """Tests that user who isn't member gets error instead of 304."""
+        response = self.client.get(self.urls[2])
+        set_auth_headers(self, get_auth_headers(login_data2))
+        response2 = self.client.get(
+            self.urls[2], HTTP_IF_NONE_MATCH='*',
+            HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response2.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_conditional_request_of_export_by_not_staff(self):
+        """Tests that export by not staff gets error instead of 304."""
+        for url in self.urls[1:]:
+            response = self.client.get(url)
+            response2 = self.client.get(
+                url, {'export': 'true'}, HTTP_IF_NONE_MATCH=response['ETag'],
+                HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_conditional_request_of_not_existing_challenge(self):
+        """Tests conditional request to challenge that doesn't exist."""
+        kwargs = {'challenge_id': 100000000}
+        url = reverse('challenges:get_detail_challenge', kwargs=kwargs)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,106 @@
+import os
+import json
+from unittest import mock
+
+from django.test import override_settings
+from django.conf import settings
+from django.urls import reverse
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from challenges.models import ChallengeMember
+from config.responses import StreamingJSONResponse
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers,\
+                                         create_challenge, clear_directory,\
+                                         accept_challenge, add_answer_on_challenge, \
+                                         delete_stored_videos
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, data_for_challenge
+
+
+@override_settings(MEDIA_ROOT=os.path.join(settings.MEDIA_ROOT, 'test'),
+                   MEDIA_URL='/media/test/')
+class ExportChallengeDataTests(APITestCase):
+    """Tests for exporting members and answers of challenge by staff."""
+
+    def setUp(self):
+        """Creates challenge with two members and one answer."""
+        clear_directory(os.path.join(settings.MEDIA_ROOT,
+                                     settings.VIDEO_BLOBS_DIR))
+        self.user = registrate_and_activate_user(signup_data)
+        self.user.is_staff = True
+        self.user.save()
+        set_auth_headers(self, get_auth_headers(login_data))
+
+        self.challenge = create_challenge(data_for_challenge, self.user)
+        self.user2 = registrate_and_activate_user(signup_data2)
+        accept_challenge(self.user2, self.challenge)
+        challenge_member = ChallengeMember.objects.get(
+            user=self.user, challenge=self.challenge)
+        self.challenge_answer = add_answer_on_challenge(
+            challenge_member, self.challenge,
+            SimpleUploadedFile('111.mp4', b'video answer'))
+
+        kwargs = {'challenge_id': self.challenge.id}
+        self.members_url = reverse('challenges:get_challenge_members',
+                                   kwargs=kwargs)
+        self.answers_url = reverse('challenges:get_challenge_answers',
+                                   kwargs=kwargs)
+        self.params = {'export': 'true'}
+
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
+    def get_json(self, response) -> list:
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_export_challenge_members(self):
+        with mock.patch.object(StreamingJSONResponse, 'chunk_size', 1):
+            response = self.client.get(self.members_url, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(self.get_json(response), [
+            {'user_id': self.user.id, 'username': self.user.username},
+            {'user_id': self.user2.id, 'username': self.user2.username}])
+
+    def test_first_member_is_sent_at_once(self):
+        """Tests that the first row doesn't wait for the whole chunk."""
+        response = self.client.get(self.members_url, self.params)
+        parts = list(response.streaming_content)
+
+        self.assertEqual(parts[0], b'[')
+        self.assertEqual(json.loads(parts[1]),
+                         {'user_id': self.user.id,
+                          'username': self.user.username})
+
+    def test_export_challenge_answers(self):
+        response = self.client.get(self.answers_url, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_json(response), [
+            {'challenge_member': self.user.username,
+             'video_answer_path': settings.MEDIA_URL +
+             self.challenge_answer.video_answer.name}])
+
+    def test_export_challenge_data_for_not_staff_user(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.get(self.members_url, self.params)
+        response2 = self.client.get(self.answers_url, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_challenge_data_of_unexisting_challenge(self):
+        kwargs = {'challenge_id': self.challenge.id + 1}
+        response = self.client.get(reverse(
+            'challenges:get_challenge_members', kwargs=kwargs), self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
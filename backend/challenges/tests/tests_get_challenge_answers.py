@@ -18,7 +18,8 @@ from challenges.models import Challenge, ChallengeMember, ChallengeAnswer
 from services_for_tests.for_tests import registrate_and_activate_user, \
                                          get_auth_headers, set_auth_headers,\
                                          create_challenge, clear_directory,\
-                                         accept_challenge, add_answer_on_challenge
+                                         accept_challenge, add_answer_on_challenge, \
+                                         delete_stored_videos
 from services_for_tests.data_for_tests import signup_data, login_data, \
                                               signup_data2, login_data2, \
                                               data_for_challenge
@@ -78,6 +79,10 @@ class GetChallengeAnswersTests(APITestCase):
         self.video_example_path = settings.MEDIA_URL + challenge_answer.video_answer.name
         self.video_example_path2 = settings.MEDIA_URL + challenge_answer2.video_answer.name
 
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
     def test_get_challenge_answers_when_challenge_is_active(self):
         """Tests getting challenge asnwers when challenge is active"""
         response = self.client.get(self.url)
@@ -85,7 +90,7 @@ class GetChallengeAnswersTests(APITestCase):
         expected_data = [expected_data]
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.data['results']==expected_data, True)
 
     def test_get_challenge_answers_when_challenge_is_finished(self):
         """Tests getting challenge_answers when challenge is finished"""
@@ -98,7 +103,7 @@ class GetChallengeAnswersTests(APITestCase):
         expected_data = [expected_data1, expected_data2]
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.data['results']==expected_data, True)
 
     def test_get_challenge_answers_for_not_auth_user(self):
         """Tests getting challenge_answers for not authenticated user."""
@@ -163,7 +168,7 @@ class GetChallengeAnswersTests(APITestCase):
         expected_data = []
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.data['results']==expected_data, True)
 
     def test_get_challenge_answer_when_challenge_is_finished_without_answers(self):
         """
@@ -185,13 +190,31 @@ class GetChallengeAnswersTests(APITestCase):
         expected_data = []
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
-
-
-
-
+        self.assertEqual(response.data['results']==expected_data, True)
 
+    def test_get_challenge_answers_by_pages(self):
+        """Tests getting answers of finished challenge by pages."""
+        self.challenge.is_active = False
+        self.challenge.save()
 
+        response = self.client.get(self.url, {'page_size': 1})
+        response2 = self.client.get(response.data['next'])
+        expected_data1 = get_expected_data(self.user, self.video_example_path)
+        expected_data2 = get_expected_data(self.user2, self.video_example_path2)
 
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [expected_data1])
+        self.assertEqual(response2.data['results'], [expected_data2])
+        self.assertEqual(response2.data['next'], None)
 
+    def test_get_challenge_answers_queries_amount(self):
+        """Tests that answers with their members are selected by one query."""
+        self.challenge.is_active = False
+        self.challenge.save()
 
+        # 1 query for authentication (user isn't cached yet), 1 for
+        # validators of conditional request, 1 for challenge, 1 for
+        # member and 1 for answers.
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 2)
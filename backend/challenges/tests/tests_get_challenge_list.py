@@ -1,4 +1,8 @@
+import json
+import base64
+
 from django.urls import reverse
+from django.core.cache import cache
 
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -6,6 +10,7 @@ from rest_framework import status
 from services_for_tests.for_tests import registrate_and_activate_user, \
                                          get_auth_headers, set_auth_headers,\
                                          create_challenge, accept_challenge
+from challenges.services.cache_services import ChallengesListCacheService
 from services_for_tests.data_for_tests import signup_data, login_data,\
                                               signup_data2, login_data2,\
                                               data_for_challenge
@@ -18,6 +23,7 @@ class GetChallengesList(APITestCase):
     """
 
     def setUp(self):
+        cache.clear()
         self.user = registrate_and_activate_user(signup_data)
         self.challenge = create_challenge(data_for_challenge, self.user)
 
@@ -39,7 +45,7 @@ class GetChallengesList(APITestCase):
             'finish_datetime': self.challenge.finish_datetime
         }]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.json()['results']==expected_data, True)
 
     def test_getting_challenges_list_with_one_challenge_and_two_members(self):
         """
@@ -59,7 +65,7 @@ class GetChallengesList(APITestCase):
             'finish_datetime': self.challenge.finish_datetime
         }]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.json()['results']==expected_data, True)
 
     def test_getting_challenges_list_with_two_challenges(self):
         """
@@ -93,7 +99,7 @@ class GetChallengesList(APITestCase):
             }
         ]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.json()['results']==expected_data, True)
 
     def test_getting_challenges_list_with_two_challenges_with_one_finished(self):
         """
@@ -117,15 +123,185 @@ class GetChallengesList(APITestCase):
             'finish_datetime': self.challenge.finish_datetime
         }]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.json()['results']==expected_data, True)
+
+    def test_getting_challenges_list_queries_amount_does_not_depend_on_size(self):
+        """
+        Tests that challenges list is built with one
+        query whatever amount of challenges there is.
+        """
+        for number in range(5):
+            data_for_challenge_local = data_for_challenge.copy()
+            data_for_challenge_local['name'] = f'challenge_name_{number}'
+            challenge = create_challenge(data_for_challenge_local, self.user2)
+            accept_challenge(self.user, challenge)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 6)
+
+    def test_getting_challenges_list_by_pages(self):
+        """
+        Tests that challenges list is split on pages and
+        challenges that finish earlier go first.
+        """
+        for number, day in enumerate((5, 3, 4)):
+            data_for_challenge_local = data_for_challenge.copy()
+            data_for_challenge_local['name'] = f'challenge_name_{number}'
+            data_for_challenge_local['finish_datetime'] = \
+                f'2023-01-0{day} 18:25:43'
+            create_challenge(data_for_challenge_local, self.user2)
 
+        response = self.client.get(self.url, {'page_size': 2})
+        response2 = self.client.get(response.json()['next'])
 
+        challenges_names = [
+            challenge['name'] for page in (response, response2)
+            for challenge in page.json()['results']
+        ]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertEqual(response2.json()['next'], None)
+        self.assertEqual(challenges_names, [
+            'challenge_name_1', 'challenge_name_2', 'challenge_name_0',
+            self.challenge.name
+        ])
 
+    def test_getting_challenges_list_with_invalid_cursor(self):
+        """Tests getting challenges list with cursor that was not issued."""
+        response = self.client.get(self.url, {'cursor': 'not_a_cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_getting_challenges_list_with_forged_cursor(self):
+        """
+        Tests getting challenges list with cursor which values
+        don't fit ordering fields.
+        """
+        positions = (['x', 1], [None, 1], ['2023-01-01T00:00:00', 'abc'],
+                     [{}, 1])
+        for position in positions:
+            data = {'ordering': ['finish_datetime', 'id'],
+                    'position': position}
+            cursor = base64.urlsafe_b64encode(json.dumps(data).encode())
+            response = self.client.get(self.url, {'cursor': cursor.decode()})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_getting_challenges_list_by_bets_sum_without_balance(self):
+        """Tests that challenge without balance has zero bets sum."""
+        data_for_challenge_local = data_for_challenge.copy()
+        data_for_challenge_local['name'] = 'challenge_without_balance'
+        challenge = create_challenge(data_for_challenge_local, self.user2)
+        challenge.balance.delete()
 
+        response = self.client.get(self.url, {'ordering': 'bets_sum',
+                                               'page_size': 1})
+        response2 = self.client.get(response.json()['next'])
 
+        self.assertEqual(response.json()['results'][0]['bets_sum'], 0)
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.json()['results'][0]['challenge_id'],
+                         self.challenge.id)
 
+    def test_getting_challenges_list_from_cache(self):
+        """
+        Tests that page of challenges list is taken from
+        cache until challenges list is changed.
+        """
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        accept_challenge(self.user2, self.challenge)
+        response2 = self.client.get(self.url)
+        ChallengesListCacheService.bump_version()
+        response3 = self.client.get(self.url)
 
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.json()['results'][0]['members_amount'], 1)
+        self.assertEqual(response3.json()['results'][0]['members_amount'], 2)
 
 
+class GetFilteredChallengesList(APITestCase):
+    """
+    Class which contain tests for testing
+    filtering and sorting of challenges list.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = registrate_and_activate_user(signup_data)
+        self.user2 = registrate_and_activate_user(signup_data2)
+
+        self.challenges = []
+        for number, (bet, day) in enumerate(((50, 3), (0, 5), (100, 4))):
+            data_for_challenge_local = data_for_challenge.copy()
+            data_for_challenge_local['name'] = f'challenge_name_{number}'
+            data_for_challenge_local['bet'] = bet
+            data_for_challenge_local['finish_datetime'] = \
+                f'2023-01-0{day} 18:25:43'
+            self.challenges.append(
+                create_challenge(data_for_challenge_local, self.user))
+        accept_challenge(self.user2, self.challenges[0])
+
+        self.url = reverse('challenges:get_challenges_list')
+
+    def get_challenges_ids(self, params: dict) -> list:
+        """Returns ids of challenges from response."""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [challenge['challenge_id']
+                for challenge in response.json()['results']]
+
+    def test_filtering_challenges_by_bet(self):
+        """Tests filtering challenges by bet range and by being free."""
+        first, free, third = self.challenges
+        self.assertEqual(self.get_challenges_ids({'min_bet': 50}),
+                         [first.id, third.id])
+        self.assertEqual(self.get_challenges_ids({'max_bet': 50}),
+                         [first.id, free.id])
+        self.assertEqual(self.get_challenges_ids({'is_free': 'true'}),
+                         [free.id])
+        self.assertEqual(self.get_challenges_ids({'is_free': 'false'}),
+                         [first.id, third.id])
+
+    def test_filtering_challenges_by_creator_and_finish_datetime(self):
+        """Tests filtering challenges by creator and finish window."""
+        second_user_challenge = create_challenge(data_for_challenge, self.user2)
+        self.assertEqual(self.get_challenges_ids({'creator': 'Lak'}),
+                         [second_user_challenge.id])
+        params = {'finish_after': '2023-01-04 00:00:00',
+                  'finish_before': '2023-01-05 23:00:00'}
+        self.assertEqual(self.get_challenges_ids(params),
+                         [self.challenges[2].id, self.challenges[1].id])
+
+    def test_sorting_challenges(self):
+        """Tests sorting challenges by bet, bets sum and members amount."""
+        first, free, third = self.challenges
+        self.assertEqual(self.get_challenges_ids({'ordering': '-bet'}),
+                         [third.id, first.id, free.id])
+        self.assertEqual(self.get_challenges_ids({'ordering': 'bets_sum'}),
+                         [free.id, first.id, third.id])
+        self.assertEqual(
+            self.get_challenges_ids({'ordering': '-members_amount'}),
+            [first.id, third.id, free.id])
+
+    def test_sorting_challenges_by_pages(self):
+        """Tests that next page keeps chosen ordering."""
+        response = self.client.get(self.url, {'ordering': '-bet',
+                                              'page_size': 2})
+        response2 = self.client.get(response.json()['next'])
+        challenges_ids = [
+            challenge['challenge_id'] for page in (response, response2)
+            for challenge in page.json()['results']
+        ]
+        first, free, third = self.challenges
+        self.assertEqual(challenges_ids, [third.id, first.id, free.id])
+
+    def test_getting_challenges_list_with_invalid_filters(self):
+        """Tests getting challenges list with invalid filters."""
+        for params in ({'min_bet': 10, 'max_bet': 5}, {'ordering': 'name'},
+                       {'min_bet': -1}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code,
+                             status.HTTP_400_BAD_REQUEST)
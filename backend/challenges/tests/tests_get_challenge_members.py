@@ -39,7 +39,7 @@ class GetChallengeMembersTests(APITestCase):
             }
         ]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.data['results']==expected_data, True)
 
     def test_get_challenge_member_with_two_persons(self):
         """
@@ -59,7 +59,7 @@ class GetChallengeMembersTests(APITestCase):
             }
         ]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data==expected_data, True)
+        self.assertEqual(response.data['results']==expected_data, True)
 
     def test_get_challenge_members_by_not_auth_user(self):
         """Tests getting challenge members when user isn't authenticated."""
@@ -74,16 +74,29 @@ class GetChallengeMembersTests(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-
-
-
-
-
-
-
-
-
-
-
-
-
+    def test_get_challenge_members_by_pages(self):
+        """Tests getting challenge members by pages with their count."""
+        accept_challenge(self.user2, self.challenge)
+        response = self.client.get(self.url, {'page_size': 1,
+                                              'with_count': 'true'})
+        response2 = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['results'], [
+            {'user_id': self.user.id, 'username': self.user.username}])
+        self.assertEqual(response2.data['results'], [
+            {'user_id': self.user2.id, 'username': self.user2.username}])
+        self.assertEqual(response2.data['next'], None)
+
+    def test_get_challenge_members_queries_amount(self):
+        """
+        Tests that members are selected by one query
+        whatever amount of members challenge has.
+        """
+        accept_challenge(self.user2, self.challenge)
+        self.client.get(self.url)
+        # user is authenticated from cache, 1 query for validators
+        # of conditional request, 1 for challenge and 1 for members.
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 2)
@@ -13,7 +13,8 @@ from challenges.models import Challenge
 from services_for_tests.for_tests import registrate_and_activate_user, \
                                          get_auth_headers, set_auth_headers,\
                                          create_challenge, accept_challenge,\
-                                         upload_video_for_challenge, clear_directory
+                                         upload_video_for_challenge, clear_directory, \
+                                         delete_stored_videos
 from services_for_tests.data_for_tests import signup_data, login_data, \
                                               signup_data2, login_data2, \
                                               data_for_challenge
@@ -63,6 +64,10 @@ class GetDetailChallengeTests(APITestCase):
         kwargs = {'challenge_id': self.challenge.id}
         self.url = reverse('challenges:get_detail_challenge', kwargs=kwargs)
 
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
     def test_get_detail_challenge_info_with_one_member(self):
         """Tests getting detail challenge information with one member."""
         response = self.client.get(self.url)
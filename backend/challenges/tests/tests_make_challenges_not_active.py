@@ -0,0 +1,45 @@
+import datetime
+
+from rest_framework.test import APITestCase
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         create_challenge
+from services_for_tests.data_for_tests import signup_data, data_for_challenge
+
+from challenges.models import Challenge
+from challenges.services.challenge_services import ChallengeService
+
+
+class MakeChallengesNotActiveTests(APITestCase):
+    """Tests for finishing challenges which finish datetime has come."""
+
+    def setUp(self):
+        """Creates three finished and one not finished challenges."""
+        user = registrate_and_activate_user(signup_data)
+        self.challenges_ids = []
+        for number in range(4):
+            data = data_for_challenge.copy()
+            data['name'] = f'challenge_{number}'
+            self.challenges_ids.append(create_challenge(data, user).id)
+
+        datetime_now = datetime.datetime.now()
+        Challenge.objects.update(
+            finish_datetime=datetime_now - datetime.timedelta(hours=1))
+        Challenge.objects.filter(id=self.challenges_ids[-1]).update(
+            finish_datetime=datetime_now + datetime.timedelta(hours=1))
+
+    def test_make_finished_challenges_not_active(self):
+        """Tests that only finished challenges are made not active."""
+        challenges_ids = ChallengeService.make_finished_challenges_not_active(
+            batch_size=2)
+        active_challenges_ids = Challenge.objects.filter(
+            is_active=True).values_list('id', flat=True)
+
+        self.assertEqual(sorted(challenges_ids), self.challenges_ids[:3])
+        self.assertEqual(list(active_challenges_ids), self.challenges_ids[3:])
+
+    def test_not_active_challenges_are_not_returned_again(self):
+        """Tests that challenges made not active before are skipped."""
+        ChallengeService.make_finished_challenges_not_active()
+        challenges_ids = ChallengeService.make_finished_challenges_not_active()
+        self.assertEqual(challenges_ids, [])
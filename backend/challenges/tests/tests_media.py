@@ -0,0 +1,141 @@
+import os
+
+from django.test import override_settings
+from django.conf import settings
+from django.urls import reverse
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from challenges.models import Challenge
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers,\
+                                         create_challenge, clear_directory,\
+                                         accept_challenge, \
+                                         add_answer_on_challenge, \
+                                         delete_stored_videos
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, login_data2, \
+                                              data_for_challenge
+from challenges.services.challenge_services import ChallengeService
+
+
+@override_settings(MEDIA_ROOT=os.path.join(settings.MEDIA_ROOT, 'test'))
+class MediaTests(APITestCase):
+    """Tests for getting media files and their ranges."""
+
+    content = b'0123456789abcdefghij'
+
+    def setUp(self):
+        """Creates challenge with video example and video answer."""
+        clear_directory(os.path.join(settings.MEDIA_ROOT,
+                                     settings.VIDEO_BLOBS_DIR))
+
+        self.user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, self.user)
+        ChallengeService.update_video_example(
+            self.user, self.challenge,
+            SimpleUploadedFile('111.mp4', self.content))
+        self.challenge = Challenge.objects.get(id=self.challenge.id)
+        self.url = reverse('media', kwargs={
+            'name': self.challenge.video_example.name})
+
+        self.user2 = registrate_and_activate_user(signup_data2)
+        challenge_member2 = accept_challenge(self.user2, self.challenge)
+        challenge_answer = add_answer_on_challenge(
+            challenge_member2, self.challenge,
+            SimpleUploadedFile('111.mp4', b'video answer'))
+        self.answer_url = reverse('media', kwargs={
+            'name': challenge_answer.video_answer.name})
+
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
+    def test_get_whole_file(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Type'], 'video/mp4')
+
+    def test_get_range_of_file(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=5-9')
+        response2 = self.client.get(self.url, HTTP_RANGE='bytes=-3')
+        response3 = self.client.get(self.url, HTTP_RANGE='bytes=15-')
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b''.join(response.streaming_content), b'56789')
+        self.assertEqual(response['Content-Range'], 'bytes 5-9/20')
+        self.assertEqual(response['Content-Length'], '5')
+        self.assertEqual(b''.join(response2.streaming_content), b'hij')
+        self.assertEqual(b''.join(response3.streaming_content), b'fghij')
+
+    def test_get_range_out_of_file(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=20-30')
+
+        self.assertEqual(response.status_code,
+                         status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response['Content-Range'], 'bytes */20')
+
+    def test_get_range_if_file_was_changed(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=5-9',
+                                   HTTP_IF_RANGE='"other"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_get_not_modified_file(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_get_answer_of_active_challenge(self):
+        response = self.client.get(self.answer_url)
+        set_auth_headers(self, get_auth_headers(login_data))
+        response2 = self.client.get(self.answer_url)
+        set_auth_headers(self, get_auth_headers(login_data2))
+        response3 = self.client.get(self.answer_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response2.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response3.status_code, status.HTTP_200_OK)
+
+    def test_get_file_with_stale_credentials(self):
+        """Tests that invalid credentials make user anonymous."""
+        self.client.credentials(HTTP_TOKEN='stale', HTTP_SIGNATURE='stale',
+                                HTTP_ACCESS_TOKEN='stale')
+        response = self.client.get(self.url)
+        response2 = self.client.get(self.answer_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_answer_of_finished_challenge(self):
+        Challenge.objects.filter(id=self.challenge.id).update(is_active=False)
+        response = self.client.get(self.answer_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_unknown_file(self):
+        response = self.client.get(reverse('media', kwargs={
+            'name': 'videos/unknown.mp4'}))
+        response2 = self.client.get(reverse('media', kwargs={
+            'name': '../settings.py'}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response2.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(MEDIA_SENDFILE_HEADER='X-Accel-Redirect')
+    def test_get_file_by_front_proxy(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'],
+                         settings.MEDIA_ACCEL_REDIRECT_LOCATION +
+                         self.challenge.video_example.name)
+        self.assertEqual(response.content, b'')
@@ -0,0 +1,76 @@
+import uuid
+import decimal
+import datetime
+
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from config.renderers import ORJSONRenderer
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers,\
+                                         create_challenge, accept_challenge
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, data_for_challenge
+
+
+class ORJSONRendererTests(APITestCase):
+    """
+    Tests that ORJSONRenderer renders the same bytes
+    as JSONRenderer which was used before it.
+    """
+
+    def assertRenderedAsJSONRenderer(self, data) -> None:
+        self.assertEqual(ORJSONRenderer().render(data),
+                         JSONRenderer().render(data))
+
+    def test_render_values_which_json_encodes_natively(self):
+        self.assertRenderedAsJSONRenderer({
+            'name': 'Саша', 'amount': 50, 'rate': 4.5, 'is_active': True,
+            'video_answer_path': None, 'results': [1, 'two', [3]],
+        })
+
+    def test_render_values_which_need_encode_value(self):
+        self.assertRenderedAsJSONRenderer({
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'decimal': decimal.Decimal('4.5'),
+            'date': datetime.date(2023, 2, 2),
+            'time': datetime.time(18, 25, 43),
+            'datetime': datetime.datetime(2023, 2, 2, 18, 25, 43),
+            'timedelta': datetime.timedelta(minutes=1, seconds=30),
+            'lazy_string': gettext_lazy('This field is required.'),
+            'bytes': b'bytes',
+            'set': {1},
+            'tuple': (1, 2),
+        })
+
+    def test_render_none(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_render_unsupported_value(self):
+        with self.assertRaises(TypeError):
+            ORJSONRenderer().render({'object': object()})
+
+    def test_render_api_responses(self):
+        """Tests responses of challenges endpoints."""
+        user = registrate_and_activate_user(signup_data)
+        challenge = create_challenge(data_for_challenge, user)
+        accept_challenge(registrate_and_activate_user(signup_data2),
+                         challenge)
+        set_auth_headers(self, get_auth_headers(login_data))
+        kwargs = {'challenge_id': challenge.id}
+        requests = (
+            (reverse('challenges:get_challenges_list'), {'page_size': 1}),
+            (reverse('challenges:get_detail_challenge', kwargs=kwargs), {}),
+            (reverse('challenges:get_challenge_members', kwargs=kwargs),
+             {'with_count': 'true'}),
+            (reverse('users:users_list'), {}),
+        )
+        for url, params in requests:
+            response = self.client.get(url, params)
+            # page of challenges list is rendered by view and has no data.
+            data = getattr(response, 'data', None) or response.json()
+            self.assertEqual(response.content, JSONRenderer().render(data))
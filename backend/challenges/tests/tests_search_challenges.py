@@ -0,0 +1,83 @@
+from django.urls import reverse
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         create_challenge
+from services_for_tests.data_for_tests import signup_data, data_for_challenge
+
+
+class SearchChallengesTests(APITestCase):
+    """Tests for full-text search over challenges."""
+
+    def setUp(self):
+        self.user = registrate_and_activate_user(signup_data)
+
+        self.pushups_challenge = create_challenge(data_for_challenge, self.user)
+
+        data_for_challenge2 = data_for_challenge.copy()
+        data_for_challenge2['name'] = 'squats'
+        data_for_challenge2['goal'] = 'make 50 squats in one minute'
+        data_for_challenge2['description'] = 'squats without weight'
+        self.squats_challenge = create_challenge(data_for_challenge2, self.user)
+
+        data_for_challenge3 = data_for_challenge.copy()
+        data_for_challenge3['name'] = 'pushups and squats'
+        self.mixed_challenge = create_challenge(data_for_challenge3, self.user)
+
+        self.url = reverse('challenges:search')
+
+    def get_found_challenges_ids(self, response) -> list:
+        """Returns ids of challenges from response."""
+        return [challenge['challenge_id'] for challenge in response.data['results']]
+
+    def test_search_challenges_by_word(self):
+        """Tests that challenges with match in name go first."""
+        response = self.client.get(self.url, {'q': 'squats'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_found_challenges_ids(response),
+                         [self.squats_challenge.id, self.mixed_challenge.id])
+
+    def test_search_challenges_by_some_words(self):
+        """Tests that challenges must match all words of query."""
+        response = self.client.get(self.url, {'q': 'squats minute'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_found_challenges_ids(response),
+                         [self.squats_challenge.id])
+
+    def test_search_challenges_by_pages(self):
+        """Tests that search results are split on pages."""
+        response = self.client.get(self.url, {'q': 'squats', 'page_size': 1})
+        response2 = self.client.get(response.data['next'])
+        self.assertEqual(self.get_found_challenges_ids(response),
+                         [self.squats_challenge.id])
+        self.assertEqual(self.get_found_challenges_ids(response2),
+                         [self.mixed_challenge.id])
+        self.assertEqual(response2.data['next'], None)
+
+    def test_search_not_active_challenges(self):
+        """Tests that finished challenges aren't found."""
+        self.squats_challenge.is_active = False
+        self.squats_challenge.save()
+        response = self.client.get(self.url, {'q': 'squats'})
+        self.assertEqual(self.get_found_challenges_ids(response),
+                         [self.mixed_challenge.id])
+
+    def test_search_deleted_challenge(self):
+        """Tests that deleted challenge isn't found."""
+        self.squats_challenge.delete()
+        response = self.client.get(self.url, {'q': 'squats'})
+        self.assertEqual(self.get_found_challenges_ids(response),
+                         [self.mixed_challenge.id])
+
+    def test_search_with_fts_syntax_in_query(self):
+        """Tests that query with FTS syntax symbols is searched as words."""
+        response = self.client.get(self.url, {'q': 'squats" OR -(minute'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_found_challenges_ids(response), [])
+
+    def test_search_without_query(self):
+        """Tests search without query."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
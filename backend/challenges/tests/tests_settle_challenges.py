@@ -0,0 +1,117 @@
+from rest_framework.test import APITestCase
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         create_challenge, accept_challenge
+from services_for_tests.data_for_tests import signup_data, signup_data2, \
+                                              data_for_challenge
+
+from users.models import UserBalance
+
+from challenges.models import Challenge, ChallengeBalance, ChallengeWinner,\
+                              CoinTransaction
+from challenges.services.settlement_services import SettlementService
+
+
+class SettleChallengesTests(APITestCase):
+    """Tests for paying balances of finished challenges to winners."""
+
+    def setUp(self):
+        """Creates two finished challenges with two members."""
+        self.user = registrate_and_activate_user(signup_data)
+        self.user2 = registrate_and_activate_user(signup_data2)
+
+        self.challenge = create_challenge(data_for_challenge, self.user)
+        self.member2 = accept_challenge(self.user2, self.challenge)
+
+        data_for_challenge2 = data_for_challenge.copy()
+        data_for_challenge2['name'] = 'second_name'
+        data_for_challenge2['bet'] = 25
+        self.challenge2 = create_challenge(data_for_challenge2, self.user)
+        self.member2_2 = accept_challenge(self.user2, self.challenge2)
+
+        Challenge.objects.update(is_active=False)
+
+    def get_coins_amount(self, user) -> int:
+        return UserBalance.objects.get(user=user).coins_amount
+
+    def test_settle_challenges(self):
+        """Tests that winners get balance without fee."""
+        member = self.challenge.challengemember_set.get(user=self.user)
+        ChallengeWinner.objects.create(challenge=self.challenge,
+                                       challenge_member=self.member2)
+        ChallengeWinner.objects.create(challenge=self.challenge2,
+                                       challenge_member=member)
+        ChallengeWinner.objects.create(challenge=self.challenge2,
+                                       challenge_member=self.member2_2)
+        SettlementService.finalize_winners([self.challenge.id,
+                                            self.challenge2.id])
+
+        settled_amount = SettlementService.settle_challenges()
+        challenges = Challenge.objects.filter(is_settled=True)
+        fee = CoinTransaction.objects.filter(kind='fee').values_list(
+            'challenge_id', 'challenge_delta')
+
+        self.assertEqual(settled_amount, 2)
+        self.assertEqual(len(challenges), 2)
+        self.assertEqual(self.get_coins_amount(self.user), 22)
+        self.assertEqual(self.get_coins_amount(self.user2), 90 + 22)
+        self.assertEqual(
+            list(ChallengeBalance.objects.values_list('coins_amount',
+                                                      flat=True)), [0, 0])
+        self.assertEqual(sorted(fee), sorted([(self.challenge.id, -10),
+                                              (self.challenge2.id, -6)]))
+        self.assertEqual(SettlementService.settle_challenges(), 0)
+
+    def test_challenges_without_winners_are_not_settled(self):
+        """Tests that challenges wait until winners are chosen."""
+        ChallengeWinner.objects.create(challenge=self.challenge,
+                                       challenge_member=self.member2)
+        SettlementService.finalize_winners([self.challenge.id,
+                                            self.challenge2.id])
+
+        settled_amount = SettlementService.settle_challenges()
+
+        self.assertEqual(settled_amount, 1)
+        self.assertEqual(Challenge.objects.get(id=self.challenge2.id).is_settled,
+                         False)
+        self.assertEqual(ChallengeBalance.objects.get(
+            challenge=self.challenge2).coins_amount, 50)
+
+    def test_active_challenges_are_not_settled(self):
+        """Tests that active challenge isn't settled."""
+        Challenge.objects.filter(id=self.challenge.id).update(is_active=True)
+        ChallengeWinner.objects.create(challenge=self.challenge,
+                                       challenge_member=self.member2)
+        Challenge.objects.filter(id=self.challenge.id).update(
+            are_winners_finalized=True)
+
+        settled_amount = SettlementService.settle_challenges(
+            [self.challenge.id])
+
+        self.assertEqual(settled_amount, 0)
+        self.assertEqual(self.get_coins_amount(self.user2), 0)
+
+    def test_not_finalized_challenges_are_not_settled(self):
+        """
+        Tests that winner added after settlement run
+        gets a share when winners are finalized.
+        """
+        member = self.challenge.challengemember_set.get(user=self.user)
+        ChallengeWinner.objects.create(challenge=self.challenge,
+                                       challenge_member=self.member2)
+
+        settled_amount = SettlementService.settle_challenges()
+
+        self.assertEqual(settled_amount, 0)
+        self.assertEqual(self.get_coins_amount(self.user2), 0)
+
+        ChallengeWinner.objects.create(challenge=self.challenge,
+                                       challenge_member=member)
+        finalized_amount = SettlementService.finalize_winners(
+            [self.challenge.id])
+        settled_amount = SettlementService.settle_challenges()
+
+        self.assertEqual(finalized_amount, 1)
+        self.assertEqual(settled_amount, 1)
+        self.assertEqual(self.get_coins_amount(self.user), 45)
+        self.assertEqual(self.get_coins_amount(self.user2), 45)
@@ -11,11 +11,15 @@ from rest_framework import status
 
 from services_for_tests.for_tests import registrate_and_activate_user, \
                                          get_auth_headers, set_auth_headers,\
-                                         create_challenge, clear_directory
+                                         create_challenge, clear_directory,\
+                                         get_files_in_directory, \
+                                         delete_stored_videos
 from services_for_tests.data_for_tests import signup_data, login_data, \
                                               signup_data2, login_data2, \
                                               data_for_challenge
 
+from challenges.models import Challenge
+
 
 @override_settings(MEDIA_ROOT=os.path.join(settings.MEDIA_ROOT, 'test'),
                    MEDIA_URL='/media/test')
@@ -24,7 +28,7 @@ class UploadVideoExampleTests(APITestCase):
 
     def setUp(self):
         """Registrate, activate user."""
-        self.video_example_dir = os.path.join(settings.MEDIA_ROOT, 'video_examples/')
+        self.video_example_dir = os.path.join(settings.MEDIA_ROOT, settings.VIDEO_BLOBS_DIR)
         clear_directory(self.video_example_dir)
 
         user = registrate_and_activate_user(signup_data)
@@ -45,11 +49,15 @@ class UploadVideoExampleTests(APITestCase):
         kwargs = {'challenge_id': challenge.id}
         self.url = reverse('challenges:upload_video_example', kwargs=kwargs)
 
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
     def test_upload_video_correct(self):
         """Tests uploading video when all is good."""
         response = self.client.put(self.url, data=self.data,
                                    format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(files_in_dir), 1)
 
@@ -58,7 +66,7 @@ class UploadVideoExampleTests(APITestCase):
         self.client.credentials()
         response = self.client.put(self.url, data=self.data,
                                    format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -74,7 +82,7 @@ class UploadVideoExampleTests(APITestCase):
         data = {self.video_example_field_name: uploaded_file}
         response2 = self.client.put(self.url, data=data,
                                     format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response2.status_code, status.HTTP_200_OK)
         self.assertEqual(len(files_in_dir), 1)
@@ -83,7 +91,7 @@ class UploadVideoExampleTests(APITestCase):
         """Tests sending empty json file."""
         data = {}
         response = self.client.put(self.url, data=data, format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -91,7 +99,7 @@ class UploadVideoExampleTests(APITestCase):
         """Tests sending json without video file."""
         data = {self.video_example_field_name: ''}
         response = self.client.put(self.url, data=data, format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -106,7 +114,7 @@ class UploadVideoExampleTests(APITestCase):
 
         response = self.client.put(self.url, data=self.data,
                                    format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
@@ -115,9 +123,21 @@ class UploadVideoExampleTests(APITestCase):
         kwargs = {'challenge_id': 348}
         url = reverse('challenges:upload_video_example', kwargs=kwargs)
         response = self.client.put(url, data=self.data, format='multipart')
-        files_in_dir = os.listdir(self.video_example_dir)
+        files_in_dir = get_files_in_directory(self.video_example_dir)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(len(files_in_dir), 0)
 
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_upload_video_stored_in_temporary_file(self):
+        """Tests uploading video which django stored in temporary file."""
+        self.client.put(self.url, data=self.data, format='multipart')
+        self.data[self.video_example_field_name].seek(0)
+        uploaded_content = self.data[self.video_example_field_name].read()
 
+        challenge = Challenge.objects.get()
+        with open(challenge.video_example.path, 'rb') as video_example:
+            video_example_content = video_example.read()
+        files_in_dir = get_files_in_directory(self.video_example_dir)
 
+        self.assertEqual(video_example_content, uploaded_content)
+        self.assertEqual(len(files_in_dir), 1)
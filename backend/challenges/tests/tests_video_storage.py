@@ -0,0 +1,116 @@
+import os
+import datetime
+
+from django.test import override_settings
+from django.conf import settings
+from django.db import transaction
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from rest_framework.test import APITestCase
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         create_challenge, clear_directory,\
+                                         get_files_in_directory, \
+                                         delete_stored_videos
+from services_for_tests.data_for_tests import signup_data, data_for_challenge
+
+from challenges.models import Challenge, VideoBlob
+from challenges.services.challenge_services import ChallengeService
+from challenges.services.video_storage_services import VideoStorageService
+
+
+@override_settings(MEDIA_ROOT=os.path.join(settings.MEDIA_ROOT, 'test'),
+                   MEDIA_URL='/media/test/')
+class VideoStorageTests(APITestCase):
+    """Tests for content-addressed storage of videos."""
+
+    def setUp(self):
+        """Creates two challenges with the same video example."""
+        self.video_blob_dir = os.path.join(settings.MEDIA_ROOT,
+                                           settings.VIDEO_BLOBS_DIR)
+        clear_directory(self.video_blob_dir)
+
+        self.user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, self.user)
+        data = data_for_challenge.copy()
+        data['name'] = 'second_name'
+        self.challenge2 = create_challenge(data, self.user)
+
+        for challenge in (self.challenge, self.challenge2):
+            ChallengeService.update_video_example(
+                self.user, challenge, self.get_video(b'same video'))
+
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
+    def get_video(self, content: bytes) -> SimpleUploadedFile:
+        return SimpleUploadedFile('111.mp4', content,
+                                  content_type='multipart/form-data')
+
+    def test_same_videos_are_stored_once(self):
+        """Tests that video with the same content is stored once."""
+        challenge = Challenge.objects.get(id=self.challenge.id)
+        challenge2 = Challenge.objects.get(id=self.challenge2.id)
+        blob = VideoBlob.objects.get()
+
+        self.assertEqual(challenge.video_example.name,
+                         challenge2.video_example.name)
+        self.assertEqual(challenge.video_example.name,
+                         VideoStorageService.get_blob_name(blob.sha256))
+        self.assertEqual(blob.references_amount, 2)
+        self.assertEqual(len(get_files_in_directory(self.video_blob_dir)), 1)
+
+    def test_stored_video_permissions(self):
+        """Tests that stored video isn't left with mode of temporary file."""
+        name = Challenge.objects.get(id=self.challenge.id).video_example.name
+        mode = os.stat(os.path.join(settings.MEDIA_ROOT, name)).st_mode
+
+        self.assertEqual(mode & 0o777,
+                         settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+
+    def test_replaced_and_deleted_videos_are_released(self):
+        """Tests that references of replaced or deleted videos are uncounted."""
+        ChallengeService.update_video_example(
+            self.user, self.challenge, self.get_video(b'other video'))
+        Challenge.objects.get(id=self.challenge2.id).delete()
+
+        references_amount = dict(VideoBlob.objects.values_list(
+            'size', 'references_amount'))
+
+        self.assertEqual(references_amount, {len(b'same video'): 0,
+                                             len(b'other video'): 1})
+
+    def test_delete_unreferenced_blobs(self):
+        """Tests that only old unreferenced blobs are deleted."""
+        Challenge.objects.all().delete()
+        deleted_amount = VideoStorageService.delete_unreferenced_blobs()
+        VideoBlob.objects.update(
+            updated_at=datetime.datetime.now() - datetime.timedelta(days=1))
+        deleted_amount2 = VideoStorageService.delete_unreferenced_blobs()
+
+        self.assertEqual(deleted_amount, 0)
+        self.assertEqual(deleted_amount2, 1)
+        self.assertEqual(VideoBlob.objects.exists(), False)
+        self.assertEqual(get_files_in_directory(self.video_blob_dir), [])
+
+    def test_delete_orphaned_files(self):
+        """Tests that files stored by rolled back transaction are deleted."""
+        try:
+            with transaction.atomic():
+                VideoStorageService.store_video(self.get_video(b'other video'))
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        deleted_amount = VideoStorageService.delete_orphaned_files()
+        old_timestamp = (datetime.datetime.now() -
+                         datetime.timedelta(days=1)).timestamp()
+        for file_path in get_files_in_directory(self.video_blob_dir):
+            os.utime(file_path, (old_timestamp, old_timestamp))
+        deleted_amount2 = VideoStorageService.delete_orphaned_files()
+        name = Challenge.objects.get(id=self.challenge.id).video_example.name
+
+        self.assertEqual(deleted_amount, 0)
+        self.assertEqual(deleted_amount2, 1)
+        self.assertEqual(get_files_in_directory(self.video_blob_dir),
+                         [os.path.join(settings.MEDIA_ROOT, name)])
@@ -0,0 +1,185 @@
+import os
+
+from django.test import override_settings
+from django.conf import settings
+from django.urls import reverse
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from services_for_tests.for_tests import registrate_and_activate_user, \
+                                         get_auth_headers, set_auth_headers,\
+                                         create_challenge, clear_directory,\
+                                         accept_challenge, delete_stored_videos
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2, login_data2, \
+                                              data_for_challenge
+
+from challenges.models import Challenge, ChallengeAnswer, VideoBlob, \
+                              VideoUploadSession
+from challenges.services.video_upload_services import VideoUploadService
+
+
+@override_settings(MEDIA_ROOT=os.path.join(settings.MEDIA_ROOT, 'test'),
+                   MEDIA_URL='/media/test/')
+class VideoUploadTests(APITestCase):
+    """Class for tests uploading videos by chunks."""
+
+    content_type = 'application/offset+octet-stream'
+
+    def setUp(self):
+        """Creates challenge and reads video which will be uploaded."""
+        self.video_blob_dir = os.path.join(settings.MEDIA_ROOT,
+                                           settings.VIDEO_BLOBS_DIR)
+        self.video_upload_dir = os.path.join(settings.MEDIA_ROOT,
+                                             settings.VIDEO_UPLOADS_DIR)
+        for directory in (self.video_blob_dir, self.video_upload_dir):
+            clear_directory(directory)
+
+        self.user = registrate_and_activate_user(signup_data)
+        self.challenge = create_challenge(data_for_challenge, self.user)
+
+        source_file_path = os.path.join(settings.MEDIA_ROOT,
+                                        'video_source/111.mp4')
+        with open(source_file_path, 'rb') as source_file:
+            self.video = source_file.read()
+
+        auth_headers = get_auth_headers(login_data)
+        set_auth_headers(self, auth_headers)
+
+    def tearDown(self):
+        """Deletes videos stored by test."""
+        delete_stored_videos()
+
+    def create_upload(self, target: str = 'video_example'):
+        kwargs = {'challenge_id': self.challenge.id}
+        url = reverse('challenges:create_video_upload', kwargs=kwargs)
+        data = {'target': target, 'size': len(self.video)}
+        return self.client.post(url, data=data)
+
+    def put_chunk(self, upload_id: str, start: int, end: int):
+        url = reverse('challenges:video_upload',
+                      kwargs={'upload_id': upload_id})
+        return self.client.put(url, data=self.video[start:end],
+                               content_type=self.content_type,
+                               HTTP_UPLOAD_OFFSET=str(start))
+
+    def finalize_upload(self, upload_id: str):
+        url = reverse('challenges:finalize_video_upload',
+                      kwargs={'upload_id': upload_id})
+        return self.client.post(url)
+
+    def test_upload_video_example_by_chunks(self):
+        """Tests uploading video example by two chunks."""
+        upload_id = self.create_upload().data['upload_id']
+        response = self.put_chunk(upload_id, 0, 1000)
+        response2 = self.put_chunk(upload_id, 1000, len(self.video))
+        response3 = self.finalize_upload(upload_id)
+
+        challenge = Challenge.objects.get()
+        with open(challenge.video_example.path, 'rb') as video_example:
+            video_example_content = video_example.read()
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response['Upload-Offset'], '1000')
+        self.assertEqual(response2['Upload-Offset'], str(len(self.video)))
+        self.assertEqual(response3.status_code, status.HTTP_200_OK)
+        self.assertEqual(video_example_content, self.video)
+        self.assertEqual(VideoUploadSession.objects.exists(), False)
+        self.assertEqual(os.listdir(self.video_upload_dir), [])
+
+    def test_finalize_moves_staging_file(self):
+        """Tests that staging file is renamed without copying."""
+        upload_id = self.create_upload().data['upload_id']
+        self.put_chunk(upload_id, 0, len(self.video))
+        staging_file_path = os.path.join(self.video_upload_dir,
+                                         f'{upload_id}.part')
+        staging_file_inode = os.stat(staging_file_path).st_ino
+
+        self.finalize_upload(upload_id)
+        challenge = Challenge.objects.get()
+
+        self.assertEqual(os.stat(challenge.video_example.path).st_ino,
+                         staging_file_inode)
+        self.assertEqual(os.path.exists(staging_file_path), False)
+
+    def test_finalize_upload_once(self):
+        """Tests that only one of concurrent finalizations attaches video."""
+        upload_id = self.create_upload().data['upload_id']
+        self.put_chunk(upload_id, 0, len(self.video))
+        session = VideoUploadSession.objects.get()
+
+        is_finalized = VideoUploadService.finalize(session)
+        is_finalized2 = VideoUploadService.finalize(session)
+
+        self.assertEqual(is_finalized, True)
+        self.assertEqual(is_finalized2, False)
+        self.assertEqual(VideoBlob.objects.get().references_amount, 1)
+
+    def test_resume_upload(self):
+        """Tests getting offset of upload to resume it."""
+        upload_id = self.create_upload().data['upload_id']
+        self.put_chunk(upload_id, 0, 1000)
+        url = reverse('challenges:video_upload',
+                      kwargs={'upload_id': upload_id})
+
+        response = self.client.get(url)
+        response2 = self.client.head(url)
+
+        self.assertEqual(response.data, {'offset': 1000,
+                                         'size': len(self.video)})
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2['Upload-Offset'], '1000')
+
+    def test_upload_chunk_with_wrong_offset(self):
+        """Tests that chunk which doesn't start at offset is rejected."""
+        upload_id = self.create_upload().data['upload_id']
+        self.put_chunk(upload_id, 0, 1000)
+        response = self.put_chunk(upload_id, 500, 1500)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['offset'], 1000)
+
+    def test_finalize_not_completed_upload(self):
+        """Tests that upload can't be finalized before all chunks."""
+        upload_id = self.create_upload().data['upload_id']
+        self.put_chunk(upload_id, 0, 1000)
+        response = self.finalize_upload(upload_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(bool(Challenge.objects.get().video_example), False)
+
+    def test_upload_video_answer_by_chunks(self):
+        """Tests uploading video answer by one chunk."""
+        upload_id = self.create_upload('video_answer').data['upload_id']
+        self.put_chunk(upload_id, 0, len(self.video))
+        response = self.finalize_upload(upload_id)
+
+        challenge_answer = ChallengeAnswer.objects.get()
+        with open(challenge_answer.video_answer.path, 'rb') as video_answer:
+            video_answer_content = video_answer.read()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(video_answer_content, self.video)
+
+    def test_create_upload_of_video_example_by_not_creator(self):
+        """Tests that only creator can upload video example."""
+        user2 = registrate_and_activate_user(signup_data2)
+        accept_challenge(user2, self.challenge)
+        set_auth_headers(self, get_auth_headers(login_data2))
+
+        response = self.create_upload()
+        response2 = self.create_upload('video_answer')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response2.status_code, status.HTTP_201_CREATED)
+
+    def test_upload_chunk_of_other_user(self):
+        """Tests that user can't upload chunks to upload of other user."""
+        upload_id = self.create_upload().data['upload_id']
+        registrate_and_activate_user(signup_data2)
+        set_auth_headers(self, get_auth_headers(login_data2))
+
+        response = self.put_chunk(upload_id, 0, 1000)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
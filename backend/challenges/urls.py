@@ -12,6 +12,8 @@ urlpatterns = [
          views.AcceptChallengeView.as_view(), name='accept_challenge'),
     path('get_challenges_list/', views.GetChallengesListView.as_view(),
          name='get_challenges_list'),
+    path('search/', views.SearchChallengesView.as_view(),
+         name='search'),
     path('get_detail_challenge/<int:challenge_id>/',
          views.GetDetailChallengeView.as_view(), name='get_detail_challenge'),
     path('get_challenge_members/<int:challenge_id>/',
@@ -20,4 +22,10 @@ urlpatterns = [
          views.AddAnswerOnChallengeView.as_view(), name='add_answer_on_challenge'),
     path('get_challenge_answers/<int:challenge_id>/',
          views.GetChallengeAnswersView.as_view(), name='get_challenge_answers'),
+    path('create_video_upload/<int:challenge_id>/',
+         views.CreateVideoUploadView.as_view(), name='create_video_upload'),
+    path('video_upload/<uuid:upload_id>/',
+         views.VideoUploadView.as_view(), name='video_upload'),
+    path('finalize_video_upload/<uuid:upload_id>/',
+         views.FinalizeVideoUploadView.as_view(), name='finalize_video_upload'),
 ]
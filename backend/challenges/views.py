@@ -1,4 +1,11 @@
-import json
+import io
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, Http404
+from django.http.response import HttpResponseBase
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -6,16 +13,37 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import FileUploadParser
 
-from .models import Challenge, ChallengeBalance, ChallengeMember, ChallengeAnswer
+from .models import Challenge, ChallengeBalance, ChallengeMember
 from .serializers import CreateChallengeSerializer, GetChallengesListSerializer,\
                          GetDitailChallengeInfoSerializer, GetChallengeMembersSerializer,\
-                         GetChallengeAnswersSerializer
+                         GetChallengeAnswersSerializer, SearchChallengesSerializer,\
+                         GetChallengesListFilterSerializer,\
+                         GetChallengeMembersParamsSerializer,\
+                         GetChallengeAnswersParamsSerializer,\
+                         CreateVideoUploadSerializer
 from .services.challenge_services import ChallengeService
 from .services.challenge_answer_services import ChallengeAnswerService
 from .services.uploading_file_services import UploadFileService
 from .services.challenge_member_services import ChallengeMemberService
+from .services.cache_services import ChallengesListCacheService
+from .services.conditional_request_services import \
+    ChallengeConditionalRequestService
+from .services.search_services import ChallengeSearchService
+from .services.coin_transfer_services import CoinTransferService
+from .services.coin_ledger_services import CoinLedgerService
+from .services.expiry_services import ChallengeExpiryService
+from .services.video_upload_services import VideoUploadService
+from .services.media_services import MediaService
+from .pagination import ChallengesFeedPagination, ChallengesSearchPagination,\
+                        ChallengeMembersPagination, ChallengeAnswersPagination
 
 from users.services.user_services import UserService
+from users.authentication import OptionalTokenAndSignatureAuthentication, \
+                                 OptionalAccessTokenAuthentication
+
+from config.renderers import ORJSONRenderer
+from config.responses import StreamingJSONResponse
+from config.media import serve_file, MediaContentNegotiation
 
 
 class CreateChallengeView(APIView):
@@ -35,19 +63,29 @@ class CreateChallengeView(APIView):
             data = {'message': 'user already has challenge with this name'}
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
-        if not UserService.has_user_enough_coins(user, serializer.data['bet']):
-            data = {'message': 'user hasn\'t enough coins for create challenge'}
-            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
-
-        try:
-            challenge = ChallengeService.create_challenge(serializer.data, user)
-        except:
-            data = {'message': 'creating challenge error'}
-            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
-
-        ChallengeBalance(challenge=challenge, coins_amount=challenge.bet).save()
-        UserService.withdraw_coins_from_user(user, challenge.bet)
-        ChallengeMember(user=user, challenge=challenge).save()
+        with transaction.atomic():
+            if not UserService.withdraw_coins_from_user(
+                   user, serializer.data['bet']):
+                data = {'message': 'user hasn\'t enough coins for create challenge'}
+                return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+            try:
+                challenge = ChallengeService.create_challenge(serializer.data,
+                                                              user)
+            except:
+                transaction.set_rollback(True)
+                data = {'message': 'creating challenge error'}
+                return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+            ChallengeBalance(challenge=challenge,
+                             coins_amount=challenge.bet).save()
+            if not ChallengeService.is_challenge_free(challenge):
+                CoinLedgerService.record_transaction(
+                    'create', user=user, challenge=challenge,
+                    user_delta=-challenge.bet, challenge_delta=challenge.bet)
+            ChallengeMemberService.add_challenge_member(user, challenge)
+            transaction.on_commit(ChallengeExpiryService.schedule_next_expiry)
+        ChallengesListCacheService.bump_version()
 
         return Response(status=status.HTTP_200_OK)
 
@@ -102,14 +140,21 @@ class AcceptChallengeView(APIView):
             data = {'message': 'user have already accepted this challenge'}
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
-        if not UserService.has_user_enough_coins(user, challenge.bet):
-            data = {'message': 'user hasn\'t enough coins for accept challenge'}
+        try:
+            with transaction.atomic():
+                # member is added first, so concurrent second accept of
+                # the same user fails by unique constraint before coins.
+                ChallengeMemberService.add_challenge_member(user, challenge)
+                if (not ChallengeService.is_challenge_free(challenge) and
+                        not CoinTransferService.transfer_from_user_to_challenge(
+                            user, challenge, challenge.bet)):
+                    transaction.set_rollback(True)
+                    data = {'message': 'user hasn\'t enough coins for accept challenge'}
+                    return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+        except IntegrityError:
+            data = {'message': 'user have already accepted this challenge'}
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
-
-        ChallengeMember(user=user, challenge=challenge).save()
-        if not ChallengeService.is_challenge_free(challenge):
-            UserService.withdraw_coins_from_user(user, challenge.bet)
-            ChallengeService.add_coins_for_challenge(challenge, challenge.bet)
+        ChallengesListCacheService.bump_version()
 
         return Response(status=status.HTTP_200_OK)
 
@@ -117,13 +162,50 @@ class AcceptChallengeView(APIView):
 class GetChallengesListView(APIView):
     """View for getting active challenges list."""
 
-    def get(self, request) -> Response:
-        """Returns list of active challenges."""
-        queryset = Challenge.objects.all().filter(is_active=True)
-        serializer = GetChallengesListSerializer(queryset, many=True)
-        challenges_list = json.loads(json.dumps(serializer.data))
+    pagination_class = ChallengesFeedPagination
 
-        return Response(data=challenges_list, status=status.HTTP_200_OK)
+    def get(self, request) -> HttpResponse:
+        """
+        Returns filtered and sorted page of active challenges list.
+        Rendered page is cached until challenges list is changed.
+        """
+        page_key = ChallengesListCacheService.get_page_key(request)
+        content = ChallengesListCacheService.get_page(page_key)
+        if content is None:
+            filter_serializer = GetChallengesListFilterSerializer(
+                data=request.query_params.dict())
+            filter_serializer.is_valid(raise_exception=True)
+            filters = filter_serializer.validated_data
+            queryset = ChallengeService.filter_challenges(
+                ChallengeService.get_active_challenges(), filters)
+            paginator = self.pagination_class()
+            paginator.set_ordering(filters['ordering'])
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            serializer = GetChallengesListSerializer(page, many=True)
+            content = ORJSONRenderer().render(
+                paginator.get_paginated_data(serializer.data))
+            ChallengesListCacheService.set_page(page_key, content)
+
+        return HttpResponse(content, content_type='application/json',
+                            status=status.HTTP_200_OK)
+
+
+class SearchChallengesView(APIView):
+    """View for full-text search over active challenges."""
+
+    pagination_class = ChallengesSearchPagination
+
+    def get(self, request) -> Response:
+        """Returns page of active challenges that match query."""
+        query_serializer = SearchChallengesSerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        queryset = ChallengeSearchService.search(
+            ChallengeService.get_active_challenges(),
+            query_serializer.validated_data['q'])
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = GetChallengesListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class GetDetailChallengeView(APIView):
@@ -131,6 +213,9 @@ class GetDetailChallengeView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(condition(
+        etag_func=ChallengeConditionalRequestService.get_etag,
+        last_modified_func=ChallengeConditionalRequestService.get_last_modified))
     def get(self, request, challenge_id: int) -> Response:
         """Return detail information about challenge."""
         challenge = ChallengeService.get_challenge(challenge_id)
@@ -145,17 +230,40 @@ class GetChallengeMembersView(APIView):
     """View for getting challenge members."""
 
     permission_classes = [IsAuthenticated]
+    pagination_class = ChallengeMembersPagination
 
-    def get(self, request, challenge_id: int) -> Response:
-        """Returns list challenge members."""
+    @method_decorator(condition(
+        etag_func=ChallengeConditionalRequestService.get_members_etag,
+        last_modified_func=(
+            ChallengeConditionalRequestService.get_members_last_modified)))
+    def get(self, request, challenge_id: int) -> HttpResponseBase:
+        """
+        Returns page of challenge members and, if it was
+        requested, amount of all challenge members. Staff can
+        export all members as json array which is streamed by chunks.
+        """
+        params_serializer = GetChallengeMembersParamsSerializer(
+            data=request.query_params.dict())
+        params_serializer.is_valid(raise_exception=True)
         challenge = ChallengeService.get_challenge(challenge_id)
         if not challenge:
             data = {'message': 'There isn\'t challenge with given id'}
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
-        queryset = ChallengeMember.objects.all().filter(challenge=challenge)
-        serializer = GetChallengeMembersSerializer(queryset, many=True)
-        challenge_members = json.loads(json.dumps(serializer.data))
-        return Response(data=challenge_members, status=status.HTTP_200_OK)
+        queryset = ChallengeMemberService.get_challenge_members(challenge)
+        if params_serializer.validated_data['export']:
+            if not request.user.is_staff:
+                data = {'message': 'Only staff can export challenge members'}
+                return Response(data=data, status=status.HTTP_403_FORBIDDEN)
+            return StreamingJSONResponse(
+                queryset.order_by('id'),
+                get_item=GetChallengeMembersSerializer().to_representation)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = GetChallengeMembersSerializer(page, many=True)
+        data = paginator.get_paginated_data(serializer.data)
+        if params_serializer.validated_data['with_count']:
+            data['count'] = challenge.members_amount
+        return Response(data=data, status=status.HTTP_200_OK)
 
 
 class AddAnswerOnChallengeView(APIView):
@@ -198,18 +306,36 @@ class GetChallengeAnswersView(APIView):
     """View for getting challenge answers."""
 
     permission_classes = [IsAuthenticated]
+    pagination_class = ChallengeAnswersPagination
 
-    def get(self, request, challenge_id: int) -> Response:
+    @method_decorator(condition(
+        etag_func=ChallengeConditionalRequestService.get_answers_etag,
+        last_modified_func=(
+            ChallengeConditionalRequestService.get_answers_last_modified)))
+    def get(self, request, challenge_id: int) -> HttpResponseBase:
         """
-        If challenge is active returns only answer that belongs
-        to current member else return all answers of challenge
+        If challenge is active returns only answer that belongs to
+        current member else returns page of all answers of challenge.
+        Staff can export all answers as json array streamed by chunks.
         """
+        params_serializer = GetChallengeAnswersParamsSerializer(
+            data=request.query_params.dict())
+        params_serializer.is_valid(raise_exception=True)
         user = request.user
         challenge = ChallengeService.get_challenge(challenge_id)
         if not challenge:
             data = {'message': 'There isn\'t challenge with given id'}
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
+        if params_serializer.validated_data['export']:
+            if not user.is_staff:
+                data = {'message': 'Only staff can export challenge answers'}
+                return Response(data=data, status=status.HTTP_403_FORBIDDEN)
+            queryset = ChallengeAnswerService.get_challenge_answers(challenge)
+            return StreamingJSONResponse(
+                queryset.order_by('id'),
+                get_item=GetChallengeAnswersSerializer().to_representation)
+
         challenge_member = ChallengeMemberService.get_challenge_member(
             user, challenge)
         if not challenge_member:
@@ -217,20 +343,131 @@ class GetChallengeAnswersView(APIView):
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         if challenge.is_active:
-            challenge_answer_queryset = ChallengeAnswer.objects.filter(
-                challenge=challenge, challenge_member=challenge_member)
-            serializer = GetChallengeAnswersSerializer(
-                challenge_answer_queryset, many=True)
+            queryset = ChallengeAnswerService.get_challenge_answers(
+                challenge, challenge_member)
         else:
-            all_challenge_answers_queryset = ChallengeAnswer.objects.filter(
-                challenge=challenge)
-            serializer = GetChallengeAnswersSerializer(
-                all_challenge_answers_queryset, many=True)
-        data = json.loads(json.dumps(serializer.data))
-        return Response(data=data, status=status.HTTP_200_OK)
+            queryset = ChallengeAnswerService.get_challenge_answers(challenge)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = GetChallengeAnswersSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class CreateVideoUploadView(APIView):
+    """View for starting upload of video by chunks."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, challenge_id: int) -> Response:
+        """Creates upload session for video example or video answer."""
+        serializer = CreateVideoUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = request.user
+        challenge = ChallengeService.get_challenge(challenge_id)
+        if not challenge:
+            data = {'message': 'There isn\'t challenge with given id'}
+            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+        target = serializer.validated_data['target']
+        message = VideoUploadService.get_target_error(user, challenge, target)
+        if message:
+            data = {'message': message}
+            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+        session = VideoUploadService.create_session(
+            user, challenge, target, serializer.validated_data['size'])
+        data = {'upload_id': str(session.id), 'offset': session.offset}
+        return Response(data=data, status=status.HTTP_201_CREATED)
 
 
+class VideoUploadView(APIView):
+    """View for uploading chunks of video."""
 
+    permission_classes = [IsAuthenticated]
 
+    def get(self, request, upload_id: str) -> Response:
+        """
+        Returns amount of received bytes, from which next chunk must
+        start. HEAD request returns it only in Upload-Offset header.
+        """
+        session = VideoUploadService.get_session(upload_id, request.user)
+        if not session:
+            data = {'message': 'There isn\'t upload with given id'}
+            return Response(data=data, status=status.HTTP_404_NOT_FOUND)
+
+        data = {'offset': session.offset, 'size': session.size}
+        headers = {'Upload-Offset': str(session.offset),
+                   'Upload-Length': str(session.size)}
+        return Response(data=data, headers=headers)
+
+    def put(self, request, upload_id: str) -> Response:
+        """Writes chunk from request body at offset from Upload-Offset header."""
+        session = VideoUploadService.get_session(upload_id, request.user)
+        if not session:
+            data = {'message': 'There isn\'t upload with given id'}
+            return Response(data=data, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            offset = int(request.headers['Upload-Offset'])
+        except (KeyError, ValueError):
+            data = {'message': 'Upload-Offset header is required.'}
+            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+        stream = request.stream or io.BytesIO()
+        new_offset = VideoUploadService.write_chunk(session, offset, stream)
+        if new_offset is None:
+            data = {'message': 'chunk doesn\'t match offset or size of upload',
+                    'offset': session.offset}
+            return Response(data=data, status=status.HTTP_409_CONFLICT)
+        headers = {'Upload-Offset': str(new_offset)}
+        return Response(status=status.HTTP_204_NO_CONTENT, headers=headers)
+
+
+class FinalizeVideoUploadView(APIView):
+    """View for finishing upload of video by chunks."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, upload_id: str) -> Response:
+        """Attaches uploaded video to challenge or challenge answer."""
+        session = VideoUploadService.get_session(upload_id, request.user)
+        if not session:
+            data = {'message': 'There isn\'t upload with given id'}
+            return Response(data=data, status=status.HTTP_404_NOT_FOUND)
+
+        if session.offset != session.size:
+            data = {'message': 'video isn\'t uploaded completely.',
+                    'offset': session.offset}
+            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+        message = VideoUploadService.get_target_error(
+            request.user, session.challenge, session.target)
+        if message:
+            data = {'message': message}
+            return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+
+        if not VideoUploadService.finalize(session):
+            data = {'message': 'There isn\'t upload with given id'}
+            return Response(data=data, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_200_OK)
 
 
+class MediaView(APIView):
+    """
+    View for getting media files. Supports Range requests, so video
+    players can seek. Video answers are hidden until challenge ends.
+    Media is public, credentials only reveal hidden answers of their
+    author, so invalid or stale credentials make user anonymous
+    instead of failing request with 401/403.
+    """
+
+    authentication_classes = [OptionalTokenAndSignatureAuthentication,
+                              OptionalAccessTokenAuthentication]
+    content_negotiation_class = MediaContentNegotiation
+
+    def get(self, request, name: str) -> HttpResponseBase:
+        """Returns media file or its requested range."""
+        if not MediaService.can_user_get_file(request.user, name):
+            raise Http404
+        return serve_file(request, settings.MEDIA_ROOT, name,
+                          etag=MediaService.get_etag(name))
@@ -0,0 +1,53 @@
+import time
+import threading
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LocalLRUCache:
+    """
+    Bounded in-process cache. Least recently used items are evicted
+    when cache is full, items expire after timeout. It is in front
+    of shared cache, so timeout bounds how long other processes
+    can use value which was deleted in shared cache.
+    """
+
+    def __init__(self, max_size: int, timeout: float):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns value of key or default if there isn't fresh value."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+            expiration_time, value = item
+            if expiration_time <= time.monotonic():
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Sets value of key, evicts least recently used items."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.timeout, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Deletes key from cache."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Deletes all keys."""
+        with self._lock:
+            self._items.clear()
@@ -11,8 +11,29 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 app.conf.beat_schedule = {
+    # challenges are finished by scheduled tasks, this is safety net.
     'make_challenges_not_active': {
         'task': 'challenges.tasks.make_challenges_not_active',
+        'schedule': crontab(minute='*/15'),
+    },
+    'fold_challenge_balance_shards': {
+        'task': 'challenges.tasks.fold_challenge_balance_shards',
         'schedule': crontab(minute='*/1'),
-    }
+    },
+    'make_coin_balances_snapshots': {
+        'task': 'challenges.tasks.make_coin_balances_snapshots',
+        'schedule': crontab(minute=0),
+    },
+    'settle_finished_challenges': {
+        'task': 'challenges.tasks.settle_finished_challenges',
+        'schedule': crontab(minute='*/10'),
+    },
+    'delete_expired_video_uploads': {
+        'task': 'challenges.tasks.delete_expired_video_uploads',
+        'schedule': crontab(minute=30),
+    },
+    'delete_unreferenced_video_blobs': {
+        'task': 'challenges.tasks.delete_unreferenced_video_blobs',
+        'schedule': crontab(minute=45),
+    },
 }
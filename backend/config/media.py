@@ -0,0 +1,178 @@
+import os
+import re
+import mimetypes
+
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponse, Http404
+from django.http.response import HttpResponseBase
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from rest_framework.negotiation import BaseContentNegotiation
+
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(Exception):
+    """Requested range is out of file."""
+
+
+class RangeFileWrapper:
+    """
+    File-like object which reads only given range of file. It has
+    fileno and is positioned at start of range, so wsgi server with
+    file wrapper (e.g. gunicorn) sends range by os.sendfile.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class MediaContentNegotiation(BaseContentNegotiation):
+    """
+    Negotiation for views which return files. Accept header of video
+    players isn't checked, errors are rendered by first renderer.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[tuple]:
+    """
+    Returns first and last byte of requested range or None if whole
+    file must be returned. Only single range is supported, other
+    ranges are ignored as HTTP allows.
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.replace(' ', ''))
+    if not match or match.groups() == ('', ''):
+        return None
+
+    start, end = match.groups()
+    if not start:
+        suffix_length = int(end)
+        if not suffix_length:
+            raise RangeNotSatisfiable
+        return max(size - suffix_length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable
+    if start > end:
+        return None
+    return start, end
+
+
+def is_range_allowed(request, etag: str, last_modified: int) -> bool:
+    """Returns False if If-Range header doesn't match current file."""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    return if_range in (etag, http_date(last_modified))
+
+
+def get_sendfile_response(name: str, file_path: str) -> HttpResponse:
+    """Returns response which file is sent by front proxy."""
+    response = HttpResponse()
+    if settings.MEDIA_SENDFILE_HEADER == 'X-Accel-Redirect':
+        response['X-Accel-Redirect'] = (
+            settings.MEDIA_ACCEL_REDIRECT_LOCATION + name)
+    else:
+        response[settings.MEDIA_SENDFILE_HEADER] = file_path
+    return response
+
+
+def serve_file(request, root: str, name: str,
+               etag: Optional[str] = None) -> HttpResponseBase:
+    """
+    Returns file from root directory. Supports conditional requests,
+    Range and If-Range headers. If MEDIA_SENDFILE_HEADER is set
+    file is sent by front proxy after checks in django.
+    """
+    try:
+        file_path = safe_join(root, name)
+    except SuspiciousFileOperation:
+        raise Http404
+    try:
+        stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404
+    if not os.path.isfile(file_path):
+        raise Http404
+
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    etag = quote_etag(etag or f'{stat.st_mtime_ns:x}-{size:x}')
+    content_type = mimetypes.guess_type(file_path)[0] or \
+        'application/octet-stream'
+
+    response = get_conditional_response(request, etag=etag,
+                                        last_modified=last_modified)
+    if response is not None:
+        return response
+
+    if settings.MEDIA_SENDFILE_HEADER:
+        response = get_sendfile_response(name, file_path)
+        response['Content-Type'] = content_type
+    else:
+        response = get_file_response(request, file_path, size, etag,
+                                     last_modified, content_type)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def get_file_response(request, file_path: str, size: int, etag: str,
+                      last_modified: int, content_type: str
+                      ) -> HttpResponseBase:
+    """Returns whole file or its requested range."""
+    byte_range = None
+    if is_range_allowed(request, etag, last_modified):
+        try:
+            byte_range = parse_range_header(request.headers.get('Range'),
+                                            size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    file = open(file_path, 'rb')
+    if byte_range is None:
+        return FileResponse(file, content_type=content_type)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = FileResponse(RangeFileWrapper(file, start, length),
+                            status=206, content_type=content_type)
+    response['Content-Length'] = str(length)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
@@ -0,0 +1,131 @@
+import base64
+import binascii
+import datetime
+import json
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.db.models.query import QuerySet
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination by opaque cursor that keeps values of ordering fields
+    of the last returned row. Next page is selected by these values
+    (not by offset), so page N costs the same as the first page.
+    Last field of ordering must be unique (for example 'id').
+    """
+
+    ordering = ('id',)
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> list:
+        """Returns rows of current page."""
+        self.request = request
+        self.current_page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.get_position_filter(position))
+            except (ValidationError, ValueError, TypeError):
+                # values of forged cursor don't fit ordering fields.
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = list(queryset[:self.current_page_size + 1])
+        page = rows[:self.current_page_size]
+        if len(rows) > self.current_page_size:
+            self.next_position = self.get_position(page[-1])
+        else:
+            self.next_position = None
+        return page
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Returns response with page and link to the next page."""
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data: list) -> OrderedDict:
+        """Returns page with link to the next page."""
+        return OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ])
+
+    def get_page_size(self, request) -> int:
+        """Returns page size requested by client but not bigger than max."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self) -> Optional[str]:
+        """Returns url of the next page or None if it is the last page."""
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        cursor = self.encode_cursor(self.next_position)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_position(self, row: Any) -> list:
+        """Returns values of ordering fields of given row."""
+        return [getattr(row, field.lstrip('-')) for field in self.ordering]
+
+    def get_position_filter(self, position: list) -> Q:
+        """
+        Returns filter that selects rows which are after given
+        position, e.g. for ordering (a, b): a > x OR (a = x AND b > y).
+        """
+        position_filter = Q()
+        equal_fields = {}
+        for field, value in zip(self.ordering, position):
+            field_name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            position_filter |= Q(**equal_fields,
+                                 **{f'{field_name}__{lookup}': value})
+            equal_fields[field_name] = value
+        return position_filter
+
+    def encode_cursor(self, position: list) -> str:
+        """Forms opaque cursor from position."""
+        data = {'ordering': list(self.ordering), 'position': position}
+        data_str = json.dumps(data, default=self.encode_value)
+        return base64.urlsafe_b64encode(data_str.encode()).decode()
+
+    def decode_cursor(self, request) -> Optional[list]:
+        """Returns position from cursor or None if cursor wasn't given."""
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            ordering, position = data['ordering'], data['position']
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if ordering != list(self.ordering) or \
+                not isinstance(position, list) or \
+                len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    @staticmethod
+    def encode_value(value: Any) -> str:
+        """Encodes values that json can't encode itself."""
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        return str(value)
@@ -0,0 +1,46 @@
+import datetime
+import decimal
+
+import orjson
+
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer which encodes data straight to json bytes by orjson.
+    Datetimes, dates, times and uuids are encoded natively.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None,
+               renderer_context=None) -> bytes:
+        """Returns data encoded to json."""
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self.encode_value,
+                            option=orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def encode_value(value):
+        """Encodes values that orjson can't encode itself."""
+        if isinstance(value, Promise):
+            return force_str(value)
+        if isinstance(value, decimal.Decimal):
+            return float(value)
+        if isinstance(value, datetime.timedelta):
+            return str(value.total_seconds())
+        if isinstance(value, QuerySet):
+            return tuple(value)
+        if isinstance(value, bytes):
+            return value.decode()
+        if hasattr(value, '__iter__'):
+            return list(value)
+        raise TypeError(f'Type {type(value).__name__} is not json serializable')
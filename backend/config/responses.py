@@ -0,0 +1,46 @@
+from typing import Callable, Iterator, Optional
+
+import orjson
+
+from django.db.models.query import QuerySet
+from django.http import StreamingHttpResponse
+
+from .renderers import ORJSONRenderer
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Response which writes rows of queryset as json array while they
+    are fetched from database by chunks. Memory of worker and time to
+    the first byte don't depend on amount of rows.
+    """
+
+    chunk_size = 2000
+
+    def __init__(self, queryset: QuerySet,
+                 get_item: Optional[Callable] = None, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(self.encode_rows(queryset, get_item), **kwargs)
+
+    @classmethod
+    def encode_rows(cls, queryset: QuerySet,
+                    get_item: Optional[Callable]) -> Iterator[bytes]:
+        """
+        Yields json array by parts, one part for chunk of rows. Opening
+        bracket and the first row are yielded at once, so client gets
+        the first byte without waiting for the whole chunk.
+        """
+        yield b'['
+        parts = []
+        separator = b''
+        for row in queryset.iterator(chunk_size=cls.chunk_size):
+            item = get_item(row) if get_item is not None else row
+            parts.append(separator)
+            parts.append(orjson.dumps(
+                item, default=ORJSONRenderer.encode_value))
+            if not separator or len(parts) >= cls.chunk_size * 2:
+                yield b''.join(parts)
+                parts = []
+            separator = b','
+        parts.append(b']')
+        yield b''.join(parts)
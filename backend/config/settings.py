@@ -117,10 +117,15 @@ AUTH_USER_MODEL = 'users.User'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES':(
         'users.authentication.TokenAndSignatureAuthentication',
+        'users.authentication.AccessTokenAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES':(
         'rest_framework.permissions.AllowAny',
     ),
+    'DEFAULT_RENDERER_CLASSES':(
+        'config.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 
@@ -138,9 +143,37 @@ DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media/')
 MEDIA_URL = '/media/'
 
+# if set media files are sent by front proxy after permission checks:
+# 'X-Accel-Redirect' for nginx or 'X-Sendfile' for apache and others.
+MEDIA_SENDFILE_HEADER = os.getenv('MEDIA_SENDFILE_HEADER')
+# internal nginx location which is alias of MEDIA_ROOT.
+MEDIA_ACCEL_REDIRECT_LOCATION = '/protected_media/'
+
 
 VIDEO_EXAMPLES_DIR = 'video_examples/'
 CHALLENGE_ANSWERS_DIR = 'challenge_answers/'
+VIDEO_UPLOADS_DIR = 'video_uploads/'
+VIDEO_BLOBS_DIR = 'videos/'
+
+# uploads of videos by chunks.
+VIDEO_UPLOAD_MAX_SIZE = 1024 * 1024 * 500
+VIDEO_UPLOAD_SESSION_LIFETIME = 60 * 60 * 24
+
+# amount of balance shards for challenges sharded from admin panel.
+CHALLENGE_BALANCE_SHARDS_AMOUNT = 16
+
+# percentage of challenge balance which isn't paid to winners.
+CHALLENGE_FEE_PERCENT = 10
+
+# users cached by authentication tokens. Process cache isn't cleared
+# by other processes, so deleted token works there during its timeout.
+AUTH_TOKEN_CACHE_TIMEOUT = 60 * 60
+AUTH_TOKEN_LOCAL_CACHE_SIZE = 1024
+AUTH_TOKEN_LOCAL_CACHE_TIMEOUT = 10
+AUTH_TOKEN_CACHE_TOMBSTONE_TIMEOUT = 10
+
+# lifetime of stateless access tokens (seconds).
+ACCESS_TOKEN_LIFETIME = 60 * 60 * 24
 
 
 REDIS_HOST = os.getenv('REDIS_HOST')
@@ -151,6 +184,16 @@ CELERY_BROKER_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
 CELERY_RESULT_BACKEND = f'redis://{REDIS_HOST}:{REDIS_PORT}/1'
 
 
+# local memory cache is used if redis isn't configured (e.g. for tests).
+if REDIS_HOST:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': f'redis://{REDIS_HOST}:{REDIS_PORT}/2',
+        }
+    }
+
+
 
 
 
@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
+
+from challenges.views import MediaView
 
 
 urlpatterns = [
@@ -10,4 +11,7 @@ urlpatterns = [
     path('challenges/', include('challenges.urls')),
 ]
 
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+urlpatterns += [
+    path(f'{settings.MEDIA_URL.lstrip("/")}<path:name>', MediaView.as_view(),
+         name='media'),
+]
@@ -2,24 +2,25 @@ import os
 import shutil
 import datetime
 
+from django.conf import settings
 from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
 
-from users.models import User, UserBalance
+from users.models import User
 from users.services.datetime_services import DatetimeEncryptionService
 from users.services.token_services import TokenService, AuthenticationTokenService
 from users.services.token_signature_services import TokenSignatureService
+from users.services.user_services import UserService
 
 from challenges.models import Challenge, ChallengeBalance, ChallengeMember, ChallengeAnswer
 from challenges.services.challenge_services import ChallengeService
 from challenges.services.challenge_answer_services import ChallengeAnswerService
+from challenges.services.challenge_member_services import ChallengeMemberService
 
 
 def registrate_user(signup_data: dict) -> User:
     """Register user"""
-    user = User.objects.create_user(**signup_data)
-    UserBalance(user=user).save()
-    return user
+    return UserService.create_user_and_his_balance(signup_data)
 
 
 def activate_user(user: User):
@@ -54,12 +55,13 @@ def create_challenge(data: dict, user: User) -> Challenge:
     """Creates challenge."""
     challenge = ChallengeService.create_challenge(data, user)
     ChallengeBalance(challenge=challenge, coins_amount=challenge.bet).save()
-    ChallengeMember(user=user, challenge=challenge).save()
+    ChallengeMemberService.add_challenge_member(user, challenge)
     return challenge
 
 def accept_challenge(user: User, challenge: Challenge) -> ChallengeMember:
     """creates challenge member."""
-    challenge_member = ChallengeMember(user=user, challenge=challenge).save()
+    challenge_member = ChallengeMemberService.add_challenge_member(
+        user, challenge)
     ChallengeService.add_coins_for_challenge(challenge, challenge.bet)
     return challenge_member
 
@@ -83,6 +85,20 @@ def clear_directory(directory: str) -> None:
         shutil.rmtree(directory)
         os.makedirs(directory)
 
+def delete_stored_videos() -> None:
+    """Deletes videos and uploads which were stored in media root by test."""
+    for directory in (settings.VIDEO_BLOBS_DIR, settings.VIDEO_UPLOADS_DIR):
+        shutil.rmtree(os.path.join(settings.MEDIA_ROOT, directory),
+                      ignore_errors=True)
+
+
+def get_files_in_directory(directory: str) -> list:
+    """Returns paths of all files in directory and its subdirectories."""
+    return [os.path.join(path, file_name)
+            for path, _, file_names in os.walk(directory)
+            for file_name in file_names]
+
+
 def add_answer_on_challenge(challenge_member: ChallengeMember, challenge: Challenge,
                             video_answer_file: '') -> ChallengeAnswer:
     challenge_answer = ChallengeAnswerService.get_challenge_answer(
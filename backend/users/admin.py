@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from .models import User, NotConfirmedEmail, UserBalance
+from .services.user_services import UserService
 
 
 @admin.register(User)
@@ -25,3 +26,14 @@ class NotConfirmedEmailAdmin(admin.ModelAdmin):
 @admin.register(UserBalance)
 class UserBalanceAdmin(admin.ModelAdmin):
     list_display = ('user', 'coins_amount',)
+
+    def save_model(self, request, obj, form, change):
+        """Changes coins amount by grant, so change is in coin ledger."""
+        if not change or 'coins_amount' not in form.changed_data:
+            return super().save_model(request, obj, form, change)
+        changed_fields = [field for field in form.changed_data
+                          if field != 'coins_amount']
+        if changed_fields:
+            obj.save(update_fields=changed_fields)
+        UserService.add_coins_for_user(
+            obj.user, obj.coins_amount - form.initial['coins_amount'])
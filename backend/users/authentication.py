@@ -1,6 +1,7 @@
 from rest_framework import authentication, exceptions
-from rest_framework.authtoken.models import Token
 
+from .services.access_token_services import AccessTokenService
+from .services.token_cache_services import TokenCacheService
 from .services.token_signature_services import TokenSignatureService
 
 
@@ -19,10 +20,52 @@ class TokenAndSignatureAuthentication(authentication.BaseAuthentication):
         if not TokenSignatureService.check_signature(token, signature):
             return None
 
-        try:
-            token_obj = Token.objects.get(key=token)
-        except Token.DoesNotExist:
+        user = TokenCacheService.get_user(token)
+        if user is None:
             raise exceptions.AuthenticationFailed('No such token')
-        user = token_obj.user
 
         return user, token
+
+
+class AccessTokenAuthentication(authentication.BaseAuthentication):
+
+    def authenticate(self, request) -> tuple:
+        """
+        Stateless user authentication by signed access token.
+        Token is checked without database, user is taken from cache.
+        """
+        access_token = request.META.get('HTTP_ACCESS_TOKEN')
+        if not access_token:
+            return None
+
+        user_id = AccessTokenService.get_user_id(access_token)
+        if user_id is None:
+            raise exceptions.AuthenticationFailed('Access token isn\'t valid')
+        user = TokenCacheService.get_user_by_id(user_id)
+        if user is None:
+            raise exceptions.AuthenticationFailed('No such user')
+
+        return user, access_token
+
+
+class OptionalAuthenticationMixin:
+    """
+    Authenticates like base class, but invalid or stale credentials
+    make user anonymous instead of failing request.
+    """
+
+    def authenticate(self, request) -> tuple:
+        try:
+            return super().authenticate(request)
+        except exceptions.AuthenticationFailed:
+            return None
+
+
+class OptionalTokenAndSignatureAuthentication(
+        OptionalAuthenticationMixin, TokenAndSignatureAuthentication):
+    pass
+
+
+class OptionalAccessTokenAuthentication(OptionalAuthenticationMixin,
+                                        AccessTokenAuthentication):
+    pass
@@ -0,0 +1,18 @@
+# Generated by Django 4.0 on 2026-10-18 08:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_userbalance_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='access_token_generation',
+            field=models.PositiveIntegerField(default=0, verbose_name='generation of user access tokens, tokens of older generations are revoked'),
+        ),
+    ]
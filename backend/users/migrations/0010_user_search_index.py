@@ -0,0 +1,67 @@
+from django.db import migrations
+
+
+POSTGRESQL_FORWARD_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    """
+    CREATE INDEX user_first_name_trgm_idx
+    ON users_user USING GIN (first_name gin_trgm_ops)
+    """,
+    """
+    CREATE INDEX user_surname_trgm_idx
+    ON users_user USING GIN (surname gin_trgm_ops)
+    """,
+]
+
+POSTGRESQL_BACKWARD_SQL = [
+    'DROP INDEX user_surname_trgm_idx',
+    'DROP INDEX user_first_name_trgm_idx',
+]
+
+SQLITE_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE users_user_fts
+    USING fts5(first_name, surname, tokenize='trigram')
+    """,
+    """
+    INSERT INTO users_user_fts(rowid, first_name, surname)
+    SELECT id, first_name, surname FROM users_user
+    """,
+]
+
+SQLITE_BACKWARD_SQL = [
+    'DROP TABLE users_user_fts',
+]
+
+
+def execute_sql_for_vendor(postgresql_sql: list, sqlite_sql: list):
+    """Returns function that executes sql of current database vendor."""
+    def execute_sql(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            statements = postgresql_sql
+        elif vendor == 'sqlite':
+            statements = sqlite_sql
+        else:
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return execute_sql
+
+
+class Migration(migrations.Migration):
+    """
+    Creates search index of users names: GIN trigram indexes for
+    postgresql and FTS5 table with trigram tokenizer for sqlite.
+    """
+
+    dependencies = [
+        ('users', '0009_user_access_token_generation'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            execute_sql_for_vendor(POSTGRESQL_FORWARD_SQL, SQLITE_FORWARD_SQL),
+            execute_sql_for_vendor(POSTGRESQL_BACKWARD_SQL, SQLITE_BACKWARD_SQL),
+        ),
+    ]
@@ -58,6 +58,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_activated = models.BooleanField(
         default=False, verbose_name='Has user activated account?')
 
+    access_token_generation = models.PositiveIntegerField(
+        default=0, verbose_name='generation of user access tokens, '
+                                'tokens of older generations are revoked')
+
     objects = UserManager()
 
     USERNAME_FIELD = 'username'
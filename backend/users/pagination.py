@@ -0,0 +1,13 @@
+from config.pagination import KeysetPagination
+
+
+class UsersListPagination(KeysetPagination):
+    """Pagination for users list. Usernames are unique, so they are keys."""
+
+    ordering = ('username',)
+
+
+class UsersSearchPagination(KeysetPagination):
+    """Pagination for users search results. Best matches go first."""
+
+    ordering = ('-rank', 'id')
@@ -60,6 +60,7 @@ class LogInSerializer(serializers.Serializer):
     """Serializer for login users."""
     username = serializers.CharField()
     password = serializers.CharField()
+    stateless = serializers.BooleanField(required=False, default=False)
 
 
 class UsersListSerializer(serializers.ModelSerializer):
@@ -69,6 +70,17 @@ class UsersListSerializer(serializers.ModelSerializer):
         fields = ('first_name', 'surname', 'username')
 
 
+class SearchUsersSerializer(serializers.Serializer):
+    """Serializer for query of users search."""
+    q = serializers.CharField(max_length=30)
+
+
+class UsersListParamsSerializer(serializers.Serializer):
+    """Serializer for query params of users list."""
+    username = serializers.CharField(required=False, max_length=30)
+    export = serializers.BooleanField(required=False, default=False)
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """Serializer for changing user password."""
     old_password = serializers.CharField(write_only=True)
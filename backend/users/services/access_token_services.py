@@ -0,0 +1,98 @@
+import hmac
+import time
+import hashlib
+
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from users.models import User
+
+
+class AccessTokenService:
+    """
+    Class which contain logic of stateless access tokens. Token contains
+    user id, generation of user tokens, issue and expiration time and
+    is signed by HMAC, so it is checked without database. Tokens of
+    user are revoked by increasing generation of his tokens.
+    """
+
+    generation_key_prefix = 'access_token_generation'
+
+    @staticmethod
+    def get_signature(payload: str) -> str:
+        """Returns HMAC of token payload."""
+        return hmac.new(settings.SECRET_KEY_BYTES,
+                        b'access_token:' + payload.encode(),
+                        hashlib.sha256).hexdigest()
+
+    @classmethod
+    def get_generation_cache_key(cls, user_id: int) -> str:
+        return f'{cls.generation_key_prefix}:{user_id}'
+
+    @classmethod
+    def get_tokens_generation(cls, user_id: int) -> Optional[int]:
+        """
+        Returns current generation of user tokens or None if user
+        doesn't exist. Generation is kept in cache and database, cache
+        is filled by add, so generation read before revoking doesn't
+        replace generation which was set by revoking.
+        """
+        cache_key = cls.get_generation_cache_key(user_id)
+        generation = cache.get(cache_key)
+        if generation is None:
+            generation = User.objects.filter(id=user_id).values_list(
+                'access_token_generation', flat=True).first()
+            if generation is None:
+                return None
+            cache.add(cache_key, generation,
+                      timeout=settings.ACCESS_TOKEN_LIFETIME)
+        return generation
+
+    @classmethod
+    def get_access_token(cls, user: User) -> tuple[str, int]:
+        """Returns new access token of user and its expiration time."""
+        issued_at = int(time.time())
+        expires_at = issued_at + settings.ACCESS_TOKEN_LIFETIME
+        generation = cls.get_tokens_generation(user.id)
+        payload = f'{user.id}.{generation}.{issued_at}.{expires_at}'
+        return f'{payload}.{cls.get_signature(payload)}', expires_at
+
+    @classmethod
+    def get_user_id(cls, access_token: str) -> Optional[int]:
+        """
+        Returns id of token owner. Returns None if token is
+        forged, expired or revoked.
+        """
+        try:
+            payload, signature = access_token.rsplit('.', 1)
+            user_id, generation, issued_at, expires_at = map(
+                int, payload.split('.'))
+        except ValueError:
+            return None
+        if not hmac.compare_digest(cls.get_signature(payload), signature):
+            return None
+        if expires_at <= time.time():
+            return None
+        if generation != cls.get_tokens_generation(user_id):
+            return None
+        return user_id
+
+    @classmethod
+    def revoke_user_tokens(cls, user: User) -> None:
+        """
+        Makes all issued access tokens of user not valid. New generation
+        is read back from database and set in cache instead of deleting,
+        so concurrent request can't cache the previous one.
+        """
+        with transaction.atomic():
+            User.objects.filter(id=user.id).update(
+                access_token_generation=F('access_token_generation') + 1)
+            generation = User.objects.filter(id=user.id).values_list(
+                'access_token_generation', flat=True).first()
+        if generation is not None:
+            cache.set(cls.get_generation_cache_key(user.id), generation,
+                      timeout=settings.ACCESS_TOKEN_LIFETIME)
@@ -0,0 +1,113 @@
+import re
+
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.query import QuerySet
+
+from users.models import User
+
+
+class UserSearchService:
+    """
+    Search of users by prefix of username and by similar first name or
+    surname. Postgresql uses GIN trigram indexes (pg_trgm, they are kept
+    in sync by database), sqlite uses FTS5 table with trigram tokenizer
+    which is filled when user is created or updated.
+    """
+
+    fts_table = 'users_user_fts'
+    # rank of users whose username starts with query, similarity
+    # of names is not bigger than 1, so these users go first.
+    username_prefix_rank = 2.0
+    # part of query trigrams which names must contain in sqlite.
+    similarity_threshold = 0.3
+
+    @classmethod
+    def index_user(cls, user: User) -> None:
+        """Adds user to search index (only sqlite needs it)."""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {cls.fts_table} WHERE rowid = %s',
+                           [user.id])
+            cursor.execute(
+                f'INSERT INTO {cls.fts_table}(rowid, first_name, surname) ' +
+                'VALUES (%s, %s, %s)',
+                [user.id, user.first_name, user.surname])
+
+    @classmethod
+    def remove_user_from_index(cls, user_id: int) -> None:
+        """Removes user from search index (only sqlite needs it)."""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {cls.fts_table} WHERE rowid = %s',
+                           [user_id])
+
+    @classmethod
+    def search(cls, queryset: QuerySet, query: str) -> QuerySet:
+        """
+        Returns users of queryset whose username starts with query or
+        whose first name or surname is similar to query. Users are
+        annotated with rank, the bigger rank the better match.
+        """
+        if connection.vendor == 'postgresql':
+            similar_filter, similarity = cls.__search_in_postgresql(query)
+        else:
+            similar_filter, similarity = cls.__search_in_sqlite(query)
+        username_prefix = Q(username__startswith=query)
+        return queryset.annotate(similarity=similarity)\
+            .filter(username_prefix | similar_filter)\
+            .annotate(rank=Case(
+                When(username_prefix, then=Value(cls.username_prefix_rank)),
+                default=F('similarity'), output_field=FloatField()))
+
+    @staticmethod
+    def __search_in_postgresql(query: str) -> tuple:
+        """Searches by trigram indexes of first name and surname."""
+        similar_ids = RawSQL(
+            'SELECT id FROM users_user ' +
+            'WHERE first_name %% %s OR surname %% %s', (query, query))
+        similarity = RawSQL(
+            'GREATEST(similarity(users_user.first_name, %s), ' +
+            'similarity(users_user.surname, %s))::float8',
+            (query, query), output_field=FloatField())
+        return Q(id__in=similar_ids), similarity
+
+    @classmethod
+    def __search_in_sqlite(cls, query: str) -> tuple:
+        """
+        Searches by FTS5 trigram table. Similarity is part of query
+        trigrams which are contained in first name or surname.
+        """
+        trigrams = [f'"{trigram}"' for trigram in cls.get_trigrams(query)]
+        if not trigrams:
+            return Q(pk__in=[]), Value(0.0, output_field=FloatField())
+        similar_ids = RawSQL(
+            f'SELECT rowid FROM {cls.fts_table} ' +
+            f'WHERE {cls.fts_table} MATCH %s', (' OR '.join(trigrams),))
+        contained_trigrams = ' + '.join(
+            [f'EXISTS(SELECT 1 FROM {cls.fts_table} ' +
+             f'WHERE {cls.fts_table} MATCH %s ' +
+             'AND rowid = users_user.id)'] * len(trigrams))
+        similarity = RawSQL(
+            f'CAST(({contained_trigrams}) AS REAL) / {len(trigrams)}',
+            trigrams, output_field=FloatField())
+        similar_filter = Q(id__in=similar_ids,
+                           similarity__gte=cls.similarity_threshold)
+        return similar_filter, similarity
+
+    @staticmethod
+    def get_trigrams(query: str) -> list:
+        """
+        Returns unique lowercase trigrams of query words. Words are
+        taken by regex, so query can't contain FTS5 syntax.
+        """
+        trigrams = []
+        for word in re.findall(r'\w+', query.lower()):
+            for start in range(len(word) - 2):
+                trigram = word[start:start + 3]
+                if trigram not in trigrams:
+                    trigrams.append(trigram)
+        return trigrams
@@ -0,0 +1,117 @@
+import hashlib
+
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework.authtoken.models import Token
+
+from config.cache import LocalLRUCache
+from users.models import User
+
+
+class TokenCacheService:
+    """
+    Class which contain logic of caching users by their authentication
+    tokens or ids. Users are looked up in process cache, then in shared cache
+    and only then in database. Snapshot of user hasn't password, last
+    login and generation of access tokens, they are loaded from database
+    if they are needed and aren't overwritten when cached user is saved.
+    """
+
+    snapshot_fields = tuple(
+        field.attname for field in User._meta.concrete_fields
+        if field.attname not in ('password', 'last_login',
+                                 'access_token_generation'))
+    # snapshots are positional, so cache keys contain version of
+    # snapshot fields and snapshots of other fields aren't read.
+    snapshot_version = hashlib.md5(
+        ','.join(snapshot_fields).encode()).hexdigest()[:8]
+    key_prefix = f'auth_token_user:{snapshot_version}'
+    user_key_prefix = f'auth_user:{snapshot_version}'
+    # deleted snapshot is replaced by tombstone for a while, so request
+    # which read user from database before deleting can't cache him.
+    tombstone = 'deleted'
+    local_cache = LocalLRUCache(settings.AUTH_TOKEN_LOCAL_CACHE_SIZE,
+                                settings.AUTH_TOKEN_LOCAL_CACHE_TIMEOUT)
+
+    @classmethod
+    def get_cache_key(cls, token: str) -> str:
+        return f'{cls.key_prefix}:{token}'
+
+    @classmethod
+    def get_user_cache_key(cls, user_id: int) -> str:
+        return f'{cls.user_key_prefix}:{user_id}'
+
+    @classmethod
+    def get_snapshot(cls, user: User) -> tuple:
+        """Returns values of user fields which are cached."""
+        return tuple(getattr(user, field) for field in cls.snapshot_fields)
+
+    @classmethod
+    def get_user_from_snapshot(cls, snapshot: tuple) -> User:
+        """Returns user made from snapshot as if it was got from database."""
+        return User.from_db('default', cls.snapshot_fields, snapshot)
+
+    @classmethod
+    def _get_cached_user(cls, local_key: str, cache_key: str,
+                         get_user_from_db: Callable) -> Optional[User]:
+        """
+        Returns user from process cache, shared cache or database.
+        Returns None if there isn't such user in database. User isn't
+        cached while there is tombstone and doesn't replace other value.
+        """
+        snapshot = cls.local_cache.get(local_key)
+        if snapshot is None:
+            snapshot = cache.get(cache_key)
+            if snapshot is None or snapshot == cls.tombstone:
+                is_deleted = snapshot is not None
+                user = get_user_from_db()
+                if user is None:
+                    return None
+                snapshot = cls.get_snapshot(user)
+                if is_deleted or not cache.add(
+                        cache_key, snapshot,
+                        timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT):
+                    return cls.get_user_from_snapshot(snapshot)
+            cls.local_cache.set(local_key, snapshot)
+        return cls.get_user_from_snapshot(snapshot)
+
+    @classmethod
+    def get_user(cls, token: str) -> Optional[User]:
+        """Returns owner of token or None if token doesn't exist."""
+        def get_user_from_db() -> Optional[User]:
+            token_obj = Token.objects.select_related('user')\
+                .filter(key=token).first()
+            return token_obj.user if token_obj else None
+        return cls._get_cached_user(token, cls.get_cache_key(token),
+                                    get_user_from_db)
+
+    @classmethod
+    def get_user_by_id(cls, user_id: int) -> Optional[User]:
+        """Returns user by id or None if user doesn't exist."""
+        return cls._get_cached_user(
+            f'user:{user_id}', cls.get_user_cache_key(user_id),
+            lambda: User.objects.filter(id=user_id).first())
+
+    @classmethod
+    def _delete_cached_user(cls, local_key: str, cache_key: str) -> None:
+        """Deletes cached user and puts tombstone instead of him."""
+        cls.local_cache.delete(local_key)
+        cache.set(cache_key, cls.tombstone,
+                  timeout=settings.AUTH_TOKEN_CACHE_TOMBSTONE_TIMEOUT)
+
+    @classmethod
+    def delete_token(cls, token: str) -> None:
+        """Deletes cached owner of token."""
+        cls._delete_cached_user(token, cls.get_cache_key(token))
+
+    @classmethod
+    def delete_user(cls, user: User) -> None:
+        """Deletes cached user, so changed user is cached again."""
+        cls._delete_cached_user(f'user:{user.id}',
+                                cls.get_user_cache_key(user.id))
+        for token in Token.objects.filter(user=user)\
+                .values_list('key', flat=True):
+            cls.delete_token(token)
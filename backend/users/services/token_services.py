@@ -9,6 +9,7 @@ from rest_framework.authtoken.models import Token
 
 from users.models import User
 
+from .access_token_services import AccessTokenService
 from .datetime_services import DatetimeEncryptionService
 
 
@@ -56,8 +57,12 @@ class AuthenticationTokenService:
 
     @classmethod
     def delete_user_authentication_token(cls, user: User) -> None:
-        """Delete user authentication token."""
-        Token.objects.get(user=user).delete()
+        """
+        Delete user authentication token and revoke
+        his stateless access tokens.
+        """
+        Token.objects.filter(user=user).delete()
+        AccessTokenService.revoke_user_tokens(user)
 
 
 class EmailConfirmationTokenService:
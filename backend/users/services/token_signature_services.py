@@ -1,3 +1,4 @@
+import hmac
 import hashlib
 
 from django.conf import settings
@@ -16,4 +17,4 @@ class TokenSignatureService:
     @classmethod
     def check_signature(cls, token: str, given_signature: str) -> bool:
         """Checks that given signature is correct."""
-        return cls.get_signature(token) == given_signature
+        return hmac.compare_digest(cls.get_signature(token), given_signature)
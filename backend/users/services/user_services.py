@@ -1,4 +1,13 @@
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.query import QuerySet
+
 from users.models import User, UserBalance
+from users.signals import coins_added
+
+from .search_services import UserSearchService
 
 
 class UserService:
@@ -9,6 +18,7 @@ class UserService:
         """Creates user and create his balance."""
         user = User.objects.create_user(**data)
         UserBalance(user=user).save()
+        UserSearchService.index_user(user)
         return user
 
     @staticmethod
@@ -37,8 +47,32 @@ class UserService:
         user.training_experience = data['training_experience']
         user.trains_now = data['trains_now']
         user.save()
+        UserSearchService.index_user(user)
         return user
 
+    @staticmethod
+    def get_users(username_prefix: Optional[str] = None) -> QuerySet:
+        """
+        Returns rows with first name, surname and username of users.
+        If prefix is given only users whose username starts with it.
+        """
+        queryset = User.objects.all()
+        if username_prefix:
+            queryset = queryset.filter(username__startswith=username_prefix)
+        return queryset.values_list('first_name', 'surname', 'username',
+                                    named=True)
+
+    @staticmethod
+    def search_users(query: str) -> QuerySet:
+        """
+        Returns rows with first name, surname, username and rank
+        of users whose username starts with query or whose first
+        name or surname is similar to query.
+        """
+        return UserSearchService.search(User.objects.all(), query)\
+            .values_list('first_name', 'surname', 'username', 'rank', 'id',
+                         named=True)
+
     @staticmethod
     def has_user_enough_coins(user: User, required_coins_amount: int) -> bool:
         """Has user more or equal coins amount than was given"""
@@ -46,12 +80,20 @@ class UserService:
 
     @staticmethod
     def add_coins_for_user(user: User, coins_amount: int) -> None:
-        """Add coins to user balance"""
-        user.balance.coins_amount += coins_amount
-        user.balance.save()
+        """Add coins to user balance and sends coins_added signal."""
+        with transaction.atomic():
+            UserBalance.objects.filter(user=user).update(
+                coins_amount=F('coins_amount') + coins_amount)
+            coins_added.send(sender=UserBalance, user=user,
+                             coins_amount=coins_amount)
 
     @staticmethod
-    def withdraw_coins_from_user(user: User, coins_amount: int) -> None:
-        """withdraw coins from user balance."""
-        user.balance.coins_amount -= coins_amount
-        user.balance.save()
+    def withdraw_coins_from_user(user: User, coins_amount: int) -> bool:
+        """
+        Withdraws coins from user balance by one conditional update.
+        Returns False if user hasn't enough coins.
+        """
+        updated_rows = UserBalance.objects.filter(
+            user=user, coins_amount__gte=coins_amount).update(
+            coins_amount=F('coins_amount') - coins_amount)
+        return updated_rows == 1
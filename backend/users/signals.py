@@ -0,0 +1,42 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from rest_framework.authtoken.models import Token
+
+from .models import User
+from .services.search_services import UserSearchService
+from .services.token_cache_services import TokenCacheService
+
+
+# sent in transaction of changing balance with user and coins_amount,
+# so other apps can record change (challenges records it in coin ledger).
+coins_added = Signal()
+
+
+@receiver(post_delete, sender=Token)
+def delete_cached_token(sender, instance: Token, **kwargs) -> None:
+    """
+    Deletes cached owner of deleted token (logout, changing
+    password or deleting user), so token stops working.
+    """
+    TokenCacheService.delete_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+def delete_cached_user(sender, instance: User, created: bool,
+                       **kwargs) -> None:
+    """Deletes cached snapshot of changed user."""
+    if not created:
+        TokenCacheService.delete_user(instance)
+
+
+@receiver(post_delete, sender=User)
+def delete_cached_deleted_user(sender, instance: User, **kwargs) -> None:
+    """Deletes cached snapshot of deleted user."""
+    TokenCacheService.delete_user(instance)
+
+
+@receiver(post_delete, sender=User)
+def remove_user_from_search_index(sender, instance: User, **kwargs) -> None:
+    """Removes deleted user from search index."""
+    UserSearchService.remove_user_from_index(instance.id)
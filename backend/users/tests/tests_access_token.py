@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.urls import reverse
+from django.core.cache import cache
+from django.test import override_settings
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from users.models import User
+from users.authentication import AccessTokenAuthentication
+from users.services.access_token_services import AccessTokenService
+from users.services.token_cache_services import TokenCacheService
+from services_for_tests.for_tests import registrate_and_activate_user
+from services_for_tests.data_for_tests import signup_data, login_data
+
+
+class AccessTokenAPITests(APITestCase):
+    """Class for testing stateless access tokens."""
+
+    login_url = reverse('users:login')
+    logout_url = reverse('users:logout')
+
+    def setUp(self):
+        """Registrate, activate user and log him in by access token."""
+        cache.clear()
+        self.user = registrate_and_activate_user(signup_data)
+        data = login_data.copy()
+        data['stateless'] = True
+        response = self.client.post(self.login_url, data, format='json')
+        self.access_token = response.data['access_token']
+        self.client.credentials(HTTP_ACCESS_TOKEN=self.access_token)
+
+    def test_login_with_access_token(self):
+        response = self.client.post(self.login_url, login_data, format='json')
+
+        self.assertEqual(AccessTokenService.get_user_id(self.access_token),
+                         self.user.id)
+        self.assertEqual('token' in response.data, True)
+
+    def test_authenticate_by_access_token_without_database(self):
+        """Tests that cached user is authenticated without queries."""
+        # tombstone of user activated in setUp isn't expired yet.
+        cache.delete(TokenCacheService.get_user_cache_key(self.user.id))
+        request = mock.Mock(META={'HTTP_ACCESS_TOKEN': self.access_token})
+        authentication = AccessTokenAuthentication()
+        authentication.authenticate(request)
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate(request)
+
+        self.assertEqual(user.id, self.user.id)
+
+    def test_access_token_does_not_work_after_logout(self):
+        response = self.client.get(self.logout_url)
+        response2 = self.client.get(self.logout_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(User.objects.get().access_token_generation, 1)
+
+    def test_revoking_sets_cached_generation(self):
+        """
+        Tests that generation read before revoking
+        doesn't replace generation set by revoking.
+        """
+        AccessTokenService.revoke_user_tokens(self.user)
+        cache_key = AccessTokenService.get_generation_cache_key(self.user.id)
+        cache.add(cache_key, 0)
+
+        self.assertEqual(cache.get(cache_key), 1)
+        self.assertEqual(AccessTokenService.get_user_id(self.access_token),
+                         None)
+
+    def test_forged_access_token(self):
+        payload, signature = self.access_token.rsplit('.', 1)
+        forged_payload = f'{self.user.id + 1}.' + payload.split('.', 1)[1]
+        for access_token in (f'{forged_payload}.{signature}', 'not_a_token'):
+            self.client.credentials(HTTP_ACCESS_TOKEN=access_token)
+            response = self.client.get(self.logout_url)
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(ACCESS_TOKEN_LIFETIME=-1)
+    def test_expired_access_token(self):
+        access_token = AccessTokenService.get_access_token(self.user)[0]
+
+        self.assertEqual(AccessTokenService.get_user_id(access_token), None)
@@ -0,0 +1,111 @@
+from django.urls import reverse
+from django.core.cache import cache
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from config.cache import LocalLRUCache
+from users.models import User
+from users.services.token_cache_services import TokenCacheService
+from services_for_tests.for_tests import registrate_and_activate_user, get_auth_headers, set_auth_headers
+from services_for_tests.data_for_tests import signup_data, login_data
+
+
+class AuthenticationCacheTests(APITestCase):
+    """Class for testing authentication of users from cache."""
+
+    url = reverse('users:logout')
+
+    def setUp(self):
+        """Registrate, activate and authenticate user."""
+        self.user = registrate_and_activate_user(signup_data)
+        self.auth_headers = get_auth_headers(login_data)
+        set_auth_headers(self, self.auth_headers)
+        self.token = self.auth_headers['token']
+
+    def test_get_cached_user(self):
+        """Tests that cached user is got without queries."""
+        with self.assertNumQueries(1):
+            TokenCacheService.get_user(self.token)
+        with self.assertNumQueries(0):
+            user = TokenCacheService.get_user(self.token)
+
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(user.username, self.user.username)
+        self.assertEqual(user.check_password(login_data['password']), True)
+
+    def test_get_user_by_unexisting_token(self):
+        self.assertEqual(TokenCacheService.get_user('unexisting'), None)
+
+    def test_token_does_not_work_after_logout(self):
+        """Tests that deleted token isn't taken from cache."""
+        TokenCacheService.get_user(self.token)
+        response = self.client.get(self.url)
+        response2 = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_token_does_not_work_after_deleting_user(self):
+        TokenCacheService.get_user(self.token)
+        User.objects.get().delete()
+
+        self.assertEqual(TokenCacheService.get_user(self.token), None)
+
+    def test_changed_user_is_cached_again(self):
+        TokenCacheService.get_user(self.token)
+        self.user.first_name = 'new_name'
+        self.user.save()
+
+        user = TokenCacheService.get_user(self.token)
+
+        self.assertEqual(user.first_name, 'new_name')
+
+    def test_deleted_user_is_not_cached_by_earlier_request(self):
+        """
+        Tests that request which read user from database before
+        he was changed doesn't cache his stale snapshot.
+        """
+        cache_key = TokenCacheService.get_cache_key(self.token)
+
+        def get_user_from_db() -> User:
+            user = User.objects.get()
+            TokenCacheService.delete_user(user)
+            return user
+        TokenCacheService._get_cached_user(self.token, cache_key,
+                                           get_user_from_db)
+
+        self.assertEqual(cache.get(cache_key), TokenCacheService.tombstone)
+        with self.assertNumQueries(1):
+            user = TokenCacheService.get_user(self.token)
+        self.assertEqual(user.id, self.user.id)
+
+    def test_saving_cached_user_does_not_lose_password(self):
+        user = TokenCacheService.get_user(self.token)
+        user.surname = 'new_surname'
+        user.save()
+
+        user = User.objects.get()
+        self.assertEqual(user.surname, 'new_surname')
+        self.assertEqual(user.check_password(login_data['password']), True)
+
+
+class LocalLRUCacheTests(APITestCase):
+    """Class for testing in-process cache."""
+
+    def test_least_recently_used_item_is_evicted(self):
+        local_cache = LocalLRUCache(max_size=2, timeout=60)
+        local_cache.set('first', 1)
+        local_cache.set('second', 2)
+        local_cache.get('first')
+        local_cache.set('third', 3)
+
+        self.assertEqual(local_cache.get('first'), 1)
+        self.assertEqual(local_cache.get('second'), None)
+        self.assertEqual(local_cache.get('third'), 3)
+
+    def test_item_expires(self):
+        local_cache = LocalLRUCache(max_size=2, timeout=0)
+        local_cache.set('first', 1)
+
+        self.assertEqual(local_cache.get('first'), None)
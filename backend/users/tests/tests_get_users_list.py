@@ -1,3 +1,5 @@
+import json
+
 from django.urls import reverse
 
 from rest_framework.test import APITestCase
@@ -24,7 +26,7 @@ class UsersListAPITests(APITestCase):
         response = self.client.get(self.url)
         data = response.data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(data, [
+        self.assertEqual(data['results'], [
                                 {
                                     'first_name': 'Sasha',
                                     'surname': 'Kurkin',
@@ -50,7 +52,7 @@ class UsersListAPITests(APITestCase):
             },
         ]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, result)
+        self.assertEqual(response.data['results'], result)
 
     def test_get_user_list_for_not_auth_user(self):
         """Tests getting users list for not authenticated user"""
@@ -58,11 +60,70 @@ class UsersListAPITests(APITestCase):
         response = self.client.get(self.url,)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_get_user_list_by_pages(self):
+        """Tests that users are got by pages ordered by username."""
+        registrate_and_activate_user(signup_data2)
+
+        response = self.client.get(self.url, {'page_size': 1})
+        response2 = self.client.get(response.data['next'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data['results']],
+                         ['Lak'])
+        self.assertEqual([user['username'] for user in response2.data['results']],
+                         ['Luk'])
+        self.assertEqual(response2.data['next'], None)
+
+    def test_get_user_list_by_username_prefix(self):
+        """Tests getting users whose username starts with given prefix."""
+        registrate_and_activate_user(signup_data2)
 
+        response = self.client.get(self.url, {'username': 'La'})
 
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data['results']],
+                         ['Lak'])
 
+    def test_get_user_list_queries_amount(self):
+        """Tests that page of users is selected by one query."""
+        registrate_and_activate_user(signup_data2)
+        self.client.get(self.url)
 
+        # user is authenticated from cache.
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 2)
 
 
+class UsersExportAPITests(APITestCase):
+    """Tests exporting all users by staff."""
 
+    url = reverse('users:users_list')
+    params = {'export': 'true'}
 
+    def setUp(self):
+        """Registrate, activate and login staff user."""
+        self.user = registrate_and_activate_user(signup_data)
+        self.user.is_staff = True
+        self.user.save()
+        registrate_and_activate_user(signup_data2)
+        auth_headers = get_auth_headers(login_data)
+        set_auth_headers(self, auth_headers)
+
+    def test_export_users(self):
+        """Tests that all users are streamed as json array."""
+        response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.streaming, True)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [
+            {'first_name': 'Lexa', 'surname': 'Bubnov', 'username': 'Lak'},
+            {'first_name': 'Sasha', 'surname': 'Kurkin', 'username': 'Luk'},
+        ])
+
+    def test_export_users_for_not_staff_user(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.get(self.url, self.params)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
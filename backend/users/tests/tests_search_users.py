@@ -0,0 +1,69 @@
+from django.urls import reverse
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from users.models import User
+from users.services.user_services import UserService
+from services_for_tests.for_tests import registrate_and_activate_user, get_auth_headers, set_auth_headers
+from services_for_tests.data_for_tests import signup_data, login_data, \
+                                              signup_data2
+
+
+class SearchUsersAPITests(APITestCase):
+    """Tests searching users by username and names."""
+
+    url = reverse('users:search')
+
+    def setUp(self):
+        """Registrate users, login first user."""
+        registrate_and_activate_user(signup_data)
+        registrate_and_activate_user(signup_data2)
+        signup_data3 = signup_data2.copy()
+        signup_data3.update({'first_name': 'Aleksandr', 'surname': 'Lakin',
+                             'username': 'Alex', 'email': 'alex@bk.ru'})
+        registrate_and_activate_user(signup_data3)
+        auth_headers = get_auth_headers(login_data)
+        set_auth_headers(self, auth_headers)
+
+    def get_found_usernames(self, response) -> list:
+        return [user['username'] for user in response.data['results']]
+
+    def test_search_users_by_username_prefix(self):
+        """Tests that users whose username starts with query go first."""
+        response = self.client.get(self.url, {'q': 'Lak'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_found_usernames(response), ['Lak', 'Alex'])
+
+    def test_search_users_by_similar_name(self):
+        """Tests that users are found by names with typos."""
+        response = self.client.get(self.url, {'q': 'Kurkn'})
+        response2 = self.client.get(self.url, {'q': 'sasha'})
+
+        self.assertEqual(self.get_found_usernames(response), ['Luk'])
+        self.assertEqual(self.get_found_usernames(response2), ['Luk'])
+
+    def test_search_users_by_updated_name(self):
+        user = User.objects.get(username='Lak')
+        data = {'first_name': 'Lexa', 'surname': 'Petrov', 'username': 'Lak',
+                'age': None, 'gender': None, 'training_experience': None,
+                'trains_now': None}
+        UserService.update_user_data(user, data)
+
+        response = self.client.get(self.url, {'q': 'Petrov'})
+        response2 = self.client.get(self.url, {'q': 'Bubnov'})
+
+        self.assertEqual(self.get_found_usernames(response), ['Lak'])
+        self.assertEqual(self.get_found_usernames(response2), [])
+
+    def test_search_deleted_user(self):
+        User.objects.get(username='Luk').delete()
+        response = self.client.get(self.url, {'q': 'Kurkin'})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(UserService.search_users('Kurkin').exists(), False)
+
+    def test_search_users_without_query(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -19,6 +19,7 @@ urlpatterns = [
     path('update_user_data/', views.UpdateUserDataView.as_view(),
          name='update_user_data'),
     path('users_list/', views.UsersListView.as_view(), name='users_list'),
+    path('search/', views.SearchUsersView.as_view(), name='search'),
     path('change_user_email/', views.UserChangeEmailView.as_view(),
          name='change_user_email'),
     path('email_confirmation/<int:id>/<str:encrypted_datetime>/<str:token>/',
@@ -1,15 +1,18 @@
-import json
-
 from django.contrib.auth import authenticate
+from django.http.response import HttpResponseBase
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
+from config.responses import StreamingJSONResponse
+
 from .serializers import SignUpSerializer, LogInSerializer, \
                          UsersListSerializer, ChangePasswordSerializer, \
-                         UpdateUserDateSerializer, ChangeUserEmailSerializer
+                         UpdateUserDateSerializer, ChangeUserEmailSerializer,\
+                         UsersListParamsSerializer, SearchUsersSerializer
+from .pagination import UsersListPagination, UsersSearchPagination
 
 from .models import User, NotConfirmedEmail
 
@@ -19,6 +22,7 @@ from .services.token_services import ActivationTokenService,\
                                      EmailConfirmationTokenService
 from .services.user_services import UserService
 from .services.token_signature_services import TokenSignatureService
+from .services.access_token_services import AccessTokenService
 from .services import services
 
 from .tasks import send_email_for_activate_account,\
@@ -84,6 +88,11 @@ class LogInView(APIView):
         if not user.is_activated:
             data = {'message': 'User is not activated'}
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
+        if serializer.data['stateless']:
+            access_token, expires_at = AccessTokenService.get_access_token(
+                user)
+            data = {'access_token': access_token, 'expires_at': expires_at}
+            return Response(data=data, status=status.HTTP_200_OK)
         token = AuthenticationTokenService.get_user_authentication_token(user)
         signature = TokenSignatureService.get_signature(token)
         data = {'token': token, 'signature': signature}
@@ -150,13 +159,51 @@ class UsersListView(APIView):
     """View for getting users list."""
 
     permission_classes = [IsAuthenticated]
+    pagination_class = UsersListPagination
+
+    def get(self, request) -> HttpResponseBase:
+        """
+        Returns page of users ordered by username. Users can
+        be filtered by beginning of their username. Staff can
+        export all users as json array which is streamed by chunks.
+        """
+        params_serializer = UsersListParamsSerializer(
+            data=request.query_params.dict())
+        params_serializer.is_valid(raise_exception=True)
+        queryset = UserService.get_users(
+            params_serializer.validated_data.get('username'))
+        if params_serializer.validated_data['export']:
+            if not request.user.is_staff:
+                data = {'message': 'Only staff can export users'}
+                return Response(data=data, status=status.HTTP_403_FORBIDDEN)
+            return StreamingJSONResponse(
+                queryset.order_by('username'),
+                get_item=UsersListSerializer().to_representation)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = UsersListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class SearchUsersView(APIView):
+    """View for searching users by username and names."""
+
+    permission_classes = [IsAuthenticated]
+    pagination_class = UsersSearchPagination
 
     def get(self, request) -> Response:
-        """Returns list of users."""
-        users_queryset = User.objects.all()
-        serializer = UsersListSerializer(users_queryset, many=True)
-        users_list = json.loads(json.dumps(serializer.data))
-        return Response(data=users_list, status=status.HTTP_200_OK)
+        """
+        Returns page of users whose username starts with query
+        (they go first) or whose names are similar to query.
+        """
+        query_serializer = SearchUsersSerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        queryset = UserService.search_users(
+            query_serializer.validated_data['q'])
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = UsersListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class UserChangeEmailView(APIView):